@@ -12,8 +12,10 @@ the output. They are organized as such that a builder pre-processes the data
 without any graphics done and the reporters the takes the pre-processed data
 and make displays out of them.
 
-All relevant parts of *reading* and *reporting* are directly imported to the
-package root.
+All relevant parts of *reading* and *reporting* are directly available from
+the package root. The *reporting* parts, and with them matplotlib and scipy,
+are only imported on first use, such that reading and encoding data does
+not pay for them.
 
 Reading
 -------
@@ -21,7 +23,8 @@ Reading
 There is one generic reader that is intended to handle all use cases.
 
 fseq.SeqReader
-    Root object that coordinates reading, encoding and reporting
+    Root object that coordinates reading, encoding and reporting, of
+    single sources as well as paired-end sources read in lockstep
 
 The encoders translates and manages format detection
 
@@ -29,6 +32,34 @@ fseq.SeqEncoder
     Base class encoder
 fseq.SeqEncoderGC
     Encoder that translates Gs and Cs to 1 while A and T become 0
+fseq.SeqEncoderGCWindow
+    Encoder that translates sliding windows to their GC-content
+fseq.SeqEncoderKmer
+    Encoder that translates each position to the k-mer starting there
+fseq.SeqEncoderOneHot
+    Encoder that translates each position to one channel per base
+
+Each source read gets its timings and counts collected
+
+fseq.SeqStats
+    Per source stage timings and counters, see ``SeqReader.stats``
+
+Record headers can have fields extracted alongside the encoding
+
+fseq.SeqMetadata
+    Extractor of header fields, by default Illumina lane, tile, x and y
+
+Records can be subsampled and filtered before they are encoded
+
+fseq.SeqSampler
+    Deterministic hash-based subsampling of records
+fseq.SeqFilter
+    Filter on length, unknown bases and mean quality
+
+Long runs can be journaled so that they can be resumed
+
+fseq.SeqJournal
+    Journal of encodings and reports completed
 
 There's a general format detector, and several data-formats.
 
@@ -47,7 +78,7 @@ Reporting
 ---------
 
 There is a report builder base from which all report builders should be
-made, and two specific report builders.
+made, and several specific report builders.
 
 fseq.ReportBuilderBase
     The base class for all builders
@@ -55,8 +86,22 @@ fseq.ReportBuilderPositionAverage
     A report builder that averages data per position
 fseq.ReportBuilderFFT
     A report builder that subsamples and then does clustered FFT analysis
+fseq.ReportBuilderKmer
+    A report builder that counts k-mers per position
+fseq.ReportBuilderSpectrogram
+    A report builder that averages short-time FFT power along the reads
+fseq.ReportBuilderPeriodicity
+    A report builder that scores each read for power at given periods
+fseq.ReportBuilderSpectralFeatures
+    A report builder that tabulates spectral features of each read
+
+Builders may make small statistics of each source that are merged into
+reports on a whole run.
 
-There are two reports included and an optional base class.
+fseq.PositionStatistics
+    Mergeable per position sums and counts
+
+There are three reports included and an optional base class.
 
 fseq.ReportBase
     Base class to make constructing new reports more efficient
@@ -64,6 +109,8 @@ fseq.LinePlot
     Plots a line from the data sent to it
 fseq.HeatMap
     Plots a heat-map from the data sent to it.
+fseq.ArrayReport
+    Saves the data sent to it as an array, such as values per read
 
 Exceptions
 ----------
@@ -74,16 +121,70 @@ fseq.FormatImplementationError
     If a format is not correctly implemented 
 fseq.FormatUnknown
     If data is of unknown format
+fseq.PairMismatch
+    If the records of paired sources don't correspond
 """
 
 from fseq.reading.seq_reader import SeqReader
 
+from fseq.reading.seq_stats import SeqStats
+
+from fseq.reading.seq_metadata import SeqMetadata
+
+from fseq.reading.seq_filter import SeqFilter, SeqSampler
+
+from fseq.reading.seq_journal import SeqJournal
+
 from fseq.reading.seq_encoder import \
-    SeqEncoder, SeqEncoderGC, SeqFormatDetector, \
-    FormatError, FormatImplementationError, FormatUnknown, \
+    SeqEncoder, SeqEncoderGC, SeqEncoderGCWindow, SeqEncoderKmer, \
+    SeqEncoderOneHot, SeqFormatDetector, \
+    FormatError, FormatImplementationError, FormatUnknown, PairMismatch, \
     SeqFormat, FastaMultiline, FastaSingleline, FastQ
 
-from fseq.reporting.reports import ReportBase, LinePlot, HeatMap
+import sys as _sys
+
+_LAZY = {
+    'ReportBase': 'fseq.reporting.reports',
+    'LinePlot': 'fseq.reporting.reports',
+    'HeatMap': 'fseq.reporting.reports',
+    'ArrayReport': 'fseq.reporting.reports',
+    'ReportBuilderBase': 'fseq.reporting.report_builder',
+    'ReportBuilderPositionAverage': 'fseq.reporting.report_builder',
+    'ReportBuilderFFT': 'fseq.reporting.report_builder',
+    'ReportBuilderKmer': 'fseq.reporting.report_builder',
+    'ReportBuilderSpectrogram': 'fseq.reporting.report_builder',
+    'ReportBuilderPeriodicity': 'fseq.reporting.report_builder',
+    'ReportBuilderSpectralFeatures': 'fseq.reporting.report_builder',
+    'PositionStatistics': 'fseq.reporting.report_statistics'}
+
+
+def __getattr__(name):
+
+    if name not in _LAZY:
+        raise AttributeError(
+            "module {0!r} has no attribute {1!r}".format(__name__, name))
+
+    module = __import__(_LAZY[name], fromlist=[name])
+    value = getattr(module, name)
+    globals()[name] = value
+
+    return value
+
+
+def __dir__():
+
+    return sorted(set(globals()) | set(_LAZY))
+
+
+if _sys.version_info < (3, 7):
+
+    #Module level __getattr__ is not supported, so import all directly
+    from fseq.reporting.reports import ReportBase, LinePlot, HeatMap, \
+        ArrayReport
+
+    from fseq.reporting.report_builder import ReportBuilderBase, \
+        ReportBuilderPositionAverage, ReportBuilderFFT, ReportBuilderKmer, \
+        ReportBuilderSpectrogram, ReportBuilderPeriodicity, \
+        ReportBuilderSpectralFeatures
 
-from fseq.reporting.report_builder import ReportBuilderBase, \
-    ReportBuilderPositionAverage, ReportBuilderFFT
+    from fseq.reporting.report_statistics import PositionStatistics
@@ -0,0 +1,36 @@
+#!/usr/bin/env python
+"""Benchmarking-related modules of fseq.
+
+The bench package contains two modules: `synthetic` and `runner`.
+
+The synthetic module writes deterministic FASTA and FASTQ files with a
+controlled number of reads, read length distribution, GC-content and rate of
+undecided bases, such that the same input can be reproduced on any machine
+and for any commit.
+
+The runner module times the phases of `fseq` separately: format detection,
+plain line reading, single threaded encoding, the full `SeqReader` and each
+of the report builders.
+The outcome is a ``dict`` that can be saved as JSON and compared between
+commits.
+
+The runner module also times importing `fseq` in fresh interpreters, to
+keep reading-only use from paying for the reporting libraries.
+
+The benchmark can be run from the command line::
+
+    $ python -m fseq.bench --reads 100000 --output bench.json
+    $ python -m fseq.bench --import-time
+
+fseq.bench.SyntheticSeqs
+    Generator of synthetic sequence files
+fseq.bench.SeqBenchmark
+    Timing of the different phases of reading and reporting
+fseq.bench.compareResults
+    Relative change between two saved benchmark results
+fseq.bench.importTime
+    Time to import fseq in a fresh interpreter
+"""
+
+from fseq.bench.synthetic import SyntheticSeqs
+from fseq.bench.runner import SeqBenchmark, compareResults, importTime
@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+"""Run-script for benchmarking fseq on synthetic data"""
+
+import os
+import sys
+import json
+import shutil
+import argparse
+import tempfile
+
+from fseq.bench import SyntheticSeqs, SeqBenchmark, compareResults, \
+    importTime
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(
+        description="fSeq benchmark on synthetic FASTA/FASTQ")
+
+    parser.add_argument('--reads', type=int, default=10000,
+                        help="number of reads per file")
+    parser.add_argument('--length', type=int, default=101,
+                        help="mean read length")
+    parser.add_argument('--length-sd', dest='lengthSD', type=float,
+                        default=0.0, help="standard deviation of read length")
+    parser.add_argument('--gc', type=float, default=0.5, help="GC-content")
+    parser.add_argument('--n-rate', dest='nRate', type=float, default=0.001,
+                        help="rate of N bases")
+    parser.add_argument('--seed', type=int, default=0, help="random seed")
+    parser.add_argument('--directory', type=str, default=None,
+                        help="where to keep the synthetic files " +
+                        "(default: temporary directory removed after run)")
+    parser.add_argument('--output', type=str, default=None,
+                        help="path to save results as JSON")
+    parser.add_argument('--compare', type=str, default=None,
+                        help="path to previous results to compare with")
+
+    parser.add_argument('--import-time', dest='importTime',
+                        action='store_true',
+                        help="only time importing fseq, exits with an " +
+                        "error if it is above budget")
+
+    args = parser.parse_args()
+
+    if args.importTime:
+        res = importTime()
+        print(json.dumps(res, indent=2, sort_keys=True))
+        sys.exit(not res['withinBudget'] or bool(res['heavyModules']))
+
+    directory = args.directory or tempfile.mkdtemp(prefix="fseq-bench-")
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+
+    synthetic = SyntheticSeqs(reads=args.reads, length=args.length,
+                              lengthSD=args.lengthSD, gc=args.gc,
+                              nRate=args.nRate, seed=args.seed)
+
+    paths = [os.path.join(directory, n) for n in
+             ("synthetic.fastq", "synthetic.single.fasta",
+              "synthetic.multi.fasta")]
+
+    synthetic.writeFastq(paths[0])
+    synthetic.writeFasta(paths[1])
+    synthetic.writeFasta(paths[2], lineWidth=60)
+
+    try:
+        bench = SeqBenchmark(paths, dataWidth=args.length).run()
+    finally:
+        if args.directory is None:
+            shutil.rmtree(directory, ignore_errors=True)
+
+    if args.output:
+        bench.save(args.output, synthetic=synthetic.parameters)
+    else:
+        print(json.dumps(bench.results, indent=2, sort_keys=True))
+
+    if args.compare:
+        print(json.dumps(compareResults(args.compare, bench.results),
+                         indent=2, sort_keys=True))
@@ -0,0 +1,434 @@
+#!/usr/bin/env python
+"""Module for timing the phases of reading, encoding and reporting"""
+
+import os
+import json
+import time
+import sys
+import shutil
+import platform
+import tempfile
+import subprocess
+import numpy as np
+
+import fseq
+from fseq.reading.seq_stats import peakMemory
+
+
+def _commit():
+
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', 'HEAD'],
+            cwd=os.path.dirname(os.path.abspath(fseq.__file__)),
+            stderr=subprocess.STDOUT).decode('ascii').strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compareResults(old, new):
+    """Relative timing change per source and stage between two results.
+
+    Sources are matched on their file names so that results from runs
+    where the synthetic files were placed in different directories still
+    can be compared.
+
+    Parameters
+    ----------
+
+    old: dict or str
+        A benchmark result or path to a saved benchmark result
+
+    new: dict or str
+        A benchmark result or path to a saved benchmark result
+
+    Returns
+    -------
+
+    dict
+        Per source name a ``dict`` of stage name to the ratio between
+        the new and old timings, values below 1 being improvements.
+    """
+
+    def _load(res):
+        if isinstance(res, dict):
+            return res
+        with open(res, 'r') as fh:
+            return json.load(fh)
+
+    def _timings(source):
+        t = dict((k, v['seconds']) for k, v in source['stages'].items()
+                 if v.get('seconds'))
+        t.update(('builder:' + k, v['seconds']) for k, v in
+                 source['builders'].items() if v.get('seconds'))
+        return t
+
+    old = dict((os.path.basename(s['path']), _timings(s))
+               for s in _load(old)['sources'])
+    new = dict((os.path.basename(s['path']), _timings(s))
+               for s in _load(new)['sources'])
+
+    return dict(
+        (name, dict((stage, new[name][stage] / old[name][stage])
+                    for stage in new[name] if stage in old[name]))
+        for name in new if name in old)
+
+
+IMPORT_BUDGET = 0.5
+"""Seconds that ``import fseq; fseq.SeqReader`` should take at most"""
+
+
+def importTime(statement="import fseq; fseq.SeqReader", repeats=5,
+               budget=IMPORT_BUDGET):
+    """Times importing in fresh interpreters.
+
+    Each repeat starts a new python process, such that nothing is cached
+    in ``sys.modules``, and times the statement inside it.
+    The modules of matplotlib and scipy that the statement made load are
+    reported too, as these should only be loaded when reporting.
+
+    Parameters
+    ----------
+
+    statement: str, optional
+        The python code to time
+
+        (Default: importing fseq and accessing the reader)
+
+    repeats: int, optional
+        Number of fresh interpreters to time in
+
+        (Default: 5)
+
+    budget: float, optional
+        Seconds the fastest repeat should take at most
+
+        (Default: ``IMPORT_BUDGET``)
+
+    Returns
+    -------
+
+    dict
+        The statement, the seconds of each repeat, the fastest, the
+        budget, if within it and the heavy modules loaded
+    """
+
+    code = "\n".join((
+        "import sys, time, json",
+        "t = time.time()",
+        statement,
+        "t = time.time() - t",
+        "heavy = sorted(set(m.split('.')[0] for m in sys.modules",
+        "               if m.split('.')[0] in ('matplotlib', 'scipy')))",
+        "sys.stdout.write(json.dumps(dict(seconds=t, heavy=heavy)))"))
+
+    cwd = os.path.dirname(os.path.dirname(os.path.abspath(fseq.__file__)))
+
+    seconds = []
+    heavy = set()
+
+    for _ in range(repeats):
+        out = json.loads(subprocess.check_output(
+            [sys.executable, "-c", code], cwd=cwd).decode('ascii'))
+        seconds.append(out['seconds'])
+        heavy.update(out['heavy'])
+
+    return dict(statement=statement, seconds=seconds, best=min(seconds),
+                budget=budget, withinBudget=min(seconds) <= budget,
+                heavyModules=sorted(heavy))
+
+
+class SeqBenchmark(object):
+    """Times each phase of processing a set of sequence files.
+
+    The phases are timed separately so that a change in throughput can
+    be attributed to one part of `fseq`:
+
+    detection
+        Feeding lines to a ``SeqFormatDetector`` until format is known
+
+    reading
+        Reading all lines of the file without any processing
+
+    encoding
+        Single threaded ``SeqEncoder.parse`` of all records held in memory
+
+    reader
+        The complete ``SeqReader.next`` for the file
+
+    Then each report builder is timed separately on the output of the reader.
+
+    Attributes
+    ----------
+
+    sources
+    seqEncoder
+    reportBuilders
+    dataWidth
+    results
+
+    Examples
+    --------
+
+    >>> b = fseq.bench.SeqBenchmark("/tmp/synthetic.fastq")
+    >>> b.run().save("bench.json")
+    <fseq.bench.runner.SeqBenchmark at 0x7f2c1c0d8b50>
+    """
+
+    def __init__(self, sources, seqEncoder=None, reportBuilders=None,
+            dataWidth=101, verbose=False):
+        """
+        Parameters
+        ----------
+
+        sources: str or iterable of str
+            Path or paths to the files to benchmark
+
+        seqEncoder: fseq.SeqEncoder, optional
+            Encoder to benchmark
+
+            (Default: ``fseq.SeqEncoderGC``)
+
+        reportBuilders: fseq.ReportBuilderBase or tuple/list, optional
+            Builders to time.
+
+            (Default: The report builders that the encoder requests)
+
+        dataWidth: int, optional
+            Width of the data array
+
+            (Default: 101)
+
+        verbose: bool, optional
+            If the reader should emit status messages
+
+            (Default: ``False``)
+        """
+
+        if isinstance(sources, str):
+            sources = (sources, )
+
+        if seqEncoder is None:
+            seqEncoder = fseq.SeqEncoderGC()
+
+        if reportBuilders is None:
+            reportBuilders = tuple(r() for r in seqEncoder.requestReports)
+        elif isinstance(reportBuilders, fseq.ReportBuilderBase):
+            reportBuilders = (reportBuilders, )
+
+        self._sources = tuple(sources)
+        self._seqEncoder = seqEncoder
+        self._reportBuilders = tuple(reportBuilders)
+        self._dataWidth = int(dataWidth)
+        self._verbose = verbose
+        self._results = None
+
+    @property
+    def sources(self):
+        """The files benchmarked: tuple"""
+        return self._sources
+
+    @property
+    def seqEncoder(self):
+        """The encoder benchmarked: fseq.SeqEncoder"""
+        return self._seqEncoder
+
+    @property
+    def reportBuilders(self):
+        """The report builders benchmarked: tuple"""
+        return self._reportBuilders
+
+    @property
+    def dataWidth(self):
+        """Width of the encoded data: int"""
+        return self._dataWidth
+
+    @property
+    def results(self):
+        """The results of the latest run, ``None`` if not run: dict"""
+        return self._results
+
+    def _detect(self, path):
+
+        detector = fseq.SeqFormatDetector()
+        lines = 0
+        t = time.time()
+
+        with open(path, 'r') as fh:
+            for line in fh:
+                if not detector.detecting:
+                    break
+                detector.feed(line.rstrip("\n"))
+                lines += 1
+
+        return detector, dict(seconds=time.time() - t, lines=lines)
+
+    def _read(self, path, nBytes):
+
+        lines = 0
+        t = time.time()
+
+        with open(path, 'r') as fh:
+            while fh.readline() != '':
+                lines += 1
+
+        t = time.time() - t
+
+        return dict(seconds=t, lines=lines,
+                    MBps=self._rate(nBytes / 1e6, t))
+
+    def _encode(self, path, detector, nBytes):
+
+        E = self._seqEncoder
+        E.reset()
+        E.format = detector
+
+        itemSize = E.itemSize
+        with open(path, 'rb') as fh:
+            lines = [l.rstrip(b"\r\n") for l in fh]
+        records = [lines[i: i + itemSize] for i in
+                   range(0, len(lines) - itemSize + 1, itemSize)]
+        del lines
+
+        D = np.zeros((len(records), ) + tuple(E.itemShape(self._dataWidth)),
+                     dtype=E.dataType or np.float16)
+        batchSize = fseq.SeqReader.BATCH_SIZE
+
+        #As the reader's workers, joining the lines of each batch
+        t = time.time()
+        for i in range(0, len(records), batchSize):
+            E.parseBuffer(*(E.recordBuffer(records[i: i + batchSize]) +
+                            (D, i)))
+        t = time.time() - t
+
+        return dict(seconds=t, records=len(records),
+                    readsPerSecond=self._rate(len(records), t),
+                    MBps=self._rate(nBytes / 1e6, t))
+
+    def _reader(self, path, nBytes):
+
+        self._seqEncoder.reset()
+        reader = fseq.SeqReader(
+            seqEncoder=self._seqEncoder, dataSourcePaths=path,
+            reportBuilders=(), dataWidth=self._dataWidth,
+            verbose=self._verbose)
+
+        t = time.time()
+        D = reader.next()
+        t = time.time() - t
+
+        return D, dict(seconds=t, records=D.shape[0],
+                       readsPerSecond=self._rate(D.shape[0], t),
+                       MBps=self._rate(nBytes / 1e6, t),
+                       peakRSS=peakMemory(),
+                       stats=reader.stats[0].asDict())
+
+    def _builders(self, data):
+
+        res = {}
+        outputRoot = tempfile.mkdtemp(prefix="fseq-bench-")
+
+        try:
+            for rb in self._reportBuilders:
+
+                t = time.time()
+                try:
+                    rb.distill(data, outputRoot=outputRoot)
+                except Exception as e:
+                    res[type(rb).__name__] = dict(error=repr(e))
+                else:
+                    t = time.time() - t
+                    res[type(rb).__name__] = dict(
+                        seconds=t,
+                        readsPerSecond=self._rate(data.shape[0], t),
+                        peakRSS=peakMemory())
+        finally:
+            shutil.rmtree(outputRoot, ignore_errors=True)
+
+        return res
+
+    @staticmethod
+    def _rate(amount, seconds):
+
+        return seconds > 0 and amount / seconds or None
+
+    def _benchSource(self, path):
+
+        nBytes = os.path.getsize(path)
+        res = dict(path=path, bytes=nBytes, stages={}, builders={})
+
+        try:
+            detector, res['stages']['detection'] = self._detect(path)
+        except fseq.FormatError as e:
+            res['error'] = repr(e)
+            return res
+
+        res['format'] = detector.format
+        res['stages']['reading'] = self._read(path, nBytes)
+        res['stages']['encoding'] = self._encode(path, detector, nBytes)
+        D, res['stages']['reader'] = self._reader(path, nBytes)
+        res['records'] = D.shape[0]
+        res['builders'] = self._builders(D)
+        res['peakRSS'] = peakMemory()
+
+        return res
+
+    def run(self):
+        """Benchmarks all sources.
+
+        Returns
+        -------
+
+        fseq.bench.SeqBenchmark
+            Returns ``self``
+        """
+
+        self._results = dict(
+            meta=dict(
+                time=time.strftime("%Y-%m-%d %H:%M:%S"),
+                commit=_commit(),
+                python=platform.python_version(),
+                numpy=np.__version__,
+                platform=platform.platform(),
+                encoder=type(self._seqEncoder).__name__,
+                dataWidth=self._dataWidth,
+                workers=fseq.SeqReader.WORKERS),
+            sources=[self._benchSource(p) for p in self._sources])
+
+        return self
+
+    def save(self, path, **extra):
+        """Saves the results as JSON.
+
+        Parameters
+        ----------
+
+        path: str
+            Path to the output file
+
+        **extra:
+            Further information to store in the meta-section, such as the
+            parameters of the synthetic data.
+
+        Returns
+        -------
+
+        fseq.bench.SeqBenchmark
+            Returns ``self``
+
+        Raises
+        ------
+
+        ValueError
+            If the benchmark has not been run
+        """
+
+        if self._results is None:
+            raise ValueError("Benchmark has not been run")
+
+        self._results['meta'].update(extra)
+
+        with open(path, 'w') as fh:
+            json.dump(self._results, fh, indent=2, sort_keys=True)
+
+        return self
@@ -0,0 +1,284 @@
+#!/usr/bin/env python
+"""Module for producing deterministic synthetic sequence data"""
+
+import numpy as np
+
+
+class SyntheticSeqs(object):
+    """Generator of synthetic reads written as FASTA or FASTQ.
+
+    All randomness comes from a ``numpy.random.RandomState`` seeded with
+    ``seed`` so that the same parameters always produce byte-identical
+    files.
+
+    Attributes
+    ----------
+
+    reads
+    length
+    lengthSD
+    minLength
+    gc
+    nRate
+    seed
+
+    Examples
+    --------
+
+    >>> s = fseq.bench.SyntheticSeqs(reads=1000, length=150, gc=0.42)
+    >>> s.writeFastq("/tmp/synthetic.fastq")
+    <fseq.bench.synthetic.SyntheticSeqs at 0x7f2c1c0d8a10>
+    """
+
+    QUALITY_RANGE = (ord('#'), ord('J'))
+
+    def __init__(self, reads=10000, length=101, lengthSD=0.0, minLength=1,
+            gc=0.5, nRate=0.001, seed=0):
+        """
+        Parameters
+        ----------
+
+        reads: int, optional
+            Number of reads
+
+            (Default: 10000)
+
+        length: int, optional
+            Mean read length
+
+            (Default: 101)
+
+        lengthSD: float, optional
+            Standard deviation of the normally distributed read lengths
+
+            (Default: 0.0, all reads have the same length)
+
+        minLength: int, optional
+            Shortest read length allowed
+
+            (Default: 1)
+
+        gc: float, optional
+            Probability of a decided base being G or C
+
+            (Default: 0.5)
+
+        nRate: float, optional
+            Probability of a base being N
+
+            (Default: 0.001)
+
+        seed: int, optional
+            Seed of the random number generator
+
+            (Default: 0)
+        """
+
+        self.reads = reads
+        self.length = length
+        self.lengthSD = lengthSD
+        self.minLength = minLength
+        self.gc = gc
+        self.nRate = nRate
+        self.seed = seed
+
+    @property
+    def reads(self):
+        """Number of reads generated: int"""
+        return self._reads
+
+    @reads.setter
+    def reads(self, val):
+
+        self._reads = int(val)
+
+    @property
+    def length(self):
+        """Mean read length: int"""
+        return self._length
+
+    @length.setter
+    def length(self, val):
+
+        self._length = int(val)
+
+    @property
+    def lengthSD(self):
+        """Standard deviation of read lengths: float"""
+        return self._lengthSD
+
+    @lengthSD.setter
+    def lengthSD(self, val):
+
+        self._lengthSD = float(val)
+
+    @property
+    def minLength(self):
+        """Shortest allowed read: int"""
+        return self._minLength
+
+    @minLength.setter
+    def minLength(self, val):
+
+        self._minLength = max(1, int(val))
+
+    @property
+    def gc(self):
+        """GC-content of decided bases: float"""
+        return self._gc
+
+    @gc.setter
+    def gc(self, val):
+
+        val = float(val)
+        if not 0 <= val <= 1:
+            raise ValueError("GC-content {0} not in [0, 1]".format(val))
+        self._gc = val
+
+    @property
+    def nRate(self):
+        """Rate of undecided bases: float"""
+        return self._nRate
+
+    @nRate.setter
+    def nRate(self, val):
+
+        val = float(val)
+        if not 0 <= val <= 1:
+            raise ValueError("N-rate {0} not in [0, 1]".format(val))
+        self._nRate = val
+
+    @property
+    def seed(self):
+        """Seed of the random number generator: int"""
+        return self._seed
+
+    @seed.setter
+    def seed(self, val):
+
+        self._seed = int(val)
+
+    @property
+    def parameters(self):
+        """The settings of the generator: dict"""
+
+        return dict(reads=self.reads, length=self.length,
+                    lengthSD=self.lengthSD, minLength=self.minLength,
+                    gc=self.gc, nRate=self.nRate, seed=self.seed)
+
+    def _lengths(self, rs):
+
+        if self._lengthSD > 0:
+            lengths = np.round(rs.normal(self._length, self._lengthSD,
+                                         size=self._reads)).astype(np.int64)
+        else:
+            lengths = np.ones(self._reads, dtype=np.int64) * self._length
+
+        return np.clip(lengths, self._minLength, None)
+
+    def _bases(self, rs, n):
+
+        u = rs.random_sample(n)
+        strand = rs.randint(0, 2, size=n)
+        bases = np.where(u < self._gc, np.where(strand, ord('G'), ord('C')),
+                         np.where(strand, ord('A'), ord('T')))
+        bases[rs.random_sample(n) < self._nRate] = ord('N')
+        return bases.astype(np.uint8)
+
+    def _quality(self, rs, n):
+
+        low, high = self.QUALITY_RANGE
+        return rs.randint(low, high + 1, size=n).astype(np.uint8)
+
+    def records(self, quality=False):
+        """Generates the reads.
+
+        Parameters
+        ----------
+
+        quality: bool, optional
+            If quality strings should be generated too
+
+            (Default: ``False``)
+
+        Yields
+        ------
+
+        tuple
+            Read index, sequence and, if requested, quality string
+        """
+
+        rs = np.random.RandomState(self._seed)
+        lengths = self._lengths(rs)
+        bases = self._bases(rs, lengths.sum()).tobytes()
+        if quality:
+            qual = self._quality(rs, lengths.sum()).tobytes()
+
+        pos = 0
+        for i, l in enumerate(lengths):
+            seq = bases[pos: pos + l].decode('ascii')
+            if quality:
+                yield i, seq, qual[pos: pos + l].decode('ascii')
+            else:
+                yield i, seq
+            pos += l
+
+    def writeFasta(self, path, lineWidth=None):
+        """Writes reads as FASTA.
+
+        Parameters
+        ----------
+
+        path: str
+            Path to the output file
+
+        lineWidth: int, optional
+            Maximum length of sequence lines, if set sequences longer than
+            it will produce a multiline FASTA.
+
+            (Default: ``None``, single line FASTA)
+
+        Returns
+        -------
+
+        fseq.bench.SyntheticSeqs
+            Returns ``self``
+        """
+
+        with open(path, 'w') as fh:
+
+            for i, seq in self.records():
+
+                fh.write(">synthetic_{0}\n".format(i))
+
+                if lineWidth is None:
+                    fh.write(seq + "\n")
+                else:
+                    for start in range(0, len(seq), lineWidth):
+                        fh.write(seq[start: start + lineWidth] + "\n")
+
+        return self
+
+    def writeFastq(self, path):
+        """Writes reads as FASTQ.
+
+        Parameters
+        ----------
+
+        path: str
+            Path to the output file
+
+        Returns
+        -------
+
+        fseq.bench.SyntheticSeqs
+            Returns ``self``
+        """
+
+        with open(path, 'w') as fh:
+
+            for i, seq, qual in self.records(quality=True):
+
+                fh.write("@synthetic_{0}\n{1}\n+\n{2}\n".format(i, seq, qual))
+
+        return self
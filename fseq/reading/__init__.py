@@ -1,7 +1,9 @@
 #!/usr/bin/env python
 """Reading-related modules of fseq.
 
-The reading package contains of two modules: `seq_encoder` and `seq_reader`.
+The reading package contains of eight modules: `seq_encoder`, `seq_reader`,
+`seq_queue`, `seq_stats`, `seq_metadata`, `seq_filter`, `seq_journal` and
+`seq_shards`.
 
 The reader contains the generic reader that coordinates actions and works as
 the mainframe of `fseq`.
@@ -12,4 +14,14 @@ The encoder-module contains both the different types of encoders available as
 well as the format-detectors for variaous types of input formats.
 Here further formats can be added and new encoders written to extend the 
 functionality of `fseq`.
+
+The queue-module holds the bounded hand-off of records from the reader to
+its encoding workers, and the stats-module holds the timings and counts the
+reader collects for each data source.
+The metadata-module holds the optional extraction of fields from the
+headers of the records, and the filter-module the optional subsampling and
+dropping of records before they are encoded. The journal-module holds the
+journaling of progress that lets interrupted runs be resumed, and the
+shards-module the splitting of large files into byte ranges of whole
+records that can be encoded in parallel processes.
 """
@@ -1,7 +1,9 @@
 import warnings
 import time
 import re
+import numpy as np
 
+from functools import partial
 from inspect import getmro
 
 import fseq
@@ -39,9 +41,11 @@ class SeqEncoder(object):
     Attributes
     ----------
 
+    dataType
     format
     initiated
     itemSize
+    parameters
     qualityEncoding
     sequenceEncoding
     useQuality
@@ -163,6 +167,32 @@ class SeqEncoder(object):
                 self._qualityLine = None 
                 self._headerLine = None 
 
+    @property
+    def dataType(self):
+        """The data type the encoder prefers for its output, ``None`` if
+        leaving it to the reader: type"""
+
+        return None
+
+    @property
+    def parameters(self):
+        """The settings of the encoder, with which encodings are
+        journaled: dict"""
+
+        return dict(
+            encoder=type(self).__name__, useSequence=bool(self.useSequence),
+            useQuality=self.useQuality,
+            sequenceEncoding=self._encodingParameter(self.sequenceEncoding),
+            qualityEncoding=self._encodingParameter(self.qualityEncoding))
+
+    @staticmethod
+    def _encodingParameter(encoding):
+
+        if encoding is None or isinstance(encoding, dict):
+            return encoding
+
+        return repr(encoding)
+
     @property
     def requestReports(self):
         """The reports that the encoder likes to be produced by the reader"""
@@ -432,6 +462,27 @@ class SeqEncoder(object):
 
         return self
 
+    def itemShape(self, dataWidth):
+        """The shape of the encoding of one item.
+
+        The reader allocates its data array as a number of rows, each of
+        this shape.
+
+        Parameters
+        ----------
+
+        dataWidth: int
+            The maximum sequence length the reader expects
+
+        Returns
+        -------
+
+        tuple
+            By default ``(dataWidth, )``
+        """
+
+        return (dataWidth, )
+
     def parse(self, lines, out, outindex):
         """Placeholder parser overwritten when subclassing
 
@@ -459,6 +510,123 @@ class SeqEncoder(object):
 
         raise NotImplementedError("``SeqEncoder.parse`` should be overwritten")
 
+    def parseBatch(self, records, out, outindex):
+        """Encodes a batch of consecutive records.
+
+        The default implementation invokes ``SeqEncoder.parse`` for each
+        record, but subclasses may overwrite it to encode the batch as a
+        whole.
+
+        Parameters
+        ----------
+
+        records: list
+            Records, each an iterable of lines as passed to
+            ``SeqEncoder.parse``
+
+        out: numpy.ndarray
+            Array that will have values written to it
+
+        outindex: int
+            Index in ``out`` of the first record, the following records
+            are written to the consecutive indices.
+        """
+
+        for i, lines in enumerate(records):
+            self.parse(lines, out, outindex + i)
+
+    def parseBuffer(self, buffer, starts, ends, out, outindex):
+        """Encodes a batch of consecutive records from their raw bytes.
+
+        This is what the ``SeqReader`` invokes, with the lines of the batch
+        as read, without line breaks, joined into one buffer, see
+        ``SeqEncoder.recordBuffer``.
+        The default implementation decodes the lines of each record and
+        invokes ``SeqEncoder.parseBatch``, such that encoders only
+        implementing ``parse`` keep working, but subclasses may overwrite
+        it to encode straight from the bytes, e.g. through
+        ``np.frombuffer(buffer, dtype=np.uint8)``.
+
+        Parameters
+        ----------
+
+        buffer: bytes
+            The lines of the records
+
+        starts: numpy.ndarray
+            Offset in ``buffer`` of each line of each record, of shape
+            ``(records, itemSize)``
+
+        ends: numpy.ndarray
+            Offset in ``buffer`` after each line of each record, of the
+            same shape as ``starts``
+
+        out: numpy.ndarray
+            Array that will have values written to it
+
+        outindex: int
+            Index in ``out`` of the first record, the following records
+            are written to the consecutive indices.
+        """
+
+        records = [[buffer[s: e].decode('latin-1') for s, e in zip(S, E)]
+                   for S, E in zip(starts.tolist(), ends.tolist())]
+
+        self.parseBatch(records, out, outindex)
+
+    @staticmethod
+    def recordBuffer(records):
+        """Joins the lines of records into one buffer.
+
+        Parameters
+        ----------
+
+        records: list
+            Records of equally many lines, each line ``bytes`` without
+            its line break
+
+        Returns
+        -------
+
+        tuple
+            The buffer and the start and end offsets of the lines, as
+            passed to ``SeqEncoder.parseBuffer``
+        """
+
+        lines = [line for lines in records for line in lines]
+        lengths = np.fromiter((len(line) for line in lines), dtype=np.intp,
+                              count=len(lines))
+        ends = np.cumsum(lengths)
+        shape = (len(records), records and len(records[0]) or 0)
+
+        return (b"".join(lines), (ends - lengths).reshape(shape),
+                ends.reshape(shape))
+
+    @staticmethod
+    def _gather(buffer, starts, ends, width):
+
+        #The positions of the first ``width`` bytes of each line, as rows
+        #and columns of the output, and the bytes themselves
+        lengths = np.clip(ends - starts, 0, width)
+        offsets = np.cumsum(lengths) - lengths
+
+        rows = np.repeat(np.arange(lengths.size), lengths)
+        cols = np.arange(rows.size) - np.repeat(offsets, lengths)
+        values = np.frombuffer(buffer, dtype=np.uint8)[
+            np.repeat(starts, lengths) + cols]
+
+        return rows, cols, values
+
+    @staticmethod
+    def _scatter(out, outindex, records, rows, cols, values):
+
+        if values.shape[0] == records * out.shape[1]:
+            #All lines filled the width, so whole rows can be written
+            out[outindex: outindex + records] = values.reshape(
+                (records, ) + out.shape[1:])
+        else:
+            out[outindex + rows, cols] = values
+
 
 class SeqEncoderGC(SeqEncoder):
     """GC Encoder, but useful for any sequence to numerical value encoding.
@@ -537,6 +705,676 @@ class SeqEncoderGC(SeqEncoder):
 
         out[outindex][:len(d)] = d[:out.shape[1]]
 
+    @SeqEncoder.sequenceEncoding.setter
+    def sequenceEncoding(self, val):
+
+        SeqEncoder.sequenceEncoding.fset(self, val)
+
+        #Characters not in the encoding are NaN in the look-up table
+        lut = np.ones(256, dtype=np.float64) * np.nan
+        for i in range(256):
+            try:
+                lut[i] = val[chr(i)]
+            except (KeyError, TypeError, ValueError):
+                continue
+
+        self._lut = lut
+
+    def parseBuffer(self, buffer, starts, ends, out, outindex):
+        """Encodes the sequence lines of a batch of records through one
+        table look-up of their bytes.
+
+        Sequences holding characters not in the encoding are handed to
+        ``SeqEncoderGC.parse``, which raises the ``KeyError``.
+
+        Parameters
+        ----------
+
+        buffer: bytes
+            The lines of the records
+
+        starts: numpy.ndarray
+            Offset in ``buffer`` of each line of each record
+
+        ends: numpy.ndarray
+            Offset in ``buffer`` after each line of each record
+
+        out: numpy.ndarray
+            Array that will have values written to it
+
+        outindex: int
+            Index in ``out`` of the first record
+        """
+
+        rows, cols, values = self._gather(
+            buffer, starts[:, self._sequenceLine],
+            ends[:, self._sequenceLine], out.shape[1])
+
+        encoded = self._lut[values]
+
+        if np.isnan(encoded).any():
+            return super(SeqEncoderGC, self).parseBuffer(
+                buffer, starts, ends, out, outindex)
+
+        self._scatter(out, outindex, starts.shape[0], rows, cols, encoded)
+
+
+class SeqEncoderGCWindow(SeqEncoderGC):
+    """Sliding window GC-content encoder for long reads and contigs.
+
+    Each output value is the mean of the ``SeqEncoderGC`` encoding over a
+    window of ``window`` bases, with windows starting every ``stride``
+    bases. The means are calculated from the cumulative sum of the
+    look-up table encoded sequence, so the cost does not depend on the
+    window size.
+
+    With the reader's ``dataWidth`` being the longest sequence expected,
+    the width of the output is reduced by the stride, see
+    ``SeqEncoderGCWindow.itemShape``. Only complete windows are encoded,
+    such that sequences shorter than the window leave their rows untouched.
+
+    Attributes
+    ----------
+
+    window
+    stride
+    """
+
+    def __init__(self, window=100, stride=50, expectedInputFormat=None,
+            sequenceEncoding=None):
+        """
+        Parameters
+        ----------
+
+        window: int, optional
+            Number of bases in each window
+
+            (Default: 100)
+
+        stride: int, optional
+            Number of bases between the starts of two windows
+
+            (Default: 50)
+
+        expectedInputFormat: SeqFormatDetector or SeqFormat, optional
+            A sequence format expected in the input.
+            (Default: Letting encoder guess format from input)
+
+        sequenceEncoding: dict or object implementing __getitem__, optional
+            (Default: As for ``SeqEncoderGC``. Lower case characters not
+            in the encoding get the value of their upper case, other
+            characters not in the encoding get 0.5)
+
+        Raises
+        ------
+
+        ValueError
+            If ``window`` or ``stride`` is less than 1
+        """
+
+        if int(window) < 1 or int(stride) < 1:
+            raise ValueError(
+                "Window ({0}) and stride ({1}) must be positive".format(
+                    window, stride))
+
+        self._window = int(window)
+        self._stride = int(stride)
+        self._lut = None
+
+        super(SeqEncoderGCWindow, self).__init__(
+            expectedInputFormat=expectedInputFormat,
+            sequenceEncoding=sequenceEncoding)
+
+    @property
+    def window(self):
+        """Number of bases in each window: int"""
+        return self._window
+
+    @property
+    def stride(self):
+        """Number of bases between window starts: int"""
+        return self._stride
+
+    @property
+    def parameters(self):
+
+        p = super(SeqEncoderGCWindow, self).parameters
+        p.update(window=self.window, stride=self.stride)
+        return p
+
+    @SeqEncoderGC.sequenceEncoding.setter
+    def sequenceEncoding(self, val):
+
+        SeqEncoderGC.sequenceEncoding.fset(self, val)
+
+        lut = np.ones(256, dtype=np.float64) * 0.5
+        for i in range(256):
+            for char in (chr(i), chr(i).upper()):
+                try:
+                    lut[i] = val[char]
+                except KeyError:
+                    continue
+                break
+
+        self._lut = lut
+
+    def itemShape(self, dataWidth):
+        """The shape of the encoding of one item.
+
+        Parameters
+        ----------
+
+        dataWidth: int
+            The maximum sequence length the reader expects
+
+        Returns
+        -------
+
+        tuple
+            Number of complete windows that fit in ``dataWidth``, but at
+            least one.
+        """
+
+        return (max(1, (dataWidth - self._window) // self._stride + 1), )
+
+    def encode(self, seq):
+        """Translates a sequence to windowed GC-content.
+
+        Parameters
+        ----------
+
+        seq: str
+            The sequence
+
+        Returns
+        -------
+
+        numpy.ndarray
+            The mean encoding of each complete window
+        """
+
+        return self._windows(
+            self._lut[np.frombuffer(seq.encode('ascii'), dtype=np.uint8)])
+
+    def _windows(self, v):
+
+        if v.size < self._window:
+            return v[:0]
+
+        cs = np.zeros(v.size + 1, dtype=np.float64)
+        np.cumsum(v, out=cs[1:])
+        starts = np.arange(0, v.size - self._window + 1, self._stride)
+
+        return (cs[starts + self._window] - cs[starts]) / self._window
+
+    def parse(self, lines, out, outindex):
+        """Encoder of the windowed GC-content of the sequence line of
+        ``lines`` into ``out``.
+
+        As for ``SeqEncoderGC.parse``, a short sequence leaves the remainder
+        of ``out[outindex]`` untouched and a long sequence is truncated.
+
+        Parameters
+        ----------
+
+        lines: iterable of str
+            Iterable of length equal to ``self.itemSize`` containing the
+            raw data for one item
+
+        out: numpy.ndarray
+            Array that will have values written to it
+
+        outIndex: object
+            Index for where the parse output should be written in the ``out``
+            array such that ``out[outIndex]`` gives a sufficiently large array
+            that the result of parsing will fit in it.
+        """
+
+        row = out[outindex]
+        seq = lines[self._sequenceLine][
+            :(row.shape[0] - 1) * self._stride + self._window]
+        d = self.encode(seq)
+
+        row[:d.size] = d
+
+    def parseBuffer(self, buffer, starts, ends, out, outindex):
+        """Encodes the windowed GC-content of the sequence lines of a batch
+        of records straight from their bytes.
+
+        Parameters
+        ----------
+
+        buffer: bytes
+            The lines of the records
+
+        starts: numpy.ndarray
+            Offset in ``buffer`` of each line of each record
+
+        ends: numpy.ndarray
+            Offset in ``buffer`` after each line of each record
+
+        out: numpy.ndarray
+            Array that will have values written to it
+
+        outindex: int
+            Index in ``out`` of the first record
+        """
+
+        data = np.frombuffer(buffer, dtype=np.uint8)
+        span = (out.shape[1] - 1) * self._stride + self._window
+
+        for i, (start, end) in enumerate(zip(
+                starts[:, self._sequenceLine].tolist(),
+                ends[:, self._sequenceLine].tolist())):
+
+            d = self._windows(self._lut[data[start: min(end, start + span)]])
+            out[outindex + i, :d.size] = d
+
+
+class SeqEncoderKmer(SeqEncoder):
+    """Encodes each position as the k-mer starting there.
+
+    Bases are translated to 2-bit codes (A: 0, C: 1, G: 2, T: 3) through
+    a look-up table and the k-mer codes are computed for the whole
+    sequence at once as base-4 numbers, such that with ``k=2`` e.g.
+    ``CG`` gets code ``1 * 4 + 2 = 6``.
+
+    The value written is the k-mer code plus one, so that ``0`` is left
+    for positions without a k-mer: the last ``k - 1`` positions of each
+    read, positions past the end of the read and k-mers containing any
+    base other than A, C, G or T.
+
+    **Note:** The reader's default ``float16`` represents integers exactly
+    only up to 2048, which covers ``k <= 5``. For longer k-mers the
+    encoder asks for ``float32``, exact up to ``4 ** MAX_K``.
+
+    The encoder requests a ``fseq.ReportBuilderKmer`` of its k if that
+    builder can count k-mers that long.
+
+    Attributes
+    ----------
+
+    dataType
+    k
+    kmers
+    MAX_K
+    """
+
+    MAX_K = 12
+    FLOAT16_MAX_CODE = 2048
+
+    def __init__(self, k=2, expectedInputFormat=None):
+        """
+        Parameters
+        ----------
+
+        k: int, optional
+            Length of the k-mers
+
+            (Default: 2, dinucleotides)
+
+        expectedInputFormat: SeqFormatDetector or SeqFormat, optional
+            A sequence format expected in the input.
+            (Default: Letting encoder guess format from input)
+
+        Raises
+        ------
+
+        ValueError
+            If ``k`` is not between 1 and ``SeqEncoderKmer.MAX_K``
+        """
+
+        k = int(k)
+        if not 0 < k <= self.MAX_K:
+            raise ValueError("k={0} not in [1, {1}]".format(k, self.MAX_K))
+
+        self._k = k
+
+        lut = np.ones(256, dtype=np.int64) * -1
+        for i, c in enumerate("ACGT"):
+            lut[ord(c)] = i
+            lut[ord(c.lower())] = i
+
+        self._lut = lut
+        self._weights = 4 ** np.arange(k - 1, -1, -1, dtype=np.int64)
+
+        #The frequency heatmap is only requested for k it can count
+        requestReports = k <= fseq.ReportBuilderKmer.MAX_K and \
+            (partial(fseq.ReportBuilderKmer, k=k), ) or tuple()
+
+        super(SeqEncoderKmer, self).__init__(
+            expectedInputFormat=expectedInputFormat, useSequence=True,
+            useQuality=False, sequenceEncoding=None, qualityEncoding=None,
+            requestReports=requestReports)
+
+    @property
+    def k(self):
+        """Length of the k-mers: int"""
+        return self._k
+
+    @property
+    def dataType(self):
+        """The type of the output, ``float32`` if the codes are too large
+        for the reader's default ``float16``, else ``None``: type"""
+
+        if 4 ** self._k > self.FLOAT16_MAX_CODE:
+            return np.float32
+
+        return None
+
+    @property
+    def parameters(self):
+
+        p = super(SeqEncoderKmer, self).parameters
+        p.update(k=self.k)
+        return p
+
+    @property
+    def kmers(self):
+        """The k-mers ordered by their code: tuple of str"""
+
+        kmers = ("", )
+        for _ in range(self._k):
+            kmers = tuple(p + c for p in kmers for c in "ACGT")
+
+        return kmers
+
+    def encode(self, seq):
+        """Translates a sequence to k-mer values.
+
+        Parameters
+        ----------
+
+        seq: str
+            The sequence
+
+        Returns
+        -------
+
+        numpy.ndarray
+            The k-mer code plus one for each position that starts a valid
+            k-mer, zero for the others. Length is ``len(seq)``.
+        """
+
+        codes = self._lut[np.frombuffer(seq.encode('ascii'), dtype=np.uint8)]
+        out = np.zeros(codes.size, dtype=np.int64)
+        n = codes.size - self._k + 1
+
+        if n <= 0:
+            return out
+
+        kmer = np.zeros(n, dtype=np.int64)
+        invalid = np.zeros(n, dtype=bool)
+
+        for j, w in enumerate(self._weights):
+            c = codes[j: j + n]
+            kmer += c * w
+            invalid |= c < 0
+
+        kmer += 1
+        kmer[invalid] = 0
+        out[:n] = kmer
+
+        return out
+
+    def parse(self, lines, out, outindex):
+        """Encoder of the k-mers of the sequence line of ``lines`` into
+        ``out``.
+
+        As for ``SeqEncoderGC.parse``, a short sequence leaves the remainder
+        of ``out[outindex]`` untouched and a long sequence is truncated.
+
+        Parameters
+        ----------
+
+        lines: iterable of str
+            Iterable of length equal to ``self.itemSize`` containing the
+            raw data for one item
+
+        out: numpy.ndarray
+            Array that will have values written to it
+
+        outIndex: object
+            Index for where the parse output should be written in the ``out``
+            array such that ``out[outIndex]`` gives a sufficiently large array
+            that the result of parsing will fit in it.
+        """
+
+        d = self.encode(lines[self._sequenceLine])
+        row = out[outindex]
+        n = min(d.size, row.shape[0])
+
+        row[:n] = d[:n]
+
+    def parseBuffer(self, buffer, starts, ends, out, outindex):
+        """Encodes the k-mers of the sequence lines of a batch of records
+        at once, straight from their bytes.
+
+        Parameters
+        ----------
+
+        buffer: bytes
+            The lines of the records
+
+        starts: numpy.ndarray
+            Offset in ``buffer`` of each line of each record
+
+        ends: numpy.ndarray
+            Offset in ``buffer`` after each line of each record
+
+        out: numpy.ndarray
+            Array that will have values written to it
+
+        outindex: int
+            Index in ``out`` of the first record
+        """
+
+        k = self._k
+        width = out.shape[1]
+        starts = starts[:, self._sequenceLine]
+        lengths = ends[:, self._sequenceLine] - starts
+
+        #The k-mers of the last positions need bases beyond the width
+        rows, cols, values = self._gather(
+            buffer, starts, starts + np.minimum(lengths, width + k - 1),
+            width + k - 1)
+
+        codes = np.concatenate((self._lut[values],
+                                -np.ones(k - 1, dtype=np.int64)))
+
+        n = values.size
+        kmer = np.zeros(n, dtype=np.int64)
+        invalid = cols + k > lengths[rows]
+
+        for j, w in enumerate(self._weights):
+            c = codes[j: j + n]
+            kmer += c * w
+            invalid |= c < 0
+
+        kmer += 1
+        kmer[invalid] = 0
+
+        keep = cols < width
+        self._scatter(out, outindex, starts.size, rows[keep], cols[keep],
+                      kmer[keep])
+
+
+class SeqEncoderOneHot(SeqEncoder):
+    """One-hot encoder giving one channel per base.
+
+    Each position is encoded as four channels in the order A, C, G, T,
+    where the channel of the base is 1 and the others 0. Any other
+    character, such as N, has all channels 0.
+
+    The reader allocates an ``(n, dataWidth, 4)`` array of the encoder's
+    ``dataType`` for it, such that the result can be used directly e.g.
+    as input for machine learning.
+
+    Attributes
+    ----------
+
+    dataType
+    CHANNELS
+    """
+
+    CHANNELS = "ACGT"
+
+    def __init__(self, expectedInputFormat=None, dataType=np.uint8):
+        """
+        Parameters
+        ----------
+
+        expectedInputFormat: SeqFormatDetector or SeqFormat, optional
+            A sequence format expected in the input.
+            (Default: Letting encoder guess format from input)
+
+        dataType: type, optional
+            The type of the output, e.g. ``np.uint8`` or ``np.bool_``
+
+            (Default: ``np.uint8``)
+        """
+
+        self._dataType = dataType
+
+        lut = np.zeros((256, len(self.CHANNELS)), dtype=dataType)
+        for i, c in enumerate(self.CHANNELS):
+            lut[ord(c), i] = 1
+            lut[ord(c.lower()), i] = 1
+
+        self._lut = lut
+
+        super(SeqEncoderOneHot, self).__init__(
+            expectedInputFormat=expectedInputFormat, useSequence=True,
+            useQuality=False, sequenceEncoding=None, qualityEncoding=None,
+            requestReports=tuple())
+
+    @property
+    def dataType(self):
+        """The type of the one-hot output: type"""
+
+        return self._dataType
+
+    def itemShape(self, dataWidth):
+        """The shape of the encoding of one item.
+
+        Parameters
+        ----------
+
+        dataWidth: int
+            The maximum sequence length the reader expects
+
+        Returns
+        -------
+
+        tuple
+            ``(dataWidth, 4)``
+        """
+
+        return (dataWidth, len(self.CHANNELS))
+
+    def encode(self, seq):
+        """Translates a sequence to its one-hot encoding.
+
+        Parameters
+        ----------
+
+        seq: str
+            The sequence
+
+        Returns
+        -------
+
+        numpy.ndarray
+            Array of shape ``(len(seq), 4)``
+        """
+
+        return self._lut[np.frombuffer(seq.encode('ascii'), dtype=np.uint8)]
+
+    def parse(self, lines, out, outindex):
+        """Encoder of the sequence line of ``lines`` into ``out``.
+
+        As for ``SeqEncoderGC.parse``, a short sequence leaves the remainder
+        of ``out[outindex]`` untouched and a long sequence is truncated.
+
+        Parameters
+        ----------
+
+        lines: iterable of str
+            Iterable of length equal to ``self.itemSize`` containing the
+            raw data for one item
+
+        out: numpy.ndarray
+            Array that will have values written to it
+
+        outIndex: object
+            Index for where the parse output should be written in the ``out``
+            array such that ``out[outIndex]`` gives a sufficiently large array
+            that the result of parsing will fit in it.
+        """
+
+        row = out[outindex]
+        seq = lines[self._sequenceLine][:row.shape[0]]
+
+        row[:len(seq)] = self.encode(seq)
+
+    def parseBatch(self, records, out, outindex):
+        """Encodes a batch of consecutive records with one table look-up.
+
+        Parameters
+        ----------
+
+        records: list
+            Records, each an iterable of lines as passed to
+            ``SeqEncoder.parse``
+
+        out: numpy.ndarray
+            Array that will have values written to it
+
+        outindex: int
+            Index in ``out`` of the first record, the following records
+            are written to the consecutive indices.
+        """
+
+        width = out.shape[1]
+        seqs = [lines[self._sequenceLine][:width] for lines in records]
+        encoded = self.encode("".join(seqs))
+
+        pos = 0
+        for i, seq in enumerate(seqs):
+            n = len(seq)
+            out[outindex + i, :n] = encoded[pos: pos + n]
+            pos += n
+
+    def parseBuffer(self, buffer, starts, ends, out, outindex):
+        """Encodes the sequence lines of a batch of records through one
+        table look-up of their bytes.
+
+        Parameters
+        ----------
+
+        buffer: bytes
+            The lines of the records
+
+        starts: numpy.ndarray
+            Offset in ``buffer`` of each line of each record
+
+        ends: numpy.ndarray
+            Offset in ``buffer`` after each line of each record
+
+        out: numpy.ndarray
+            Array that will have values written to it
+
+        outindex: int
+            Index in ``out`` of the first record
+        """
+
+        rows, cols, values = self._gather(
+            buffer, starts[:, self._sequenceLine],
+            ends[:, self._sequenceLine], out.shape[1])
+
+        self._scatter(out, outindex, starts.shape[0], rows, cols,
+                      self._lut[values])
+
 #####################################################################
 #
 # FORMATTERS
@@ -565,6 +1403,12 @@ class FormatUnknown(FormatError):
     pass
 
 
+class PairMismatch(FormatError):
+    """Error for paired sources whose records don't correspond, either by
+    identifiers or by number of records"""
+    pass
+
+
 class SeqFormat(object):
     """Base Class for implementing data format detectors.
 
@@ -0,0 +1,448 @@
+#!/usr/bin/env python
+"""Module for filtering and subsampling records before they are encoded"""
+
+import zlib
+import numpy as np
+
+
+class SeqFilter(object):
+    """Filters records in batches before they are encoded.
+
+    The ``SeqReader`` evaluates the filter on each batch of records before
+    they are assigned rows in the data array, such that only the records
+    passing all predicates are encoded and the result needs no compaction.
+
+    The included predicates, evaluated with numpy on the batch as a whole,
+    are:
+
+    length
+        Sequences shorter than ``minLength`` fail
+
+    N
+        Sequences with more than ``maxN`` or more than ``maxNFraction`` of
+        their length as unknown bases (N) fail
+
+    quality
+        Records with mean quality below ``minMeanQuality`` fail, requires
+        the data to have quality information
+
+    Further predicates can be added with ``SeqFilter.addPredicate``.
+
+    Attributes
+    ----------
+
+    names
+    usesQuality
+    parameters
+    minLength
+    maxN
+    maxNFraction
+    minMeanQuality
+    qualityOffset
+
+    Examples
+    --------
+
+    Dropping reads with more than 5% Ns or a mean Phred quality below 20:
+
+    >>> seqReader = fseq.SeqReader(
+    ...     seqFilter=fseq.SeqFilter(maxNFraction=0.05, minMeanQuality=20))
+
+    The counts of records failing each predicate are then found in
+    ``seqReader.stats[-1].filterCounts``.
+    """
+
+    def __init__(self, minLength=None, maxN=None, maxNFraction=None,
+                 minMeanQuality=None, qualityOffset=33):
+        """
+        Parameters
+        ----------
+
+        minLength: int, optional
+            Minimum sequence length
+
+        maxN: int, optional
+            Maximum number of unknown bases
+
+        maxNFraction: float, optional
+            Maximum fraction of unknown bases
+
+        minMeanQuality: float, optional
+            Minimum mean quality score
+
+        qualityOffset: int, optional
+            The value of the character of quality score zero
+
+            (Default: 33, as in Sanger and Illumina 1.8+)
+
+        All predicates default to not being used.
+        """
+
+        self.minLength = minLength
+        self.maxN = maxN
+        self.maxNFraction = maxNFraction
+        self.minMeanQuality = minMeanQuality
+        self.qualityOffset = qualityOffset
+
+        self._predicates = []
+
+    @property
+    def names(self):
+        """The names of the predicates in use: tuple"""
+
+        names = []
+
+        if self.minLength is not None:
+            names.append('length')
+        if self.maxN is not None or self.maxNFraction is not None:
+            names.append('N')
+        if self.minMeanQuality is not None:
+            names.append('quality')
+
+        return tuple(names) + tuple(name for name, _ in self._predicates)
+
+    @property
+    def usesQuality(self):
+        """If the predicates in use require quality information: bool"""
+
+        return self.minMeanQuality is not None
+
+    @property
+    def parameters(self):
+        """The settings of the filter, where added predicates are only
+        known by their names: dict"""
+
+        return dict(
+            minLength=self.minLength, maxN=self.maxN,
+            maxNFraction=self.maxNFraction,
+            minMeanQuality=self.minMeanQuality,
+            qualityOffset=self.qualityOffset, names=list(self.names))
+
+    def addPredicate(self, name, predicate):
+        """Adds a further predicate.
+
+        Parameters
+        ----------
+
+        name: str
+            Name under which failures are counted
+
+        predicate: function
+            Invoked with a list of sequences and a list of qualities, or
+            ``None`` if the format has no quality information, returning
+            a boolean array of which records pass
+
+        Returns
+        -------
+
+        fseq.SeqFilter
+            Returns ``self``
+
+        Raises
+        ------
+
+        ValueError
+            If a predicate with that name already is used
+        """
+
+        if name in self.names:
+            raise ValueError("Predicate {0} already used".format(name))
+
+        self._predicates.append((name, predicate))
+
+        return self
+
+    @staticmethod
+    def _concatenate(strings):
+
+        lengths = np.fromiter((len(s) for s in strings), dtype=np.intp,
+                              count=len(strings))
+        ends = np.cumsum(lengths)
+
+        if strings and isinstance(strings[0], bytes):
+            joined = b"".join(strings)
+        else:
+            joined = "".join(strings).encode('latin-1')
+
+        data = np.frombuffer(joined, dtype=np.uint8)
+
+        return data, ends - lengths, ends, lengths
+
+    @staticmethod
+    def _segmentSums(values, starts, ends):
+
+        cumulative = np.zeros((values.size + 1, ), dtype=np.int64)
+        np.cumsum(values, out=cumulative[1:])
+
+        return cumulative[ends] - cumulative[starts]
+
+    def evaluate(self, sequences, qualities=None):
+        """Evaluates the predicates on a batch of records.
+
+        Parameters
+        ----------
+
+        sequences: list of str or bytes
+            The sequences of the records
+
+        qualities: list of str or bytes, optional
+            The qualities of the records
+
+        Returns
+        -------
+
+        tuple
+            A boolean array of which records passed all predicates and a
+            ``dict`` of how many records failed each predicate
+
+        Raises
+        ------
+
+        ValueError
+            If quality is needed but not supplied
+        """
+
+        keep = np.ones((len(sequences), ), dtype=bool)
+        failed = {}
+
+        def apply(name, passed):
+
+            failed[name] = int(len(passed) - np.count_nonzero(passed))
+            keep[...] &= passed
+
+        data, starts, ends, lengths = self._concatenate(sequences)
+
+        if self.minLength is not None:
+            apply('length', lengths >= self.minLength)
+
+        if self.maxN is not None or self.maxNFraction is not None:
+
+            nN = self._segmentSums((data == ord('N')) | (data == ord('n')),
+                                   starts, ends)
+
+            passed = np.ones_like(keep)
+            if self.maxN is not None:
+                passed &= nN <= self.maxN
+            if self.maxNFraction is not None:
+                passed &= nN <= self.maxNFraction * lengths
+
+            apply('N', passed)
+
+        if self.minMeanQuality is not None:
+
+            if qualities is None:
+                raise ValueError("Quality filtering requires qualities")
+
+            data, starts, ends, lengths = self._concatenate(qualities)
+            sums = self._segmentSums(
+                data.astype(np.int64) - self.qualityOffset, starts, ends)
+
+            apply('quality', (sums >= self.minMeanQuality * lengths) &
+                  (lengths > 0))
+
+        if self._predicates and sequences and \
+                isinstance(sequences[0], bytes) and bytes is not str:
+
+            #Predicates added get the records as str
+            sequences = [seq.decode('latin-1') for seq in sequences]
+            if qualities is not None:
+                qualities = [q.decode('latin-1') for q in qualities]
+
+        for name, predicate in self._predicates:
+            apply(name, np.asarray(predicate(sequences, qualities),
+                                   dtype=bool))
+
+        return keep, failed
+
+
+class SeqSampler(object):
+    """Deterministic subsampling of records before they are encoded.
+
+    Inclusion of each record is decided from a seeded hash of either its
+    index in the source or its name, such that the same records are
+    sampled on each run with the same seed.
+    Sampling by index or by name gives the same decisions for both mates of
+    paired sources, and sampling by name also gives the same records
+    regardless of their order in the source.
+
+    The ``SeqReader`` applies the sampler to each batch of records before
+    they are filtered or encoded, and stops reading the source once
+    ``maxReads`` records have been sampled.
+
+    Attributes
+    ----------
+
+    fraction
+    maxReads
+    stride
+    seed
+    byName
+    parameters
+
+    Examples
+    --------
+
+    A quick-look on about 2% of the reads, but never more than a million:
+
+    >>> seqReader = fseq.SeqReader(
+    ...     sampler=fseq.SeqSampler(fraction=0.02, maxReads=1000000))
+    """
+
+    def __init__(self, fraction=None, maxReads=None, stride=None, seed=0,
+                 byName=False):
+        """
+        Parameters
+        ----------
+
+        fraction: float, optional
+            The expected fraction of records sampled
+
+            (Default: all records)
+
+        maxReads: int, optional
+            The maximum number of records sampled
+
+            (Default: no limit)
+
+        stride: int, optional
+            Only every ``stride``-th record is considered for sampling
+
+            (Default: all records are considered)
+
+        seed: int, optional
+            Seed of the hash
+
+            (Default: 0)
+
+        byName: bool, optional
+            If the hash is of the name of the record, as in
+            ``SeqReader.pairId``, rather than its index
+
+            (Default: ``False``)
+
+        Raises
+        ------
+
+        ValueError
+            If ``fraction`` is not in the interval (0, 1] or ``maxReads`` or
+            ``stride`` are not positive
+        """
+
+        if fraction is not None and not 0 < fraction <= 1:
+            raise ValueError("Fraction {0} not in (0, 1]".format(fraction))
+
+        if maxReads is not None and maxReads < 1:
+            raise ValueError("Max reads {0} not positive".format(maxReads))
+
+        if stride is not None and stride < 1:
+            raise ValueError("Stride {0} not positive".format(stride))
+
+        self._fraction = fraction
+        self._maxReads = maxReads
+        self._stride = stride
+        self._seed = int(seed)
+        self._byName = bool(byName)
+
+    @property
+    def fraction(self):
+        """Expected fraction of records sampled, ``None`` if all: float"""
+        return self._fraction
+
+    @property
+    def maxReads(self):
+        """Maximum number of records sampled, ``None`` if no limit: int"""
+        return self._maxReads
+
+    @property
+    def stride(self):
+        """Distance between records considered, ``None`` if all: int"""
+        return self._stride
+
+    @property
+    def seed(self):
+        """Seed of the hash: int"""
+        return self._seed
+
+    @property
+    def byName(self):
+        """If hashing names rather than indices: bool"""
+        return self._byName
+
+    @property
+    def parameters(self):
+        """The settings of the sampler: dict"""
+
+        return dict(fraction=self.fraction, maxReads=self.maxReads,
+                    stride=self.stride, seed=self.seed, byName=self.byName)
+
+    @staticmethod
+    def _mix(x):
+
+        #SplitMix64 finalizer, overflow wraps around as intended
+        x = x + np.uint64(0x9E3779B97F4A7C15)
+        x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+
+        return x ^ (x >> np.uint64(31))
+
+    def hash(self, indices=None, names=None):
+        """Seeded hash of records mapped to the interval [0, 1).
+
+        Parameters
+        ----------
+
+        indices: array-like of int, optional
+            Indices of the records in the source, used unless ``byName``
+
+        names: list of str, optional
+            Names of the records, used if ``byName``
+
+        Returns
+        -------
+
+        numpy.ndarray
+            Values uniformly distributed in [0, 1)
+        """
+
+        if self._byName:
+            keys = np.fromiter(
+                (zlib.crc32(name.encode('latin-1')) & 0xffffffff
+                 for name in names), dtype=np.uint64, count=len(names))
+        else:
+            keys = np.asarray(indices, dtype=np.uint64)
+
+        seed = self._mix(np.array([self._seed], dtype=np.uint64))
+
+        return (self._mix(keys ^ seed) >> np.uint64(11)).astype(np.float64) / \
+            float(2 ** 53)
+
+    def keep(self, indices, names=None):
+        """Which records of a batch are sampled, not considering
+        ``maxReads``.
+
+        Parameters
+        ----------
+
+        indices: array-like of int
+            Indices of the records in the source
+
+        names: list of str, optional
+            Names of the records, required if ``byName``
+
+        Returns
+        -------
+
+        numpy.ndarray
+            Boolean array of the records sampled
+        """
+
+        indices = np.asarray(indices)
+        keep = np.ones(indices.shape, dtype=bool)
+
+        if self._stride is not None:
+            keep &= indices % self._stride == 0
+
+        if self._fraction is not None and self._fraction < 1:
+            keep &= self.hash(indices, names) < self._fraction
+
+        return keep
@@ -0,0 +1,304 @@
+#!/usr/bin/env python
+"""Module for journaling progress of runs so that they can be resumed"""
+
+import os
+import json
+import hashlib
+import threading
+import numpy as np
+
+
+class SeqJournal(object):
+    """Journal of the sources read and the reports made in a run.
+
+    When attached to a ``SeqReader``, each encoding is cached as a ``.npy``
+    file and recorded in the journal together with the report builders
+    that have completed. A run restarted with the same journal skips the
+    sources whose all report builders completed, and reuses the cached
+    encodings of sources only partially reported.
+
+    The journal is a JSON file that is rewritten atomically on every
+    update, so that it is intact even if the run is killed.
+
+    Entries are only reused if they were made with the same settings
+    (encoder parameters, data shape and type, filter and sampler settings
+    and the size and modification time of the files), and sources that
+    are streams are never journaled. The keys of the report builders
+    given by the ``SeqReader`` hold a digest of their parameters and the
+    directory of their reports, such that builders with other settings are
+    run again.
+
+    Attributes
+    ----------
+
+    path
+    cacheDirectory
+    sources
+    VERSION
+
+    Examples
+    --------
+
+    >>> seqReader = fseq.SeqReader(dataSourcePaths=paths,
+    ...                            journal=fseq.SeqJournal('run.journal'))
+    >>> seqReader.run()
+
+    If the run is interrupted, rerunning the same lines resumes it.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path, cacheDirectory=None):
+        """
+        Parameters
+        ----------
+
+        path: str
+            Path to the journal file, which is loaded if it exists
+
+        cacheDirectory: str, optional
+            Directory for the cached encodings
+
+            (Default: The journal's path suffixed by ``.cache``)
+
+        Raises
+        ------
+
+        ValueError
+            If the journal exists but is of another version
+        """
+
+        self._path = path
+        self._cacheDirectory = cacheDirectory or path + ".cache"
+        self._lock = threading.Lock()
+        self._sources = {}
+
+        if os.path.isfile(path):
+
+            with open(path) as fh:
+                data = json.load(fh)
+
+            if data.get('version') != self.VERSION:
+                raise ValueError(
+                    "Journal {0} has version {1}, expected {2}".format(
+                        path, data.get('version'), self.VERSION))
+
+            self._sources = data['sources']
+
+    @property
+    def path(self):
+        """Path to the journal file: str"""
+        return self._path
+
+    @property
+    def cacheDirectory(self):
+        """Directory of the cached encodings: str"""
+        return self._cacheDirectory
+
+    @property
+    def sources(self):
+        """The keys of the sources journaled: tuple"""
+        with self._lock:
+            return tuple(self._sources)
+
+    def _save(self):
+
+        directory = os.path.dirname(self._path)
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory)
+
+        tmp = self._path + ".tmp"
+        with open(tmp, 'w') as fh:
+            json.dump(dict(version=self.VERSION, sources=self._sources), fh,
+                      indent=2, sort_keys=True)
+
+        if hasattr(os, 'replace'):
+            os.replace(tmp, self._path)
+        else:
+            os.rename(tmp, self._path)
+
+    def _entry(self, key, settings):
+
+        entry = self._sources.get(key)
+        if entry is None or entry['settings'] != settings:
+            return None
+
+        return entry
+
+    def encoded(self, key, settings):
+        """The path to the cached encoding of a source.
+
+        Parameters
+        ----------
+
+        key: str
+            The source
+
+        settings: dict
+            The settings the encoding must have been made with
+
+        Returns
+        -------
+
+        str or None
+            ``None`` if the source has no valid cached encoding
+        """
+
+        with self._lock:
+            entry = self._entry(key, settings)
+
+        if entry is None or not os.path.isfile(entry['cache']):
+            return None
+
+        return entry['cache']
+
+    def reported(self, key, settings):
+        """The report builders completed for a source.
+
+        Parameters
+        ----------
+
+        key: str
+            The source
+
+        settings: dict
+            The settings the encoding must have been made with
+
+        Returns
+        -------
+
+        tuple
+            Keys of the report builders
+        """
+
+        with self._lock:
+            entry = self._entry(key, settings)
+            return entry is not None and tuple(entry['builders']) or tuple()
+
+    def complete(self, key, settings, builders):
+        """If a source is encoded and all report builders completed.
+
+        Parameters
+        ----------
+
+        key: str
+            The source
+
+        settings: dict
+            The settings the encoding must have been made with
+
+        builders: iterable of str
+            The keys of the report builders that should have completed
+
+        Returns
+        -------
+
+        bool
+        """
+
+        return self.encoded(key, settings) is not None and \
+            set(builders).issubset(self.reported(key, settings))
+
+    def recordEncoding(self, key, settings, data, **info):
+        """Caches an encoding and journals it, clearing any previously
+        completed report builders of the source.
+
+        Parameters
+        ----------
+
+        key: str
+            The source
+
+        settings: dict
+            The settings the encoding was made with
+
+        data: numpy.ndarray
+            The encoding
+
+        info: optional
+            Further JSON-serializable information to journal
+
+        Returns
+        -------
+
+        str
+            The path of the cached encoding
+        """
+
+        if not os.path.isdir(self._cacheDirectory):
+            os.makedirs(self._cacheDirectory)
+
+        cache = os.path.join(
+            self._cacheDirectory,
+            hashlib.md5(key.encode('utf-8')).hexdigest() + ".npy")
+
+        np.save(cache, data)
+
+        entry = dict(info)
+        entry.update(settings=settings, cache=cache, builders=[],
+                     shape=list(data.shape), dtype=str(data.dtype))
+
+        with self._lock:
+            self._sources[key] = entry
+            self._save()
+
+        return cache
+
+    def statistics(self, key, settings):
+        """The statistics the report builders made of a source.
+
+        Parameters
+        ----------
+
+        key: str
+            The source
+
+        settings: dict
+            The settings the encoding must have been made with
+
+        Returns
+        -------
+
+        dict
+            Per key of report builder the statistics as journaled
+        """
+
+        with self._lock:
+            entry = self._entry(key, settings)
+            return entry is not None and \
+                dict(entry.get('statistics', {})) or {}
+
+    def recordReport(self, key, builder, statistics=None):
+        """Journals a report builder as completed for a source.
+
+        Parameters
+        ----------
+
+        key: str
+            The source
+
+        builder: str
+            The key of the report builder
+
+        statistics: dict, optional
+            JSON-serializable statistics that the builder made of the
+            source, to be merged with those of other sources
+
+            (Default: ``None``, no statistics)
+
+        Returns
+        -------
+
+        fseq.SeqJournal
+            Returns ``self``
+        """
+
+        with self._lock:
+            entry = self._sources[key]
+            if builder not in entry['builders']:
+                entry['builders'].append(builder)
+            if statistics is not None:
+                entry.setdefault('statistics', {})[builder] = statistics
+            self._save()
+
+        return self
@@ -0,0 +1,271 @@
+#!/usr/bin/env python
+"""Module for extracting per-record metadata from headers"""
+
+import re
+import numpy as np
+
+
+class SeqMetadata(object):
+    """Extracts fields from the header of each record into columnar arrays.
+
+    The extractor is attached to a ``SeqReader`` which then fills in one
+    array per field alongside the encoded data, such that row ``i`` of each
+    column belongs to row ``i`` of the encoding.
+
+    By default the lane, tile and x and y coordinates of Illumina headers
+    are extracted, both from the current::
+
+        @EAS139:136:FC706VJ:2:2104:15343:197393 1:Y:18:ATCACG
+
+    and the older::
+
+        @HWI-EAS209_0006_FC706VJ:5:58:5894:21141#ATCACG/1
+
+    style of headers.
+    Headers that can't be split get the ``fillValue`` in all numerical
+    fields.
+
+    Attributes
+    ----------
+
+    fields
+    names
+    splitter
+    fillValue
+    ILLUMINA
+    ILLUMINA_FIELDS
+
+    Examples
+    --------
+
+    Attaching the extractor to the reader:
+
+    >>> seqReader = fseq.SeqReader(metadataExtractor=fseq.SeqMetadata())
+    >>> res = seqReader.next()
+    >>> meta = seqReader.metadata
+
+    The mean GC-content of each tile then is:
+
+    >>> tiles, inverse = np.unique(meta['tile'], return_inverse=True)
+    >>> gc = np.bincount(inverse, weights=res.mean(axis=1)) / \\
+    ...     np.bincount(inverse)
+
+    A custom splitter may either be a regular expression with named groups:
+
+    >>> fseq.SeqMetadata(splitter=r'length=(?P<length>\\d+)')
+
+    or a function returning the fields of a header in order of ``fields``:
+
+    >>> fseq.SeqMetadata(splitter=lambda h: h.split('_')[1:3],
+    ...                  fields=(('sample', np.int32), ('well', np.int16)))
+    """
+
+    ILLUMINA = re.compile(
+        r'(?P<lane>\d+):(?P<tile>\d+):(?P<x>\d+):(?P<y>\d+)(?=[#/\s]|$)')
+
+    ILLUMINA_FIELDS = (('lane', np.int32), ('tile', np.int32),
+                       ('x', np.int32), ('y', np.int32))
+
+    def __init__(self, splitter=None, fields=None, fillValue=-1):
+        """
+        Parameters
+        ----------
+
+        splitter: str, compiled regular expression or function, optional
+            A regular expression searched for in each header, or a function
+            taking a header and returning the field values in the order of
+            ``fields`` or ``None`` if the header can't be split.
+
+            (Default: ``SeqMetadata.ILLUMINA``)
+
+        fields: iterable, optional
+            The fields to extract, either as names or as ``(name, dtype)``
+            tuples. Names default to ``np.int32`` type.
+
+            (Default: The named groups of ``splitter`` if a regular
+            expression, ``SeqMetadata.ILLUMINA_FIELDS`` if no splitter)
+
+        fillValue: int, optional
+            Value of numerical fields for headers that couldn't be split
+
+            (Default: -1)
+
+        Raises
+        ------
+
+        ValueError
+            If no fields could be determined
+        """
+
+        if splitter is None:
+            splitter = self.ILLUMINA
+            if fields is None:
+                fields = self.ILLUMINA_FIELDS
+
+        if isinstance(splitter, str):
+            splitter = re.compile(splitter)
+
+        if fields is None and hasattr(splitter, 'groupindex'):
+            fields = sorted(splitter.groupindex,
+                            key=lambda n: splitter.groupindex[n])
+
+        if not fields:
+            raise ValueError("No fields to extract for {0}".format(splitter))
+
+        self._fields = tuple(
+            isinstance(f, str) and (f, np.int32) or (f[0], f[1])
+            for f in fields)
+
+        self._splitter = splitter
+        self._fillValue = fillValue
+
+    @property
+    def fields(self):
+        """The fields extracted as ``(name, dtype)`` tuples: tuple"""
+        return self._fields
+
+    @property
+    def names(self):
+        """The names of the fields extracted: tuple"""
+        return tuple(name for name, _ in self._fields)
+
+    @property
+    def splitter(self):
+        """Regular expression or function splitting headers into fields"""
+        return self._splitter
+
+    @property
+    def fillValue(self):
+        """Value of numerical fields that couldn't be extracted"""
+        return self._fillValue
+
+    def allocate(self, rows):
+        """Creates the columns for a number of records.
+
+        Parameters
+        ----------
+
+        rows: int
+            Number of records
+
+        Returns
+        -------
+
+        dict
+            Field names as keys and arrays as values
+        """
+
+        columns = {}
+
+        for name, dtype in self._fields:
+
+            columns[name] = np.zeros((rows, ), dtype=dtype)
+            if columns[name].dtype.kind in 'iuf':
+                columns[name][...] = self._fillValue
+
+        return columns
+
+    def grow(self, columns, rows):
+        """Extends all columns by a number of records.
+
+        Parameters
+        ----------
+
+        columns: dict
+            As created by ``SeqMetadata.allocate``
+
+        rows: int
+            Number of records to extend by
+
+        Returns
+        -------
+
+        dict
+            New columns
+        """
+
+        new = self.allocate(rows)
+
+        return dict((name, np.concatenate((columns[name], new[name])))
+                    for name in columns)
+
+    def extract(self, header):
+        """The field values of a header.
+
+        Parameters
+        ----------
+
+        header: str
+            A header line
+
+        Returns
+        -------
+
+        tuple or None
+            The values as strings in the order of ``fields``, or ``None``
+            if the header couldn't be split
+        """
+
+        if hasattr(self._splitter, 'search'):
+
+            m = self._splitter.search(header)
+            return m and tuple(m.group(name) for name in self.names) or None
+
+        try:
+            values = self._splitter(header)
+        except (ValueError, IndexError):
+            return None
+
+        if values is None:
+            return None
+
+        values = tuple(values)
+
+        return len(values) == len(self._fields) and values or None
+
+    def parseBatch(self, headers, columns, outindex):
+        """Extracts the fields of consecutive headers into the columns.
+
+        Parameters
+        ----------
+
+        headers: list of str
+            Header lines
+
+        columns: dict
+            As created by ``SeqMetadata.allocate``
+
+        outindex: int
+            Row of the first header, the following headers are written to
+            the consecutive rows.
+
+        Returns
+        -------
+
+        int
+            Number of headers that couldn't be split
+        """
+
+        rows = []
+        failed = []
+
+        for i, header in enumerate(headers):
+
+            values = self.extract(header)
+            if values is None:
+                failed.append(i)
+            else:
+                rows.append(values)
+
+        if not rows:
+            return len(failed)
+
+        index = np.arange(outindex, outindex + len(headers))
+        if failed:
+            index = np.delete(index, failed)
+
+        for (name, dtype), values in zip(self._fields, zip(*rows)):
+
+            columns[name][index] = np.array(values).astype(dtype)
+
+        return len(failed)
@@ -0,0 +1,255 @@
+#!/usr/bin/env python
+"""Module for the bounded hand-off between reading and encoding"""
+
+import threading
+
+from time import time
+
+
+class SeqQueue(object):
+    """Bounded queue of record batches with backpressure.
+
+    The reader puts batches of records on the queue and blocks while the
+    queue holds more than ``maxRecords`` records or ``maxBytes`` bytes of
+    raw data, so that reading never runs further ahead of the encoding
+    workers than the bounds allow.
+    A batch is always accepted by an empty queue, even if it on its own
+    exceeds the bounds, so that a single large record can't deadlock the
+    reader.
+
+    Once the reader has put all batches it closes the queue, after which
+    ``SeqQueue.get`` returns ``None`` to the workers as soon as the queue
+    is empty.
+
+    Attributes
+    ----------
+
+    maxRecords
+    maxBytes
+    records
+    nBytes
+    highWaterRecords
+    highWaterBytes
+    """
+
+    def __init__(self, maxRecords=None, maxBytes=None):
+        """
+        Parameters
+        ----------
+
+        maxRecords: int, optional
+            Maximum number of records held
+
+            (Default: ``None``, no limit)
+
+        maxBytes: int, optional
+            Maximum number of bytes of raw data held
+
+            (Default: ``None``, no limit)
+        """
+
+        self._maxRecords = maxRecords
+        self._maxBytes = maxBytes
+
+        self._items = []
+        self._head = 0
+        self._records = 0
+        self._bytes = 0
+        self._unfinished = 0
+        self._closed = False
+
+        self._highWaterRecords = 0
+        self._highWaterBytes = 0
+
+        self._lock = threading.Lock()
+        self._notFull = threading.Condition(self._lock)
+        self._notEmpty = threading.Condition(self._lock)
+        self._allDone = threading.Condition(self._lock)
+
+    def __len__(self):
+
+        return len(self._items) - self._head
+
+    @property
+    def maxRecords(self):
+        """Maximum number of records held, ``None`` if unbounded: int"""
+        return self._maxRecords
+
+    @property
+    def maxBytes(self):
+        """Maximum number of bytes held, ``None`` if unbounded: int"""
+        return self._maxBytes
+
+    @property
+    def records(self):
+        """Number of records currently held: int"""
+        return self._records
+
+    @property
+    def nBytes(self):
+        """Number of bytes currently held: int"""
+        return self._bytes
+
+    @property
+    def highWaterRecords(self):
+        """Most records held at any time: int"""
+        return self._highWaterRecords
+
+    @property
+    def highWaterBytes(self):
+        """Most bytes held at any time: int"""
+        return self._highWaterBytes
+
+    def _full(self, nRecords, nBytes):
+
+        if self._records == 0:
+            return False
+
+        return ((self._maxRecords is not None and
+                 self._records + nRecords > self._maxRecords) or
+                (self._maxBytes is not None and
+                 self._bytes + nBytes > self._maxBytes))
+
+    def put(self, item, nRecords=1, nBytes=0):
+        """Puts an item on the queue, blocking while it's full.
+
+        Parameters
+        ----------
+
+        item: object
+            The item, typically an output index and a batch of records
+
+        nRecords: int, optional
+            Number of records in the item
+
+            (Default: 1)
+
+        nBytes: int, optional
+            Number of bytes in the item
+
+            (Default: 0)
+
+        Returns
+        -------
+
+        float
+            Seconds spent blocked
+
+        Raises
+        ------
+
+        ValueError
+            If the queue is closed
+        """
+
+        t = time()
+
+        with self._notFull:
+
+            if self._closed:
+                raise ValueError("Can't put on a closed queue")
+
+            while self._full(nRecords, nBytes):
+                self._notFull.wait()
+
+            self._items.append((item, nRecords, nBytes))
+            self._records += nRecords
+            self._bytes += nBytes
+            self._unfinished += 1
+
+            if self._records > self._highWaterRecords:
+                self._highWaterRecords = self._records
+            if self._bytes > self._highWaterBytes:
+                self._highWaterBytes = self._bytes
+
+            self._notEmpty.notify()
+
+        return time() - t
+
+    def get(self):
+        """Gets the next item, blocking while the queue is empty.
+
+        Every item gotten must be followed by a call to
+        ``SeqQueue.taskDone`` once it has been processed.
+
+        Returns
+        -------
+
+        object
+            The next item or ``None`` if the queue is closed and empty
+        """
+
+        with self._notEmpty:
+
+            while self._head == len(self._items) and not self._closed:
+                self._notEmpty.wait()
+
+            if self._head == len(self._items):
+                return None
+
+            item, nRecords, nBytes = self._items[self._head]
+            self._items[self._head] = None
+            self._head += 1
+
+            if self._head > 1024 and self._head * 2 > len(self._items):
+                del self._items[:self._head]
+                self._head = 0
+
+            self._records -= nRecords
+            self._bytes -= nBytes
+
+            self._notFull.notify()
+
+        return item
+
+    def taskDone(self):
+        """Marks an item gotten from the queue as processed.
+
+        Returns
+        -------
+
+        fseq.reading.seq_queue.SeqQueue
+            Returns ``self``
+        """
+
+        with self._allDone:
+
+            self._unfinished -= 1
+            if self._unfinished <= 0:
+                self._allDone.notify_all()
+
+        return self
+
+    def join(self):
+        """Blocks until all items put have been processed.
+
+        Returns
+        -------
+
+        fseq.reading.seq_queue.SeqQueue
+            Returns ``self``
+        """
+
+        with self._allDone:
+
+            while self._unfinished > 0:
+                self._allDone.wait()
+
+        return self
+
+    def close(self):
+        """Closes the queue so that workers get ``None`` once it's empty.
+
+        Returns
+        -------
+
+        fseq.reading.seq_queue.SeqQueue
+            Returns ``self``
+        """
+
+        with self._lock:
+
+            self._closed = True
+            self._notEmpty.notify_all()
+
+        return self
@@ -2,14 +2,26 @@
 """Module for reading sequence data"""
 
 import os
+import re
+import json
+import hashlib
+import sys
+import tempfile
+import multiprocessing
 import threading
+import warnings
 import numpy as np
 import logging
 
-from time import sleep
-from collections import deque
+from time import sleep, time
 
 import fseq
+from fseq.reading.seq_stats import SeqStats, summarize
+from fseq.reading.seq_queue import SeqQueue
+from fseq.reading.seq_metadata import SeqMetadata
+from fseq.reading.seq_filter import SeqFilter, SeqSampler
+from fseq.reading.seq_journal import SeqJournal
+from fseq.reading.seq_shards import SeqShard, shardRanges, countRecords
 
 
 class SeqReader(object):
@@ -24,17 +36,26 @@ class SeqReader(object):
 
     Attributes
     ----------
+    backend
     dataArrayConstructor
     dataWidth
     dataType
+    journal
+    metadata
+    metadataExtractor
     popDataSources
     popEncodingResults
     jobQueue
     reportBuilders
     reportDirectory
+    reportRoot
+    sampler
     SeqEncoder
+    seqFilter
     resetSeqEncoder
     results
+    stats
+    workers
 
     Examples
     --------
@@ -53,17 +74,56 @@ class SeqReader(object):
     the first may store results in ``seqReader.results`` depending on the
     ``seqReader.popEncodingResults`` settings while the latter never keeps
     the results in the state of the instance.
+
+    Paired-end data is added as pairs of sources, which are read in
+    lockstep and encoded into one result where the second axis is the mate:
+
+    >>> seqReader.addPairedData('sample_R1.fastq', 'sample_R2.fastq')
+    <fseq.reading.seq_reader.SeqReader at 0x7faf6970fd10>
+
+    >>> res = seqReader.next()
+    >>> res.shape
+    (250000, 2, 101)
+
+    Sources can also be ``'-'`` for the standard input or any opened
+    file-like object, e.g. to read the output of another program:
+
+    >>> proc = subprocess.Popen(['zcat', 'reads.fastq.gz'],
+    ...                         stdout=subprocess.PIPE)
+    >>> seqReader = fseq.SeqReader(dataSourcePaths=proc.stdout,
+    ...                            reportRoot='qc')
+
+    A single large file can be split into byte ranges that are encoded
+    in parallel processes, by a script run under an
+    ``if __name__ == '__main__':`` guard:
+
+    >>> seqReader = fseq.SeqReader(dataSourcePaths='huge.fastq', shards=16)
     """
 
     WORKERS = 32
+    BACKENDS = ('thread', 'inline')
     DATA_INITIAL_SIZE = 100000
+    BATCH_SIZE = 64
+    QUEUE_DEPTH = 4096
+    QUEUE_BYTES = None
+    QUEUE_MEMORY_SHARE = 0.1
+    RECORD_OVERHEAD = 64
+    SHARD_MIN_BYTES = 2 ** 20
+    PLAN_SAMPLE_RECORDS = 1000
+    PAIR_SUFFIX = re.compile(r'/[12]$')
+    RUN_TARGET = 'run.reports'
+    STDIN = '-'
     DEBUG = False
 
     def __init__(
             self, seqEncoder=None, dataSourcePaths=None, dataTargetPaths=None,
             reportBuilders=None, popDataSources=True, resetSeqEncoder=True,
             popEncodingResults=None, dataArrayConstructor=np.zeros,
-            dataWidth=101, dataType=np.float16, verbose=False):
+            dataWidth=101, dataType=None, verbose=False,
+            batchSize=None, queueDepth=None, queueBytes=None,
+            metadataExtractor=None, seqFilter=None, sampler=None,
+            reportRoot=None, journal=None, workers=None, backend='thread',
+            maxMemory=None, memmapDirectory=None, shards=None):
         """
         Parameters
         ----------
@@ -74,14 +134,16 @@ class SeqReader(object):
             
             (Default: ``fseq.SeqEncoderGC``) 
 
-        dataSourcePaths: string or iterable object, optional
-            Either a path string or a collection of paths to data files
+        dataSourcePaths: string, file-like or iterable object, optional
+            Either a path string, ``'-'`` for the standard input, an opened
+            file-like object or a collection of such
 
             (Default: no input / added later)
 
         dataTargetPaths: string or iterable object, optional
             Either a relative path string or collection of relative paths.
-            The path is relative to the respective data source.
+            The path is relative to the ``reportRoot`` or else to the
+            respective data source.
             
             (Default: will create a folder in the same directory as the 
             data source with the same name as the input suffixed by
@@ -128,27 +190,126 @@ class SeqReader(object):
         dataType: type, optional
             Data type for the data array.
 
-            (Default: ``np.float16``)
+            (Default: The encoder's ``dataType`` if it has one,
+            else ``np.float16``)
 
         verbose: bool, optional
             If running will emit some status messages
 
             (Default: ``False``)
+
+        batchSize: int, optional
+            Number of records handed to an encoding worker at a time
+
+            (Default: ``SeqReader.BATCH_SIZE``)
+
+        queueDepth: int, optional
+            Maximum number of records read but not yet picked up by the
+            encoding workers. Reading blocks while the limit is reached.
+            ``None`` or ``0`` gives no limit.
+
+            (Default: ``SeqReader.QUEUE_DEPTH``)
+
+        queueBytes: int, optional
+            As ``queueDepth`` but limits the bytes of raw data held.
+
+            (Default: ``SeqReader.QUEUE_BYTES``)
+
+        metadataExtractor: fseq.SeqMetadata, optional
+            If set, the fields it extracts from each record's header are
+            collected alongside the encoding, see ``SeqReader.metadata``.
+
+            (Default: ``None``, headers are not kept)
+
+        seqFilter: fseq.SeqFilter, optional
+            If set, only records passing the filter are encoded.
+
+            (Default: ``None``, all records are encoded)
+
+        sampler: fseq.SeqSampler, optional
+            If set, only records sampled are filtered and encoded.
+
+            (Default: ``None``, all records are encoded)
+
+        reportRoot: str, optional
+            Directory that the report targets are relative to.
+
+            (Default: ``None``, the directory of each data source and the
+            current directory for the standard input and file-like objects)
+
+        journal: fseq.SeqJournal, optional
+            If set, progress is journaled such that an interrupted run can
+            be resumed.
+
+            (Default: ``None``, no journaling)
+
+        workers: int, optional
+            Number of encoding worker threads
+
+            (Default: ``SeqReader.WORKERS``)
+
+        backend: str, optional
+            Either ``'thread'`` for encoding in worker threads, or
+            ``'inline'`` for encoding in the reading thread as records are
+            read.
+
+            (Default: ``'thread'``)
+
+        maxMemory: int, optional
+            Bytes of memory that reading a source should stay within, from
+            which the batch size, queue limits and storage of the encoding
+            are planned, see ``SeqReader.plan``.
+
+            (Default: ``None``, no planning)
+
+        memmapDirectory: str, optional
+            Directory for encodings stored as memory-mapped files when
+            they would not fit within ``maxMemory``.
+
+            (Default: ``None``, the system's temporary directory)
+
+        shards: int, optional
+            Number of byte ranges, and processes encoding them, that each
+            file is split into, see ``SeqReader.shards``.
+
+            (Default: ``None``, files are read as a whole)
         """
 
         self._idData = -1
+        self._journalEntry = None
+        self._runTime = None
         self._reportBuilders = []
         self._dataSourcePaths = []
         self._dataTargetPaths = []
         self._seqEncoder = None
         self._reportTargetBase = ""
         self._results = []
+        self._stats = []
+        self._metadata = None
+        self._reportStatistics = {}
+        self._statisticsLock = threading.Lock()
 
         self.dataArrayConstructor = dataArrayConstructor
         self.dataWidth = dataWidth
         self.dataType = dataType
 
         self.verbose = verbose
+        self.reportRoot = reportRoot
+        self.metadataExtractor = metadataExtractor
+        self.seqFilter = seqFilter
+        self.sampler = sampler
+        self.journal = journal
+        self.maxMemory = maxMemory
+        self.memmapDirectory = memmapDirectory
+        self.shards = shards
+
+        self.workers = self.WORKERS if workers is None else workers
+        self.backend = backend
+        self.batchSize = self.BATCH_SIZE if batchSize is None else batchSize
+        self.queueDepth = self.QUEUE_DEPTH if queueDepth is None else \
+            queueDepth
+        self.queueBytes = self.QUEUE_BYTES if queueBytes is None else \
+            queueBytes
 
         logging.basicConfig(level=logging.DEBUG,
                     format='%(asctime)s %(name)-12s %(levelname)-8s %(message)s',
@@ -214,14 +375,16 @@ class SeqReader(object):
         self._dataWidth = int(w)
 
     @property
-    def dataType(val):
-        
+    def dataType(self):
+        """Data type of the data array, ``None`` if using the encoder's
+        preferred type or ``np.float16``: type"""
+
         return self._dataType
 
     @dataType.setter
     def dataType(self, T):
 
-        if isinstance(T, type):
+        if T is None or isinstance(T, type):
 
             self._dataType = T
 
@@ -233,6 +396,331 @@ class SeqReader(object):
 
             self._dataType = type(T)
 
+    @property
+    def workers(self):
+        """Number of encoding worker threads: int"""
+
+        return self._workers
+
+    @workers.setter
+    def workers(self, val):
+
+        self._workers = max(1, int(val))
+
+    @property
+    def backend(self):
+        """How records are encoded, one of ``SeqReader.BACKENDS``: str
+
+        With ``'thread'``, the reading hands records to ``workers`` threads
+        through a bounded queue, while with ``'inline'`` the reading thread
+        encodes each batch itself, avoiding the hand-off, which may be
+        faster for cheap encoders or when few cores are available.
+
+        Raises
+        ------
+
+        ValueError
+            If trying to assign an unknown backend
+        """
+
+        return self._backend
+
+    @backend.setter
+    def backend(self, val):
+
+        if val not in self.BACKENDS:
+            raise ValueError("Unknown backend {0}, use one of {1}".format(
+                val, self.BACKENDS))
+
+        self._backend = val
+
+    @property
+    def batchSize(self):
+        """Number of records handed to an encoding worker at a time: int"""
+
+        return self._batchSize
+
+    @batchSize.setter
+    def batchSize(self, val):
+
+        self._batchSize = max(1, int(val))
+
+    @property
+    def queueDepth(self):
+        """Maximum number of records waiting for the encoding workers,
+        ``None`` if unbounded: int
+
+        Together with ``SeqReader.queueBytes`` it bounds how far reading
+        may run ahead of encoding, and thus the memory used for holding
+        raw lines.
+        """
+
+        return self._queueDepth
+
+    @queueDepth.setter
+    def queueDepth(self, val):
+
+        self._queueDepth = int(val) if val else None
+
+    @property
+    def queueBytes(self):
+        """Maximum number of bytes of raw data waiting for the encoding
+        workers, ``None`` if unbounded: int"""
+
+        return self._queueBytes
+
+    @queueBytes.setter
+    def queueBytes(self, val):
+
+        self._queueBytes = int(val) if val else None
+
+    @property
+    def metadataExtractor(self):
+        """The extractor of header fields, ``None`` if not extracting
+        metadata.
+
+        Returns
+        -------
+
+        fseq.SeqMetadata
+
+        Raises
+        ------
+
+        TypeError
+            If trying to assign object that is not a ``fseq.SeqMetadata``
+        """
+
+        return self._metadataExtractor
+
+    @metadataExtractor.setter
+    def metadataExtractor(self, extractor):
+
+        if extractor is not None and not isinstance(extractor, SeqMetadata):
+
+            raise TypeError(
+                "Extractor {0} is not a ``fseq.SeqMetadata``".format(
+                    extractor))
+
+        self._metadataExtractor = extractor
+
+    @property
+    def seqFilter(self):
+        """The filter records must pass to be encoded, ``None`` if not
+        filtering.
+
+        The filter is evaluated on each batch of records before they are
+        given rows in the data array, such that the encoding only contains
+        records that passed.
+        For paired sources, both mates must pass.
+
+        Returns
+        -------
+
+        fseq.SeqFilter
+
+        Raises
+        ------
+
+        TypeError
+            If trying to assign object that is not a ``fseq.SeqFilter``
+        """
+
+        return self._seqFilter
+
+    @seqFilter.setter
+    def seqFilter(self, seqFilter):
+
+        if seqFilter is not None and not isinstance(seqFilter, SeqFilter):
+
+            raise TypeError(
+                "Filter {0} is not a ``fseq.SeqFilter``".format(seqFilter))
+
+        self._seqFilter = seqFilter
+
+    @property
+    def sampler(self):
+        """The subsampling of records, ``None`` if not subsampling.
+
+        The sampler is applied to each batch of records before these are
+        filtered and encoded, and reading of a source stops once the
+        sampler's ``maxReads`` records have been encoded.
+
+        Returns
+        -------
+
+        fseq.SeqSampler
+
+        Raises
+        ------
+
+        TypeError
+            If trying to assign object that is not a ``fseq.SeqSampler``
+        """
+
+        return self._sampler
+
+    @sampler.setter
+    def sampler(self, sampler):
+
+        if sampler is not None and not isinstance(sampler, SeqSampler):
+
+            raise TypeError(
+                "Sampler {0} is not a ``fseq.SeqSampler``".format(sampler))
+
+        self._sampler = sampler
+
+    @property
+    def journal(self):
+        """The journal of the progress of the run, ``None`` if not
+        journaling.
+
+        With a journal, every encoding is cached and recorded along with
+        the report builders completed for it. Sources that are journaled
+        as complete for all report builders are then skipped, and those
+        that are journaled as encoded are loaded from the cache rather
+        than read.
+
+        Journaled sources are only reused if the encoder's parameters,
+        the data shape and type, the filter and sampler settings and the
+        size and modification time of the files are unchanged, and report
+        builders are only skipped if their parameters and the directory
+        of their reports are unchanged.
+
+        Returns
+        -------
+
+        fseq.SeqJournal
+
+        Raises
+        ------
+
+        TypeError
+            If trying to assign object that is not a ``fseq.SeqJournal``
+        """
+
+        return self._journal
+
+    @journal.setter
+    def journal(self, journal):
+
+        if journal is not None and not isinstance(journal, SeqJournal):
+
+            raise TypeError(
+                "Journal {0} is not a ``fseq.SeqJournal``".format(journal))
+
+        self._journal = journal
+
+    @property
+    def maxMemory(self):
+        """Bytes of memory that reading a source should stay within,
+        ``None`` if not planning for memory.
+
+        The raw lines held while reading get a ``QUEUE_MEMORY_SHARE`` of
+        the budget, which bounds the queue and the batch size, and the
+        encoding is kept in memory if its size, estimated from the size of
+        the source, fits in the rest. Otherwise the encoding is stored in
+        a memory-mapped file in ``memmapDirectory``, such that the
+        operating system can page it out rather than running out of
+        memory.
+
+        Returns
+        -------
+
+        int
+
+        Raises
+        ------
+
+        ValueError
+            If trying to assign a budget that is not positive
+        """
+
+        return self._maxMemory
+
+    @maxMemory.setter
+    def maxMemory(self, val):
+
+        if val is not None:
+
+            val = int(val)
+            if val < 1:
+                raise ValueError("Max memory {0} not positive".format(val))
+
+        self._maxMemory = val
+
+    @property
+    def memmapDirectory(self):
+        """Directory of memory-mapped encodings, ``None`` for the system's
+        temporary directory: str"""
+
+        return self._memmapDirectory
+
+    @memmapDirectory.setter
+    def memmapDirectory(self, val):
+
+        self._memmapDirectory = val
+
+    @property
+    def shards(self):
+        """Number of byte ranges that each file is split into: int
+
+        With more than one shard, a FASTQ or single line FASTA file is
+        split into byte ranges of whole records, at least
+        ``SHARD_MIN_BYTES`` each, which are encoded by as many processes
+        straight into their part of one memory-mapped encoding in
+        ``memmapDirectory``. The records of each range are counted
+        before they are encoded, so that each process knows where its
+        part starts.
+
+        Standard input, file-like objects and paired sources are read as
+        a whole, and so are files of which the format isn't detected from
+        the first lines. Stage timings are summed over the processes.
+
+        Sharded reading can't filter, subsample or extract metadata, as
+        the number of records encoded must be known in advance.
+
+        The processes are spawned, so they import the main module of the
+        program anew. A script reading with shards must therefore run
+        only under an ``if __name__ == '__main__':`` guard, as otherwise
+        each process would run the script again, just as ``multiprocessing``
+        itself requires. Shards are therefore only used if asked for.
+
+        Raises
+        ------
+
+        ValueError
+            If trying to assign a number that is not positive
+        """
+
+        return self._shards
+
+    @shards.setter
+    def shards(self, val):
+
+        val = 1 if val is None else int(val)
+        if val < 1:
+            raise ValueError("Shards {0} not positive".format(val))
+
+        self._shards = val
+
+    @property
+    def metadata(self):
+        """The header fields of the last made encoding, ``None`` if no
+        ``metadataExtractor`` was set.
+
+        Row ``i`` of each column belongs to row ``i`` of the encoding, for
+        paired sources the fields come from the first mate.
+
+        Returns
+        -------
+
+        dict
+            Field names as keys and arrays as values
+        """
+
+        return self._metadata
+
     @property
     def popDataSources(self):
         """If sequence reader should remove data sources from list of sources
@@ -280,6 +768,8 @@ class SeqReader(object):
 
         list of tuples
             Each tuple representing a source - target pair.
+            For paired sources, the source is itself a tuple of the two
+            mates' paths.
         """
         return zip(self._dataSourcePaths, self._dataTargetPaths)
 
@@ -301,6 +791,24 @@ class SeqReader(object):
 
         return (r for r in self._results)
 
+    @property
+    def stats(self):
+        """Timings and counts for each data source read, in order of reading.
+
+        Returns
+        -------
+
+        tuple of fseq.SeqStats
+
+        See also
+        --------
+
+        SeqReader.clearStats
+            Clearing the statistics
+        """
+
+        return tuple(self._stats)
+
     @popEncodingResults.setter
     def popEncodingResults(self, val):
 
@@ -389,6 +897,49 @@ class SeqReader(object):
         """
         return self._reportTargetBase
 
+    @property
+    def runReportDirectory(self):
+        """The directory where reports on the whole run go, named
+        ``SeqReader.RUN_TARGET`` in the ``reportRoot`` or else in the
+        current directory: str"""
+
+        return os.path.join(self._reportRoot or '', self.RUN_TARGET)
+
+    @property
+    def reportStatistics(self):
+        """The statistics the report builders made of each source, per
+        builder key, as lists of source and statistics: dict
+
+        The statistics are small and merged by the builders into the
+        reports on the whole run made by ``SeqReader.run``, see
+        ``fseq.ReportBuilderBase.summarize``.
+        """
+
+        with self._statisticsLock:
+            return dict((k, list(v)) for k, v in
+                        self._reportStatistics.items())
+
+    @property
+    def reportRoot(self):
+        """The directory that report targets are relative to, ``None`` if
+        relative to each data source.
+
+        Setting it is needed for reports of the standard input and
+        file-like objects to go elsewhere than the current directory.
+
+        Returns
+        -------
+
+        str
+        """
+
+        return self._reportRoot
+
+    @reportRoot.setter
+    def reportRoot(self, val):
+
+        self._reportRoot = val
+
     @property
     def verbose(self):
 
@@ -405,16 +956,21 @@ class SeqReader(object):
         Parameters
         ----------
 
-        sourcePaths: string or iterable object
-            Either a path string or a collection of paths to data files
+        sourcePaths: string, file-like or iterable object
+            Either a path string, ``'-'`` for the standard input, an opened
+            file-like object or a collection of such.
+            File-like objects are read from their current position and
+            never seeked, nor closed.
 
         targetPaths: string or iterable object, optional
             Either a relative path string or collection of relative paths.
-            The path is relative to the respective data source.
+            The path is relative to the ``reportRoot`` or else to the
+            respective data source.
 
             (Default: will create a folder in the same directory as the 
             data source with the same name as the input suffixed by
-            ``.reports``.)
+            ``.reports``. The name of the standard input is ``stdin`` and
+            that of file-like objects their ``name`` or ``stream``.)
 
             **Note:** If supplied, must reflect equal number of outputs as
                 inputs in ``sourcePaths`` 
@@ -433,7 +989,7 @@ class SeqReader(object):
             number of source-paths
         """
 
-        if isinstance(sourcePaths, str):
+        if self._isSingleSource(sourcePaths):
             sourcePaths = (sourcePaths, )
         if isinstance(targetPaths, str):
             targetPaths = (targetPaths, )
@@ -445,7 +1001,7 @@ class SeqReader(object):
 
         if targetPaths is None:
 
-            targetPaths = [os.path.basename(s) + ".reports"
+            targetPaths = [self._sourceName(s) + ".reports"
                            for s in sourcePaths]
 
         self._dataSourcePaths += list(sourcePaths)
@@ -453,14 +1009,34 @@ class SeqReader(object):
 
         return self
 
-    def addReportBuilders(self, *reportBuilders):
-        """Add a report builder to the set of reports done upon analysis.
+    def addPairedData(self, sourcePaths, mateSourcePaths, targetPaths=None):
+        """Add paired-end data sources to be analysed.
+
+        Each pair is read in lockstep, each file once, and encoded into
+        one result of shape ``(n, 2) + encoder.itemShape(dataWidth)``
+        such that ``res[:, 0]`` and ``res[:, 1]`` are the aligned
+        encodings of the first and second mates.
+
+        The identifiers of the mates are validated to match, ignoring
+        any trailing ``/1`` and ``/2``.
 
         Parameters
         ----------
 
-        reportBuilders: fseq.ReportBuilder, optional
-            Any number of report builder to be added
+        sourcePaths: string or iterable object
+            Either a path string or a collection of paths to the first
+            mates' data files
+
+        mateSourcePaths: string or iterable object
+            As ``sourcePaths``, but for the second mates
+
+        targetPaths: string or iterable object, optional
+            Either a relative path string or collection of relative paths.
+            The path is relative to the first mate's data source.
+
+            (Default: will create a folder in the same directory as the
+            first mate's data source with the same name as it suffixed by
+            ``.paired.reports``.)
 
         Returns
         -------
@@ -471,26 +1047,74 @@ class SeqReader(object):
         Raises
         ------
 
-        TypeError
-            If an item in ``reportBuilders`` is not a valid
-            ``fseq.ReportBuilder``
-        """
+        ValueError
+            If the number of first and second mate sources differ, or if
+            target paths are supplied but don't match in length with the
+            number of pairs
 
-        for reportBuilder in  reportBuilders:
-            if not isinstance(reportBuilder, fseq.ReportBuilderBase):
+        See also
+        --------
 
-                raise TypeError(
-                    "Report Builder {0} is not a ``fseq.ReportBuilder``".format(
-                        fseq.ReportBuilderBase))
+        SeqReader.pairId
+            The identifier that must match between mates
+        """
 
-            else:
+        if self._isSingleSource(sourcePaths):
+            sourcePaths = (sourcePaths, )
+        if self._isSingleSource(mateSourcePaths):
+            mateSourcePaths = (mateSourcePaths, )
 
-                self._reportBuilders.append(reportBuilder)
+        if len(sourcePaths) != len(mateSourcePaths):
+            raise ValueError(
+                "Un-equal number of first ({0}) and second ({1}) mates".format(
+                    len(sourcePaths), len(mateSourcePaths)))
 
-        return self
+        if targetPaths is None:
 
-    def clearJobQueue(self):
-        """Removes all jobs in the queue.
+            targetPaths = [self._sourceName(s) + ".paired.reports"
+                           for s in sourcePaths]
+
+        return self.addData(tuple(zip(sourcePaths, mateSourcePaths)),
+                            targetPaths=targetPaths)
+
+    def addReportBuilders(self, *reportBuilders):
+        """Add a report builder to the set of reports done upon analysis.
+
+        Parameters
+        ----------
+
+        reportBuilders: fseq.ReportBuilder, optional
+            Any number of report builder to be added
+
+        Returns
+        -------
+
+        fseq.SeqReader
+            Returns ``self``
+
+        Raises
+        ------
+
+        TypeError
+            If an item in ``reportBuilders`` is not a valid
+            ``fseq.ReportBuilder``
+        """
+
+        for reportBuilder in  reportBuilders:
+            if not isinstance(reportBuilder, fseq.ReportBuilderBase):
+
+                raise TypeError(
+                    "Report Builder {0} is not a ``fseq.ReportBuilder``".format(
+                        fseq.ReportBuilderBase))
+
+            else:
+
+                self._reportBuilders.append(reportBuilder)
+
+        return self
+
+    def clearJobQueue(self):
+        """Removes all jobs in the queue.
 
         Returns
         -------
@@ -518,6 +1142,25 @@ class SeqReader(object):
 
         return self
 
+    def clearStats(self):
+        """Removes all collected statistics, including those of the
+        report builders
+
+        Returns
+        -------
+
+        fseq.SeqReader
+            Returns ``self``
+        """
+
+        self._stats = []
+        self._runTime = None
+
+        with self._statisticsLock:
+            self._reportStatistics = {}
+
+        return self
+
     def removeReportBuilders(self, *builders):
         """Removes all builders supplied, or all builders if no specific
         builder is supplied.
@@ -570,6 +1213,11 @@ class SeqReader(object):
         """Runs through all sources and produces reports if such have been
         attached.
 
+        Report builders that make statistics of each source, see
+        ``fseq.ReportBuilderBase.summarize``, also get to make reports on
+        the whole run in ``SeqReader.runReportDirectory`` if more than one
+        source was reported.
+
         Returns
         -------
 
@@ -578,15 +1226,33 @@ class SeqReader(object):
         """
 
         reporters = set()
+        tStart = time()
         
         if self.verbose:
             self._logger.info("Has {0} jobs".format(len(self)))
 
         for res in self:
 
+            stats = self._stats[-1]
+            journalEntry = self._journalEntry
+            reported = journalEntry and self._journal.reported(
+                *journalEntry) or tuple()
             kwargs = dict(outputRoot=self.reportDirectory)
             args = (res, )
-            for rb in self._reportBuilders:
+            for idB, rb in enumerate(self._reportBuilders):
+
+                builderKey = self._builderKey(idB, rb)
+                journalBuilderKey = self._journalBuilderKey(
+                    idB, rb, self.reportDirectory)
+                if journalBuilderKey in reported:
+                    if self.verbose:
+                        self._logger.info(
+                            "Skipping {0}, journaled as complete".format(
+                                builderKey))
+                    self._restoreStatistics(
+                        journalEntry, stats.source, self.reportDirectory,
+                        (journalBuilderKey, ))
+                    continue
 
                 if self.verbose:
                     self._logger.info(
@@ -600,9 +1266,10 @@ class SeqReader(object):
                             kwargs))
 
                 t = threading.Thread(
-                    target=rb.distill,
-                    args=args,
-                    kwargs=kwargs)
+                    target=self._reportWorker,
+                    args=(rb, stats, args, kwargs,
+                          journalEntry and journalEntry[0], builderKey,
+                          journalBuilderKey))
                 t.start()
                 reporters.add(t)
 
@@ -615,38 +1282,658 @@ class SeqReader(object):
                 "Waiting for {0} report builders to finish".format(
                     len(reporters)))
         self._joinThreads(reporters)
+        self._distillRun()
+        self._runTime = (self._runTime or 0.0) + time() - tStart
 
         if self.verbose:
+            for stats in self._stats:
+                if stats.reportTimings:
+                    self._logger.info("Reporting {0}: {1}".format(
+                        stats.source, ", ".join(
+                            "{0}={1:.3f}s".format(k, v) for k, v in
+                            stats.reportTimings.items())))
             self._logger.info(
                 "All jobs complete")
 
         return self
 
-    def _encodingWorker(self, idW, encoder, data):
+    def summary(self):
+        """Summary of the statistics of all sources read.
+
+        Besides the statistics of each source, as in ``SeqReader.stats``,
+        it holds their totals. The total wall time is that spent in
+        ``SeqReader.run()``, including report building, if it was used.
+
+        Returns
+        -------
 
-        while not self._workersStart:
-            sleep(0.01)
+        dict
+            JSON-serializable summary
 
-        while self._more:
+        See also
+        --------
 
-            try:
-                outIndex, lines = self._lines.popleft()
-            except IndexError:
-                if self.DEBUG:
-                    print("Worker-{0}: Lazy worker awaits more job".format(idW))
-                sleep(0.01)
+        fseq.reading.seq_stats.summarize
+            Making the summary
+        """
+
+        return summarize(self._stats, self._runTime)
+
+    def plan(self, source=None):
+        """How a source will be read within ``maxMemory``.
+
+        The number of records is estimated from the size of the source
+        over the bytes per record of its first ``PLAN_SAMPLE_RECORDS``,
+        headers and for FASTQ the separator and quality lines included.
+        If the format isn't detected from the first lines, each record is
+        taken to be a sequence line of ``dataWidth``, which overestimates
+        the number of records.
+        Without ``maxMemory`` the plan is the reader's own settings.
+
+        Parameters
+        ----------
+
+        source: str or tuple, optional
+            A source, or a pair of sources, as added to the reader
+
+            (Default: The next source to be read)
+
+        Returns
+        -------
+
+        dict
+            With keys
+
+            ``storage``
+                ``'memory'`` or ``'memmap'``
+
+            ``batchSize``, ``queueDepth``, ``queueBytes``
+                The settings to read with
+
+            ``initialRows``
+                The rows allocated before reading
+
+            ``rowBytes``
+                Bytes of encoding per record
+
+            ``estimatedRows``
+                Records expected, ``None`` if unknown as for streams
+
+            ``estimatedBytes``
+                Memory expected to be used, ``None`` if unknown
+
+            ``filesAtOnce``
+                Sources of the same size that could be read at the same
+                time within ``maxMemory``, ``None`` if unknown
+        """
+
+        if source is None and self._dataSourcePaths:
+            source = self._dataSourcePaths[
+                0 if self.popDataSources else max(0, self._idData)]
+
+        paths = source if isinstance(source, tuple) else \
+            (source, ) if source is not None else tuple()
+        mates = max(1, len(paths))
+
+        E = self._seqEncoder
+        dataType = np.dtype(self._dataType or E.dataType or np.float16)
+        rowBytes = mates * dataType.itemsize * int(
+            np.prod(E.itemShape(self._dataWidth)))
+
+        if self._metadataExtractor is not None:
+            rowBytes += sum(column.dtype.itemsize for column in
+                            self._metadataExtractor.allocate(0).values())
+
+        rows = None
+        if paths and not self._isStream(paths[0]) and \
+                os.path.isfile(paths[0]):
+            recordBytes = self._recordBytes(paths[0]) or \
+                self._dataWidth + 1
+            rows = int(os.path.getsize(paths[0]) // recordBytes) + 1
+
+        maxReads = self._sampler and self._sampler.maxReads
+        if maxReads is not None:
+            rows = maxReads if rows is None else min(rows, maxReads)
+
+        plan = dict(
+            storage='memory', batchSize=self._batchSize,
+            queueDepth=self._queueDepth, queueBytes=self._queueBytes,
+            initialRows=self.DATA_INITIAL_SIZE, rowBytes=rowBytes,
+            estimatedRows=rows,
+            estimatedBytes=rows is not None and rows * rowBytes or None,
+            filesAtOnce=None)
+
+        if self._maxMemory is None:
+            return plan
+
+        budget = self._maxMemory
+        workers = 1 if self._backend == 'inline' else self._workers
+        recordBytes = mates * (2 * (self._dataWidth + 1) +
+                               self.RECORD_OVERHEAD)
+
+        queueBytes = max(recordBytes, int(budget * self.QUEUE_MEMORY_SHARE))
+        if self._queueBytes:
+            queueBytes = min(queueBytes, self._queueBytes)
+
+        batchSize = max(1, min(self._batchSize,
+                               queueBytes // (recordBytes * workers)))
+
+        queueDepth = max(batchSize, queueBytes // recordBytes)
+        if self._queueDepth:
+            queueDepth = max(batchSize, min(queueDepth, self._queueDepth))
+
+        rawBytes = queueBytes + workers * batchSize * recordBytes
+
+        if rows is not None and rawBytes + rows * rowBytes <= budget:
+            storage = 'memory'
+            initialRows = rows
+            estimatedBytes = rawBytes + rows * rowBytes
+        else:
+            storage = 'memmap'
+            initialRows = rows or self.DATA_INITIAL_SIZE
+            estimatedBytes = rawBytes
+
+        plan.update(
+            storage=storage, batchSize=batchSize, queueDepth=queueDepth,
+            queueBytes=queueBytes, initialRows=initialRows,
+            estimatedBytes=estimatedBytes,
+            filesAtOnce=rows is not None and
+            max(1, budget // (rawBytes + rows * rowBytes)) or None)
+
+        return plan
+
+    def _recordBytes(self, path):
+
+        detector = fseq.SeqFormatDetector()
+        lineBytes = []
+
+        try:
+            with open(path, 'rb') as fh:
+                for line in fh:
+                    lineBytes.append(len(line))
+                    if detector.detecting:
+                        detector.feed(line.decode('latin-1').rstrip("\r\n"))
+                    elif len(lineBytes) > \
+                            self.PLAN_SAMPLE_RECORDS * detector.itemSize:
+                        break
+        except (IOError, OSError, fseq.FormatError):
+            return None
+
+        if detector.detecting:
+            return None
+
+        records = len(lineBytes) // detector.itemSize
+        if records == 0:
+            return None
+
+        return sum(lineBytes[:records * detector.itemSize]) / float(records)
+
+    def _reportWorker(self, reportBuilder, stats, args, kwargs,
+                      journalKey=None, builderKey=None,
+                      journalBuilderKey=None):
+
+        t = time()
+        statistics = reportBuilder.summarize(*args)
+
+        if statistics is None:
+            reportBuilder.distill(*args, **kwargs)
+        else:
+            reportBuilder.distillStatistics(statistics, **kwargs)
+            self._addStatistics(builderKey, stats.source, statistics)
+
+        stats.addReportTiming(type(reportBuilder).__name__, time() - t)
+
+        if journalKey is not None:
+            self._journal.recordReport(
+                journalKey, journalBuilderKey,
+                statistics is not None and statistics.asDict() or None)
+
+    def _addStatistics(self, builderKey, source, statistics):
+
+        with self._statisticsLock:
+            self._reportStatistics.setdefault(builderKey, []).append(
+                (source, statistics))
+
+    def _restoreStatistics(self, journalEntry, source, reportDirectory,
+                           journalBuilderKeys):
+
+        if journalEntry is None:
+            return
+
+        journaled = self._journal.statistics(*journalEntry)
+
+        for idB, rb in enumerate(self._reportBuilders):
+
+            key = self._journalBuilderKey(idB, rb, reportDirectory)
+            if key in journalBuilderKeys and key in journaled and \
+                    rb.STATISTICS is not None:
+
+                self._addStatistics(self._builderKey(idB, rb), source,
+                                    rb.STATISTICS.fromDict(journaled[key]))
+
+    def _distillRun(self):
+
+        statistics = self.reportStatistics
+
+        for idB, rb in enumerate(self._reportBuilders):
+
+            entries = sorted(statistics.get(self._builderKey(idB, rb), []),
+                             key=lambda entry: str(entry[0]))
+
+            if len(entries) < 2:
+                continue
+
+            labels = [" + ".join(os.path.basename(str(p)) for p in source)
+                      if isinstance(source, tuple) else
+                      os.path.basename(str(source))
+                      for source, _ in entries]
+
+            if self.verbose:
+                self._logger.info("Reporting {0} on {1} sources".format(
+                    type(rb).__name__, len(entries)))
+
+            rb.distillRun([s for _, s in entries], labels,
+                          outputRoot=self.runReportDirectory)
+
+    @staticmethod
+    def _builderKey(idB, reportBuilder):
+
+        return "{0}:{1}".format(idB, type(reportBuilder).__name__)
+
+    def _journalBuilderKey(self, idB, reportBuilder, reportDirectory):
+
+        #Builders are only journaled as done with the same settings and
+        #for the same report directory
+        settings = json.dumps(dict(
+            parameters=reportBuilder.parameters,
+            saveData=reportBuilder.saveData,
+            outputNamePrefix=reportBuilder.outputNamePrefix,
+            reportDirectory=os.path.abspath(reportDirectory)),
+            sort_keys=True, default=repr)
+
+        return "{0}:{1}".format(
+            self._builderKey(idB, reportBuilder),
+            hashlib.sha1(settings.encode('utf-8')).hexdigest()[:12])
+
+    def _reportDirectoryOf(self, paths, target):
+
+        if self._reportRoot is not None:
+            root = self._reportRoot
+        elif self._isStream(paths[0]):
+            root = ''
+        else:
+            root = os.path.dirname(paths[0])
+
+        return os.path.join(root, target)
+
+    def _journalKey(self, source):
+
+        if self._journal is None:
+            return None
+
+        paths = isinstance(source, tuple) and source or (source, )
+        if any(self._isStream(p) for p in paths):
+            return None
+
+        return "|".join(os.path.abspath(p) for p in paths)
+
+    def _journalSettings(self, encoder, paths):
+
+        mates = len(paths)
+        sources = []
+        for path in paths:
+            if not self._isStream(path) and os.path.isfile(path):
+                stat = os.stat(path)
+                sources.append(dict(size=stat.st_size, mtime=stat.st_mtime))
             else:
-                if self.DEBUG:
-                    print(idW, outIndex, data.shape, id(data))
-                encoder.parse(lines, data, outIndex)
+                sources.append(None)
+
+        settings = dict(
+            encoder=encoder.parameters,
+            itemShape=[mates] * (mates > 1) +
+            list(encoder.itemShape(self._dataWidth)),
+            dataType=np.dtype(
+                self._dataType or encoder.dataType or np.float16).name,
+            seqFilter=self._seqFilter and self._seqFilter.parameters,
+            sampler=self._sampler and self._sampler.parameters,
+            sources=sources)
+
+        #As compared with the settings loaded from the journal's JSON
+        return json.loads(json.dumps(settings, sort_keys=True, default=repr))
+
+    def _popSource(self):
+
+        if len(self) == 0 or self._idData == len(self):
+            raise StopIteration()
+
+        if self.popDataSources:
+            source = self._dataSourcePaths.pop(0)
+            target = self._dataTargetPaths.pop(0)
+        else:
+            source = self._dataSourcePaths[self._idData]
+            target = self._dataTargetPaths[self._idData]
+            self._idData += 1
+
+        return source, target
+
+    @classmethod
+    def pairId(cls, header):
+        """The identifier of a record used for matching paired mates.
+
+        It is the first word of the header, excluding the leading
+        ``@`` or ``>`` and any trailing ``/1`` or ``/2``.
+
+        Parameters
+        ----------
+
+        header: str
+            A header line
+
+        Returns
+        -------
+
+        str
+        """
+
+        words = header[1:].split(None, 1)
+
+        return cls.PAIR_SUFFIX.sub('', words[0]) if words else ''
+
+    @staticmethod
+    def _isSingleSource(source):
+
+        return isinstance(source, str) or hasattr(source, 'readline')
+
+    def _isStream(self, source):
+
+        return not isinstance(source, str) or source == self.STDIN
+
+    def _sourceName(self, source):
+
+        if source == self.STDIN or source is sys.stdin:
+            return 'stdin'
+
+        if not isinstance(source, str):
+
+            source = getattr(source, 'name', None)
+            if not isinstance(source, str) or source.startswith('<'):
+                return 'stream'
+
+        return os.path.basename(source)
+
+    def _describeSource(self, source):
+
+        return self._isStream(source) and self._sourceName(source) or source
+
+    def _open(self, source):
+
+        if source == self.STDIN:
+            return getattr(sys.stdin, 'buffer', sys.stdin), False
+        elif self._isStream(source):
+            return source, False
+
+        return open(source, 'rb'), True
 
-    def _spawnWorkers(self, encoder, data):
+    def _validatePairs(self, mates, headerLine):
+
+        for r1, r2 in zip(*mates):
+
+            id1 = self.pairId(r1[headerLine].decode('latin-1'))
+            id2 = self.pairId(r2[headerLine].decode('latin-1'))
+
+            if id1 != id2:
+                raise fseq.PairMismatch(
+                    "Mates have mismatching pair ids '{0}' and '{1}'".format(
+                        id1, id2))
+
+    def _sampleMates(self, sampler, mates, firstIndex, headerLine, stats):
+
+        n = len(mates[0])
+
+        keep = sampler.keep(
+            np.arange(firstIndex, firstIndex + n),
+            sampler.byName and
+            [self.pairId(lines[headerLine].decode('latin-1'))
+             for lines in mates[0]] or None)
+
+        stats.counts['skipped'] += n - int(np.count_nonzero(keep))
+
+        if keep.all():
+            return mates
+
+        return [[lines for lines, k in zip(records, keep) if k]
+                for records in mates]
+
+    def _filterMates(self, seqFilter, mates, sequenceLine, qualityLine,
+                     stats):
+
+        keep = None
+
+        for records in mates:
+
+            passed, failed = seqFilter.evaluate(
+                [lines[sequenceLine] for lines in records],
+                qualityLine is not None and
+                [lines[qualityLine] for lines in records] or None)
+
+            keep = passed if keep is None else keep & passed
+
+            for name, n in failed.items():
+                stats.filterCounts[name] = stats.filterCounts.get(name, 0) + n
+
+        stats.counts['filtered'] += len(keep) - int(np.count_nonzero(keep))
+
+        if keep.all():
+            return mates
+
+        return [[lines for lines, k in zip(records, keep) if k]
+                for records in mates]
+
+    def _allocate(self, encoder, rows, mates=1, storage='memory'):
+
+        dataType = self._dataType or encoder.dataType or np.float16
+        shape = (rows, ) + ((mates, ) if mates > 1 else tuple()) + \
+            tuple(encoder.itemShape(self._dataWidth))
+
+        if storage == 'memmap':
+
+            fd, path = tempfile.mkstemp(
+                prefix="fseq-", suffix=".dat", dir=self._memmapDirectory)
+            os.close(fd)
+
+            D = np.memmap(path, dtype=dataType, mode='w+', shape=shape)
+
+            #The mapping outlives the file where the system permits
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+
+            return D
+
+        return self._dataArrayConstructor(shape, dtype=dataType)
+
+    def _grow(self, encoder, D, rows, mates, storage):
+
+        if storage == 'memmap':
+
+            #Copying a mapped file is costly, so its size is doubled
+            G = self._allocate(encoder, D.shape[0] + max(rows, D.shape[0]),
+                               mates, storage)
+            G[:D.shape[0]] = D
+
+            return G
+
+        return np.concatenate((D, self._allocate(encoder, rows, mates)))
+
+    def _readShards(self, encoder, path, stats):
+
+        if self._seqFilter is not None or self._sampler is not None or \
+                self._metadataExtractor is not None:
+
+            raise ValueError(
+                "Sharded reading can't filter, sample or extract metadata")
+
+        shards = min(self._shards,
+                     os.path.getsize(path) // self.SHARD_MIN_BYTES)
+
+        if shards < 2:
+            return None
+
+        tStart = time()
+        detector = fseq.SeqFormatDetector()
+
+        try:
+            with open(path, 'rb') as fh:
+                for line in fh:
+                    detector.feed(line.decode('latin-1').rstrip("\r\n"))
+                    if not detector.detecting:
+                        break
+        except fseq.FormatError:
+            return None
+
+        if detector.detecting:
+            return None
+
+        itemSize = detector.itemSize
+        ranges = shardRanges(path, shards, itemSize)
+        stats.timings['detection'] = time() - tStart
+
+        dataType = np.dtype(self._dataType or encoder.dataType or np.float16)
+        itemShape = tuple(encoder.itemShape(self._dataWidth))
+        rowBytes = dataType.itemsize * int(np.prod(itemShape))
+
+        #Spawned rather than forked as other threads may hold locks
+        context = hasattr(multiprocessing, 'get_context') and \
+            multiprocessing.get_context('spawn') or multiprocessing
+        pool = context.Pool(len(ranges))
+
+        fd, target = tempfile.mkstemp(
+            prefix="fseq-", suffix=".dat", dir=self._memmapDirectory)
+        os.close(fd)
+
+        try:
+
+            counts = pool.map(_countShard, [
+                (path, start, end, itemSize) for start, end in ranges])
+            offsets = np.cumsum([0] + counts)
+
+            if not offsets[-1]:
+                return None
+
+            D = np.memmap(target, dtype=dataType, mode='w+',
+                          shape=(int(offsets[-1]), ) + itemShape)
+
+            settings = dict(
+                dataWidth=self._dataWidth, dataType=dataType.type,
+                batchSize=self._batchSize, queueDepth=self._queueDepth,
+                queueBytes=self._queueBytes, workers=self._workers,
+                backend=self._backend)
+
+            results = pool.map(_readShard, [
+                (path, start, end, n, target, int(offset) * rowBytes,
+                 encoder, settings)
+                for (start, end), n, offset in zip(ranges, counts, offsets)
+                if n])
+
+        finally:
+
+            pool.close()
+            pool.join()
+
+            #The mapping outlives the file where the system permits
+            try:
+                os.unlink(target)
+            except OSError:
+                pass
+
+        #Records that turn out not to be, such as blank lines, leave gaps
+        workingIndex = 0
+        for (n, shardStats), count, offset in zip(
+                results, [n for n in counts if n],
+                [o for n, o in zip(counts, offsets) if n]):
+
+            if workingIndex != offset:
+                D[workingIndex: workingIndex + n] = D[offset: offset + n]
+            workingIndex += n
+
+            for name, value in shardStats['counts'].items():
+                if name.startswith('queueHighWater'):
+                    stats.counts[name] = max(stats.counts[name], value)
+                else:
+                    stats.addCount(name, value)
+
+            for stage, seconds in shardStats['timings'].items():
+                if stage != 'total':
+                    stats.addTiming(stage, seconds)
+
+        return D[:workingIndex]
+
+    def _encodingWorker(self, idW, encoder, extractor, store, queue, stats,
+                        errors):
+
+        idle = 0.0
+        encoding = 0.0
+
+        while True:
+
+            t = time()
+            item = queue.get()
+            idle += time() - t
+
+            if item is None:
+                break
+
+            outIndex, mates = item
+
+            if self.DEBUG:
+                print(idW, outIndex, len(mates[0]), store[0].shape)
+
+            t = time()
+            try:
+                self._encode(encoder, extractor, store, outIndex, mates,
+                             stats)
+            except Exception as e:
+                errors.append(e)
+            encoding += time() - t
+
+            queue.taskDone()
+
+        stats.addTiming('workerIdle', idle)
+        stats.addTiming('encoding', encoding)
+
+    def _encode(self, encoder, extractor, store, outIndex, mates, stats):
+
+        out = store[0]
+
+        if len(mates) == 1:
+            encoder.parseBuffer(*(encoder.recordBuffer(mates[0]) +
+                                  (out, outIndex)))
+        else:
+            for idM, records in enumerate(mates):
+                encoder.parseBuffer(*(encoder.recordBuffer(records) +
+                                      (out[:, idM], outIndex)))
+
+        if extractor is not None:
+            headerLine = encoder.format.headerLine
+            failed = extractor.parseBatch(
+                [lines[headerLine].decode('latin-1') for lines in mates[0]],
+                store[1], outIndex)
+            if failed:
+                stats.addCount('unparsedHeaders', failed)
+
+    def _spawnWorkers(self, encoder, extractor, store, queue, stats, errors):
 
         workers = []
-        self._workersStart = False
-        for idW in range(self.WORKERS):
-            worker = threading.Thread(target=self._encodingWorker,
-                                      args=(idW, encoder, data))
+
+        if self._backend == 'inline':
+            return workers
+
+        for idW in range(self._workers):
+            worker = threading.Thread(
+                target=self._encodingWorker,
+                args=(idW, encoder, extractor, store, queue, stats, errors))
+            worker.daemon = True
             worker.start()
             workers.append(worker)
 
@@ -654,15 +1941,9 @@ class SeqReader(object):
         
     def _joinThreads(self, workers):
 
-        #If workers never started
-        self._workersStart = True
-
-        #Let workers know no more awaits even if it does
-        self._more = False
-
         while workers:
             worker = workers.pop()
-            while worker.isAlive():
+            while worker.is_alive():
                 worker.join(1)
 
         return self
@@ -676,6 +1957,7 @@ class SeqReader(object):
 
         numpy.ndarray
             Encoding output.
+            For paired sources the second axis holds the two mates.
 
         Raises
         ------
@@ -685,6 +1967,9 @@ class SeqReader(object):
 
         StopIteration
             If no more data-source exists.
+
+        fseq.PairMismatch
+            If the mates of a paired source don't match
         """
 
         if len(self) == 0 or self._idData == len(self):
@@ -695,26 +1980,98 @@ class SeqReader(object):
         if E is None:
             raise ValueError("No encoder present")
 
+        while True:
 
-        if self.popDataSources:
-            source = self._dataSourcePaths.pop(0)
-            self._reportTargetBase = os.path.join(
-                os.path.dirname(source), self._dataTargetPaths.pop(0))
-        else:
-            source = self._dataSourcePaths[self._idData]
-            self._reportTargetBase = os.path.join(
-                os.path.dirname(source), self._dataTargetPaths[self._idData])
-            self._idData += 1
+            source, target = self._popSource()
+
+            paired = isinstance(source, tuple)
+            paths = source if paired else (source, )
+
+            reportDirectory = self._reportDirectoryOf(paths, target)
+            builderKeys = [
+                self._journalBuilderKey(idB, rb, reportDirectory)
+                for idB, rb in enumerate(self._reportBuilders)]
+
+            journalKey = self._journalKey(source)
+            settings = self._journalSettings(E, paths)
+
+            if journalKey is None or not builderKeys or \
+                    not self._journal.complete(
+                        journalKey, settings, builderKeys):
+                break
+
+            if self.verbose:
+                self._logger.info(
+                    "Skipping {0}, journaled as complete".format(source))
+
+            self._restoreStatistics(
+                (journalKey, settings),
+                paired and tuple(self._describeSource(p) for p in paths) or
+                self._describeSource(source), reportDirectory, builderKeys)
+
+        self._journalEntry = journalKey is not None and \
+            (journalKey, settings) or None
+
+        self._reportTargetBase = reportDirectory
+
+        description = tuple(self._describeSource(p) for p in paths)
+        description = paired and description or description[0]
 
         if self.verbose:
-            self._logger.info("Reading: {0}".format(source))
+            self._logger.info("Reading: {0}".format(description))
+
+        stats = SeqStats(description)
+        self._stats.append(stats)
+        tStart = time()
+
+        plan = self.plan(source)
+        storage = plan['storage']
+
+        if self.verbose and self._maxMemory is not None:
+            self._logger.info("Plan: {0}".format(plan))
+
+        cache = journalKey is not None and \
+            self._journal.encoded(journalKey, settings)
+
+        if cache:
+
+            if self.verbose:
+                self._logger.info("Loading journaled encoding: {0}".format(
+                    cache))
+
+            D = np.load(cache, mmap_mode=storage == 'memmap' and 'c' or None)
+            self._metadata = None
+
+            stats.counts['records'] = D.shape[0]
+            stats.timings['total'] = time() - tStart
+            stats.complete()
+
+            return D
 
         if self.resetSeqEncoder:
             E.reset()
 
-        D = self._dataArrayConstructor(
-                (self.DATA_INITIAL_SIZE, self._dataWidth),
-                dtype=self._dataType)
+        D = None
+        if self._shards > 1 and not paired and not self._isStream(source):
+            D = self._readShards(E, source, stats)
+
+        if D is not None:
+
+            self._metadata = None
+            stats.timings['total'] = time() - tStart
+            stats.complete()
+
+            if journalKey is not None:
+                self._journal.recordEncoding(
+                    journalKey, settings, D, target=target)
+
+            if self.verbose:
+                self._logger.info("Reading Complete: {0}".format(description))
+                self._logger.info(str(stats))
+
+            return D
+
+        D = self._allocate(E, plan['initialRows'], len(paths), storage)
         
         lenD = D.shape[0]
 
@@ -723,82 +2080,250 @@ class SeqReader(object):
 
         notInitiated = True
         chunkSize = None
+        headerLine = None
+        sequenceLine = None
+        qualityLine = None
+        seqFilter = self._seqFilter
+        sampler = self._sampler
+        maxReads = sampler and sampler.maxReads
+        batchSize = plan['batchSize']
 
         workingIndex = 0
-        linesStore = []
-
-        self._more = True
-        self._lines = deque()
-        workers = self._spawnWorkers(E, D)
+        nRecords = 0
+        linesStores = [[] for _ in paths]
+
+        #Workers encode into ``store[0]`` and extract metadata into
+        #``store[1]`` so that these can be replaced when grown without
+        #restarting the workers
+        extractor = self._metadataExtractor
+        store = [D, extractor and extractor.allocate(lenD)]
+        self._metadata = None
+        errors = []
+        queue = SeqQueue(maxRecords=plan['queueDepth'],
+                         maxBytes=plan['queueBytes'])
+        workers = self._spawnWorkers(
+            E, extractor, store, queue, stats, errors)
 
         notEOF = True
         lines2Store = True
 
-        with open(source, 'r') as fh:
+        inline = self._backend == 'inline'
+
+        nLines = 0
+        nBytes = 0
+        tEncoding = 0.0
+        tQueueing = 0.0
+        tGrowing = 0.0
+        tWaiting = 0.0
+
+        fhs, owned = zip(*(self._open(path) for path in paths))
+
+        try:
 
             while lines2Store:
 
                 if notEOF:
-                    line = fh.readline()
-                    if line == '':
+                    #Lines are kept as bytes all the way to the encoder
+                    lines = [fh.readline() for fh in fhs]
+                    lines = [line if isinstance(line, bytes) else
+                             line.encode('latin-1') for line in lines]
+                    ended = lines.count(b'')
+                    if ended == len(lines):
                         notEOF = False
+                    elif ended:
+                        raise fseq.PairMismatch(
+                            "{0} ended before its mate".format(
+                                description[lines.index(b'')]))
                     else:
-                        line = line.rstrip("\n")
-                        linesStore.append(line)
+                        for line, linesStore in zip(lines, linesStores):
+                            nLines += 1
+                            nBytes += len(line)
+                            linesStore.append(line.rstrip(b"\r\n"))
+                        line = lines[0]
 
                 if notInitiated:
                     if E.initiated:
-                        self._workersStart = True
+                        stats.timings['detection'] = time() - tStart
                         chunkSize = E.itemSize
+                        headerLine = E.format.headerLine
+                        sequenceLine = E.format.sequenceLine
+                        qualityLine = E.format.qualityLine
+                        batchLines = chunkSize * batchSize
                         notInitiated = False
+
+                        if seqFilter is not None and \
+                                seqFilter.usesQuality and qualityLine is None:
+
+                            raise fseq.FormatError(
+                                "Filter requires quality not in format")
                     elif notEOF:
-                        E.feedDetection(line)
-                    elif not detectorThread.isAlive():
+                        E.feedDetection(
+                            line.replace(b"\r\n", b"\n").decode('latin-1'))
+                    elif not detectorThread.is_alive():
                         lines2Store = False
                     else:
+                        t = time()
                         sleep(0.01)
-                else:
+                        tWaiting += time() - t
+                elif len(linesStores[0]) >= batchLines or not notEOF:
 
-                    while len(linesStore) >= chunkSize:
+                    t = time()
 
-                        if workingIndex == lenD:
+                    while len(linesStores[0]) >= chunkSize:
 
-                            self._joinThreads(workers)
-                            sleep(0.015)
+                        n = min(batchSize, len(linesStores[0]) // chunkSize)
 
-                            D = np.concatenate((D, self._dataArrayConstructor(
-                                (self.DATA_INITIAL_SIZE, self._dataWidth),
-                                dtype=self._dataType)))
+                        mates = []
+                        nChunkBytes = 0
 
-                            lenD = D.shape[0]
+                        for idM, linesStore in enumerate(linesStores):
 
-                            self._spawnWorkers(E, D)
-                            self._more = True
-                            self._workersStart = True
+                            chunk = linesStore[:n * chunkSize]
+                            linesStores[idM] = linesStore[n * chunkSize:]
+                            nChunkBytes += sum(map(len, chunk))
 
-                        else:
+                            mates.append(
+                                [chunk[i: i + chunkSize] for i in
+                                 range(0, len(chunk), chunkSize)])
+
+                        if sampler is not None:
+                            mates = self._sampleMates(
+                                sampler, mates, nRecords, headerLine, stats)
+
+                        nRecords += n
+                        n = len(mates[0])
+
+                        if paired:
+                            self._validatePairs(mates, headerLine)
+
+                        if seqFilter is not None and n:
+                            mates = self._filterMates(
+                                seqFilter, mates, sequenceLine, qualityLine,
+                                stats)
+                            n = len(mates[0])
+
+                        if maxReads is not None and \
+                                workingIndex + n >= maxReads:
+
+                            n = maxReads - workingIndex
+                            mates = [records[:n] for records in mates]
 
-                            self._lines.append(
-                                (workingIndex, linesStore[:chunkSize]))
+                            #Enough records sampled, no need to read further
+                            linesStores = [[] for _ in paths]
+                            notEOF = False
 
-                            linesStore = linesStore[chunkSize:]
+                        if n == 0:
+                            continue
 
-                            workingIndex += 1
-                            
+                        if workingIndex + n > lenD:
 
+                            tGrow = time()
 
-                        #print chunkSize, workingIndex, linesStore
+                            queue.join()
+
+                            D = self._grow(E, D, self.DATA_INITIAL_SIZE,
+                                           len(paths), storage)
+
+                            if extractor is not None:
+                                store[1] = extractor.grow(
+                                    store[1], D.shape[0] - lenD)
+
+                            lenD = D.shape[0]
+                            store[0] = D
+
+                            stats.counts['grows'] += 1
+                            tGrowing += time() - tGrow
+
+                        if inline:
+                            tEncode = time()
+                            self._encode(E, extractor, store, workingIndex,
+                                         mates, stats)
+                            tEncoding += time() - tEncode
+                        else:
+                            queue.put((workingIndex, mates), n, nChunkBytes)
+
+                        workingIndex += n
+
+                    tQueueing += time() - t
 
                     if notEOF is False:
                         lines2Store = False
 
-        while self._lines:
-            sleep(0.01)
+        except:
+
+            queue.close()
+            self._joinThreads(workers)
+            raise
 
+        finally:
+
+            for fh, own in zip(fhs, owned):
+                if own:
+                    fh.close()
+
+        tRead = time()
+
+        queue.close()
         detectorThread.join()
         self._joinThreads(workers)
 
+        tEnd = time()
+
+        stats.timings['queueing'] = tQueueing - tGrowing - tEncoding
+        stats.addTiming('encoding', tEncoding)
+        stats.timings['growing'] = tGrowing
+        stats.timings['draining'] = tEnd - tRead
+        stats.timings['total'] = tEnd - tStart
+        stats.timings['reading'] = max(
+            0.0, tRead - tStart - tQueueing - tWaiting)
+        stats.counts.update(lines=nLines, bytes=nBytes, records=workingIndex,
+                            queueHighWater=queue.highWaterRecords,
+                            queueHighWaterBytes=queue.highWaterBytes)
+        stats.complete()
+
+        if errors:
+            raise errors[0]
+
+        if extractor is not None:
+            self._metadata = dict((name, column[:workingIndex])
+                                  for name, column in store[1].items())
+
+        if journalKey is not None:
+            self._journal.recordEncoding(
+                journalKey, settings, D[:workingIndex], target=target)
+
         if self.verbose:
-            self._logger.info("Reading Complete: {0}".format(source))
+            self._logger.info("Reading Complete: {0}".format(description))
+            self._logger.info(str(stats))
 
         return D[:workingIndex]
+
+    __next__ = next
+
+
+def _countShard(args):
+
+    return countRecords(*args)
+
+
+def _readShard(args):
+
+    path, start, end, rows, target, offset, encoder, settings = args
+
+    out = np.memmap(target, dtype=settings['dataType'], mode='r+',
+                    offset=offset, shape=(rows, ) +
+                    tuple(encoder.itemShape(settings['dataWidth'])))
+
+    shard = SeqShard(path, start, end)
+
+    try:
+        reader = SeqReader(
+            seqEncoder=encoder, dataSourcePaths=shard, reportBuilders=[],
+            dataArrayConstructor=lambda shape, dtype: out, **settings)
+        reader.DATA_INITIAL_SIZE = rows
+        D = reader.next()
+        out.flush()
+    finally:
+        shard.close()
+
+    return D.shape[0], reader.stats[0].asDict()
@@ -0,0 +1,284 @@
+#!/usr/bin/env python
+"""Module for splitting a file into byte ranges of whole records"""
+
+import os
+
+COUNT_CHUNK_SIZE = 2 ** 24
+
+
+class SeqShard(object):
+    """Byte range of a file, read as if it was a file of its own.
+
+    The range should start and end at the start of records, as given by
+    ``shardRanges``, such that it can be read as any source by the
+    ``SeqReader``.
+
+    Attributes
+    ----------
+
+    path
+    name
+    start
+    end
+
+    Examples
+    --------
+
+    >>> reader = fseq.SeqReader(
+    ...     dataSourcePaths=SeqShard('reads.fastq', 0, 2 ** 30))
+    """
+
+    def __init__(self, path, start, end):
+        """
+        Parameters
+        ----------
+
+        path: str
+            The file
+
+        start: int
+            Offset of the first byte of the range
+
+        end: int
+            Offset of the first byte after the range
+        """
+
+        self._path = path
+        self._start = start
+        self._end = end
+        self._fh = open(path, 'rb')
+        self._fh.seek(start)
+        self._position = start
+
+    @property
+    def path(self):
+        """The file: str"""
+        return self._path
+
+    @property
+    def name(self):
+        """The file, as for opened files: str"""
+        return self._path
+
+    @property
+    def start(self):
+        """Offset of the first byte of the range: int"""
+        return self._start
+
+    @property
+    def end(self):
+        """Offset of the first byte after the range: int"""
+        return self._end
+
+    def readline(self):
+        """The next line of the range.
+
+        Returns
+        -------
+
+        bytes
+            Empty when the end of the range is reached
+        """
+
+        if self._position >= self._end:
+            return b''
+
+        line = self._fh.readline(self._end - self._position)
+        self._position += len(line)
+
+        return line
+
+    def close(self):
+        """Closes the file.
+
+        Returns
+        -------
+
+        fseq.reading.seq_shards.SeqShard
+            Returns ``self``
+        """
+
+        self._fh.close()
+        return self
+
+
+def _isRecord(lines, itemSize):
+
+    if len(lines) < itemSize:
+        return False
+
+    if itemSize == 4:
+
+        #A quality line may start with '@' but is then followed by a
+        #header rather than by a sequence and a '+' separator
+        return (lines[0].startswith(b'@') and
+                lines[2].startswith(b'+') and
+                len(lines[1].rstrip(b"\r\n")) ==
+                len(lines[3].rstrip(b"\r\n")) and
+                (len(lines) == 4 or lines[4].startswith(b'@') or
+                 not lines[4].strip()))
+
+    return (lines[0].startswith(b'>') and
+            not lines[1].startswith(b'>'))
+
+
+def recordStart(fh, offset, itemSize=4):
+    """Offset of the first record starting at or after an offset.
+
+    Parameters
+    ----------
+
+    fh: file
+        The file opened in binary mode
+
+    offset: int
+        Where to start looking
+
+    itemSize: int, optional
+        Lines per record, 4 for FASTQ and 2 for single line FASTA
+
+        (Default: 4)
+
+    Returns
+    -------
+
+    int
+        The offset, or that of the end of the file if no record follows
+
+    Raises
+    ------
+
+    ValueError
+        If the item size is not that of a format that can be split
+    """
+
+    if itemSize not in (2, 4):
+        raise ValueError("Can't split records of {0} lines".format(itemSize))
+
+    if offset <= 0:
+        return 0
+
+    #The rest of the line holding the byte before the offset
+    fh.seek(offset - 1)
+    fh.readline()
+
+    while True:
+
+        position = fh.tell()
+        lines = [fh.readline() for _ in range(itemSize + 1)]
+        lines = [line for line in lines if line]
+
+        if not lines:
+            return position
+
+        if _isRecord(lines, itemSize):
+            return position
+
+        fh.seek(position)
+        fh.readline()
+
+
+def shardRanges(path, shards, itemSize=4):
+    """Splits a file into byte ranges of whole records.
+
+    The file is cut evenly and each cut moved forward to the next record
+    start, so that ranges are about equal in size. Ranges that would be
+    empty, as for small files, are left out.
+
+    Parameters
+    ----------
+
+    path: str
+        The file
+
+    shards: int
+        Most ranges wanted
+
+    itemSize: int, optional
+        Lines per record, 4 for FASTQ and 2 for single line FASTA
+
+        (Default: 4)
+
+    Returns
+    -------
+
+    list of tuple
+        The start and end offset of each range
+
+    Raises
+    ------
+
+    ValueError
+        If ``shards`` is not positive or the item size is not that of a
+        format that can be split
+    """
+
+    if shards < 1:
+        raise ValueError("Shards {0} not positive".format(shards))
+
+    size = os.path.getsize(path)
+
+    with open(path, 'rb') as fh:
+        starts = [recordStart(fh, size * i // shards, itemSize)
+                  for i in range(shards)]
+
+    ends = starts[1:] + [size]
+
+    return [(s, e) for s, e in zip(starts, ends) if e > s]
+
+
+def countRecords(path, start, end, itemSize=4, chunkSize=None):
+    """Number of records in a byte range of whole records.
+
+    Parameters
+    ----------
+
+    path: str
+        The file
+
+    start: int
+        Offset of the first byte of the range
+
+    end: int
+        Offset of the first byte after the range
+
+    itemSize: int, optional
+        Lines per record
+
+        (Default: 4)
+
+    chunkSize: int, optional
+        Bytes read at a time
+
+        (Default: ``COUNT_CHUNK_SIZE``)
+
+    Returns
+    -------
+
+    int
+    """
+
+    chunkSize = chunkSize or COUNT_CHUNK_SIZE
+    lines = 0
+    last = b"\n"
+
+    with open(path, 'rb') as fh:
+
+        fh.seek(start)
+        remaining = end - start
+
+        while remaining > 0:
+
+            chunk = fh.read(min(chunkSize, remaining))
+            if not chunk:
+                break
+
+            lines += chunk.count(b"\n")
+            last = chunk[-1:]
+            remaining -= len(chunk)
+
+    #The last line of the file may lack its line break
+    if last != b"\n":
+        lines += 1
+
+    return lines // itemSize
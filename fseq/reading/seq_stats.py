@@ -0,0 +1,348 @@
+#!/usr/bin/env python
+"""Module for collecting timings and counts while reading"""
+
+import sys
+import threading
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+
+def peakMemory():
+    """The peak resident memory of the process so far.
+
+    Returns
+    -------
+
+    int or None
+        Bytes, or ``None`` if not available on the platform
+    """
+
+    if resource is None:
+        return None
+
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    #Linux reports kilobytes while OS X reports bytes
+    if sys.platform != 'darwin':
+        rss *= 1024
+
+    return rss
+
+
+def summarize(sources, wallTime=None):
+    """Summary of a run from the statistics of its sources.
+
+    Parameters
+    ----------
+
+    sources: iterable
+        ``SeqStats`` or their ``SeqStats.asDict`` outputs
+
+    wallTime: float, optional
+        Seconds the run took from start to end, used for the totals'
+        throughput
+
+        (Default: ``None``, the sum of the sources' total times)
+
+    Returns
+    -------
+
+    dict
+        JSON-serializable with the statistics of each source under
+        ``sources`` and totals of records, bytes, stage timings,
+        report timings, records failing each filter predicate, throughput
+        and peak memory under ``total``
+    """
+
+    sources = [isinstance(s, SeqStats) and s.asDict() or s for s in sources]
+
+    timings = dict((k, 0.0) for k in SeqStats.TIMINGS)
+    counts = dict((k, 0) for k in SeqStats.COUNTS)
+    reportTimings = {}
+    filterCounts = {}
+    memory = [peakMemory()]
+
+    for s in sources:
+
+        for k, v in s['timings'].items():
+            timings[k] = timings.get(k, 0.0) + v
+        for k, v in s['counts'].items():
+            if k.startswith('queueHighWater'):
+                counts[k] = max(counts.get(k, 0), v)
+            else:
+                counts[k] = counts.get(k, 0) + v
+        for k, v in s['reportTimings'].items():
+            reportTimings[k] = reportTimings.get(k, 0.0) + v
+        for k, v in s.get('filterCounts', {}).items():
+            filterCounts[k] = filterCounts.get(k, 0) + v
+
+        memory.append(s['peakMemory'])
+
+    memory = [m for m in memory if m is not None]
+
+    if wallTime is None:
+        wallTime = timings['total']
+
+    return dict(
+        sources=sources,
+        total=dict(
+            sources=len(sources),
+            wallTime=wallTime,
+            timings=timings,
+            counts=counts,
+            reportTimings=reportTimings,
+            filterCounts=filterCounts,
+            readsPerSecond=wallTime > 0 and
+            counts['records'] / wallTime or None,
+            MBps=wallTime > 0 and counts['bytes'] / wallTime / 1e6 or None,
+            peakMemory=memory and max(memory) or None))
+
+
+class SeqStats(object):
+    """Timings and counts for the reading and encoding of one data source.
+
+    The ``SeqReader`` fills in one instance per source it reads. Updates
+    from workers and report builders are made under a lock, while the
+    reading loop updates its own counters directly.
+
+    Timings are in seconds and are accumulated per stage:
+
+    detection
+        From start of reading until the format was known
+
+    reading
+        Reading lines from the source, excluding other stages
+
+    queueing
+        Chunking lines into records and handing them to the workers
+
+    encoding
+        Sum of all workers' time spent encoding
+
+    workerIdle
+        Sum of all workers' time spent waiting for records
+
+    growing
+        Enlarging the data array
+
+    draining
+        Waiting for workers to finish after the source was read
+
+    reporting
+        Per report builder, time spent distilling the encoding
+
+    total
+        The full reading of the source
+
+    If a ``SeqFilter`` is used, the records dropped are counted as
+    ``filtered`` and per predicate in ``filterCounts``. If a ``SeqSampler``
+    is used, the records not sampled are counted as ``skipped``.
+
+    Attributes
+    ----------
+
+    source
+    timings
+    counts
+    reportTimings
+    filterCounts
+    readsPerSecond
+    MBps
+    TIMINGS
+    COUNTS
+    """
+
+    TIMINGS = ('detection', 'reading', 'queueing', 'encoding', 'workerIdle',
+               'growing', 'draining', 'total')
+
+    COUNTS = ('lines', 'records', 'bytes', 'grows', 'queueHighWater',
+              'queueHighWaterBytes', 'unparsedHeaders', 'filtered',
+              'skipped')
+
+    def __init__(self, source=None):
+        """
+        Parameters
+        ----------
+
+        source: str, optional
+            The data source the statistics concern
+
+            (Default: ``None``)
+        """
+
+        self._source = source
+        self._lock = threading.Lock()
+        self._timings = dict((k, 0.0) for k in self.TIMINGS)
+        self._counts = dict((k, 0) for k in self.COUNTS)
+        self._reportTimings = {}
+        self._filterCounts = {}
+        self._peakMemory = None
+
+    def __repr__(self):
+
+        return "<SeqStats {0}>".format(self._source)
+
+    def __str__(self):
+
+        return ("{0}: {1} records, {2} lines, {3} bytes in {4:.3f}s " +
+                "({5} reads/s); {6}; grows={7} queueHighWater={8}").format(
+            self._source, self._counts['records'], self._counts['lines'],
+            self._counts['bytes'], self._timings['total'],
+            self.readsPerSecond is not None and
+            int(self.readsPerSecond) or None,
+            ", ".join("{0}={1:.3f}s".format(k, self._timings[k])
+                      for k in self.TIMINGS if k != 'total'),
+            self._counts['grows'], self._counts['queueHighWater'])
+
+    @property
+    def source(self):
+        """The data source: str"""
+        return self._source
+
+    @property
+    def timings(self):
+        """Seconds per stage, see ``SeqStats.TIMINGS``: dict"""
+        return self._timings
+
+    @property
+    def counts(self):
+        """Counts, see ``SeqStats.COUNTS``: dict"""
+        return self._counts
+
+    @property
+    def reportTimings(self):
+        """Seconds per report builder: dict"""
+        return self._reportTimings
+
+    @property
+    def filterCounts(self):
+        """Records failing each filter predicate: dict"""
+        return self._filterCounts
+
+    @property
+    def peakMemory(self):
+        """Peak resident memory of the process when reading completed in
+        bytes: int"""
+        return self._peakMemory
+
+    @property
+    def readsPerSecond(self):
+        """Records read per second of total time: float or None"""
+
+        t = self._timings['total']
+        return t > 0 and self._counts['records'] / t or None
+
+    @property
+    def MBps(self):
+        """Megabytes read per second of total time: float or None"""
+
+        t = self._timings['total']
+        return t > 0 and self._counts['bytes'] / t / 1e6 or None
+
+    def addTiming(self, stage, seconds):
+        """Thread safe accumulation of time to a stage.
+
+        Parameters
+        ----------
+
+        stage: str
+            One of ``SeqStats.TIMINGS``
+
+        seconds: float
+            Time to add
+
+        Returns
+        -------
+
+        fseq.SeqStats
+            Returns ``self``
+        """
+
+        with self._lock:
+            self._timings[stage] += seconds
+
+        return self
+
+    def addCount(self, name, n):
+        """Thread safe accumulation of a count.
+
+        Parameters
+        ----------
+
+        name: str
+            One of ``SeqStats.COUNTS``
+
+        n: int
+            Count to add
+
+        Returns
+        -------
+
+        fseq.SeqStats
+            Returns ``self``
+        """
+
+        with self._lock:
+            self._counts[name] += n
+
+        return self
+
+    def addReportTiming(self, name, seconds):
+        """Thread safe accumulation of time to a report builder.
+
+        Parameters
+        ----------
+
+        name: str
+            Name of the report builder
+
+        seconds: float
+            Time to add
+
+        Returns
+        -------
+
+        fseq.SeqStats
+            Returns ``self``
+        """
+
+        with self._lock:
+            self._reportTimings[name] = \
+                self._reportTimings.get(name, 0.0) + seconds
+
+        return self
+
+    def complete(self):
+        """Marks the reading as complete, recording the peak memory.
+
+        Returns
+        -------
+
+        fseq.SeqStats
+            Returns ``self``
+        """
+
+        self._peakMemory = peakMemory()
+        return self
+
+    def asDict(self):
+        """All statistics as a JSON-serializable ``dict``.
+
+        Returns
+        -------
+
+        dict
+        """
+
+        with self._lock:
+            return dict(source=self._source,
+                        timings=dict(self._timings),
+                        counts=dict(self._counts),
+                        reportTimings=dict(self._reportTimings),
+                        filterCounts=dict(self._filterCounts),
+                        readsPerSecond=self.readsPerSecond,
+                        MBps=self.MBps,
+                        peakMemory=self._peakMemory)
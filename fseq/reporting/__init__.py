@@ -13,4 +13,8 @@ A report makes an image from data sent to it from the builder.
 Purpose of breaking this out is to allow for changing library that produces
 the reports and to allow for quick reuse with similar graphics for identical
 types of graphs for several report-builders.
+
+The statistics-module holds small statistics that builders make of each
+source, which are merged into reports on a whole run without keeping the
+data of the sources.
 """
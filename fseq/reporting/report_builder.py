@@ -4,10 +4,10 @@
 import warnings
 import numpy as np
 
-import scipy.spatial.distance as dist
-import scipy.cluster.hierarchy as hier
+from functools import reduce
 
 import fseq
+from fseq.reporting.report_statistics import PositionStatistics
 
 
 class ReportBuilderBase(object):
@@ -29,6 +29,11 @@ class ReportBuilderBase(object):
 
         (Default: ``None``)
 
+    saveData: bool, optional
+        If reports should save the data they show next to their figures
+
+        (Default: ``None``, leaves it to each report)
+
     *reports: objects, optional
         Any number of reports to be added from start
 
@@ -37,10 +42,16 @@ class ReportBuilderBase(object):
 
     outputRoot
     outputNamePrefix
+    parameters
+    saveData
     DEFAULT_REPORTS
+    BLOCK_SIZE
+    STATISTICS
     """
 
     DEFAULT_REPORTS = tuple()
+    BLOCK_SIZE = 16384
+    STATISTICS = None
 
     def __init__(self, *reports, **kwargs):
         """
@@ -57,6 +68,11 @@ class ReportBuilderBase(object):
 
             (Default: ``None``)
 
+        saveData: bool, optional
+            If reports should save the data they show next to their figures
+
+            (Default: ``None``, leaves it to each report)
+
         *reports: objects, optional
             Any number of reports to be added from start
         """
@@ -69,6 +85,7 @@ class ReportBuilderBase(object):
         self.outputRoot='outputRoot' in kwargs and kwargs['outputRoot'] or None
         self.outputNamePrefix='outputNamePrefix' in kwargs and \
             kwargs['outputNamePrefix'] or None
+        self.saveData = kwargs.get('saveData', None)
         self.addReports(*reports)
 
     def __len__(self):
@@ -104,6 +121,25 @@ class ReportBuilderBase(object):
 
         self._outputRoot = str(val)
 
+    @property
+    def saveData(self):
+        """If reports should save the data they show, ``None`` leaves the
+        decision to the individual reports: bool or None"""
+
+        return self._saveData
+
+    @saveData.setter
+    def saveData(self, val):
+
+        self._saveData = val if val is None else bool(val)
+
+    @property
+    def parameters(self):
+        """The settings of the builder, passed on to the reports so they
+        can be stored together with saved data: dict"""
+
+        return {'builder': type(self).__name__}
+
     def addReports(self, *reports):
         """Adds any number of reports given that the reports exposes a 
         distill method.
@@ -147,6 +183,8 @@ class ReportBuilderBase(object):
         If either ``outputRoot`` or ``outputNamePrefix`` are passed as kwargs,
         the corresponding values preset in the system will be added to the
         kwargs sent to the subreports.
+        The same goes for ``parameters`` and, unless it is ``None``,
+        ``saveData``.
 
         Returns
         -------
@@ -154,18 +192,101 @@ class ReportBuilderBase(object):
         fseq.ReportBuilderBase
             Returns ``self``
         """
-        for k in ('outputRoot', 'outputNamePrefix'):
+
+        return self._distillReports(self._reports, *args, **kwargs)
+
+    def _distillReports(self, reports, *args, **kwargs):
+
+        for k in ('outputRoot', 'outputNamePrefix', 'parameters'):
             if k not in kwargs:
                 kwargs[k] = getattr(self, k) 
 
-        for r in self._reports:
+        if 'saveData' not in kwargs and self.saveData is not None:
+            kwargs['saveData'] = self.saveData
+
+        for r in reports:
             r.distill(*args, **kwargs)
 
         return self
 
+    def summarize(self, data, *args, **kwargs):
+        """Small statistics of the data, of type ``STATISTICS``, that can
+        be merged with those of other sources for reports on a whole run.
+
+        The base builder makes no statistics.
+
+        Parameters
+        ----------
+
+        data: numpy.ndarray
+            The encoding of a source
+
+        Returns
+        -------
+
+        object or None
+            The statistics, ``None`` if the builder makes none
+        """
+
+        return None
+
+    def distillStatistics(self, statistics, *args, **kwargs):
+        """Makes the reports of a source from the statistics that
+        ``summarize`` made of its data, equal to those of ``distill``.
+
+        Parameters
+        ----------
+
+        statistics: object
+            As made by ``summarize``
+
+        Returns
+        -------
+
+        fseq.ReportBuilderBase
+            Returns ``self``
+
+        Raises
+        ------
+
+        NotImplementedError
+            If the builder makes no statistics
+        """
+
+        raise NotImplementedError(
+            "{0} makes no statistics".format(type(self).__name__))
+
+    def distillRun(self, statistics, labels, *args, **kwargs):
+        """Makes the reports of a whole run from the statistics of its
+        sources.
+
+        The base builder makes no run reports.
+
+        Parameters
+        ----------
+
+        statistics: list
+            The statistics of each source, as made by ``summarize``
+
+        labels: list of str
+            The name of each source
+
+        Returns
+        -------
+
+        fseq.ReportBuilderBase
+            Returns ``self``
+        """
+
+        return self
+
+
 class ReportBuilderFFT(ReportBuilderBase):
     """Samples part of data set and performs FFT-based analysis on it.
 
+    The transform is done in blocks of ``BLOCK_SIZE`` rows in single
+    precision, keeping the amplitudes and angles as float32.
+
     Parameters
     ----------
 
@@ -283,19 +404,53 @@ class ReportBuilderFFT(ReportBuilderBase):
     def sampleSize(self, val):
 
         self._sampleSize = val
+
+    @property
+    def parameters(self):
+
+        p = super(ReportBuilderFFT, self).parameters
+        p.update(sampleSize=self.sampleSize,
+                 distanceMetric=self.distanceMetric)
+        return p
     
     def _getLeafOrder(self, A, metric, w=None, V=None, VI=None):
 
-        distMatrix = dist.pdist(A, metric=metric, w=w, V=V, VI=VI)
+        import scipy.spatial.distance as dist
+        import scipy.cluster.hierarchy as hier
 
-        distSquareM = dist.squareform(distMatrix)
+        #Metrics only accept the weights and variances that they use
+        kwargs = {}
+        if w is not None:
+            kwargs['w'] = w
+        if V is not None and metric == 'seuclidean':
+            kwargs['V'] = V
+        if VI is not None and metric == 'mahalanobis':
+            kwargs['VI'] = VI
 
-        linkageM = hier.linkage(distSquareM)
+        distMatrix = dist.pdist(A, metric=metric, **kwargs)
 
-        dendro = hier.dendrogram(linkageM)
+        linkageM = hier.linkage(distMatrix)
+
+        dendro = hier.dendrogram(linkageM, no_plot=True)
 
         return dendro['leaves'] 
 
+    def _transform(self, data):
+
+        nFreqs = data.shape[1] // 2 + 1
+        A = np.empty((data.shape[0], nFreqs), dtype=np.float32)
+        P = np.empty((data.shape[0], nFreqs), dtype=np.float32)
+
+        for start in range(0, data.shape[0], self.BLOCK_SIZE):
+
+            fD = np.fft.rfft(
+                data[start: start + self.BLOCK_SIZE].astype(np.float32),
+                axis=1)
+            A[start: start + self.BLOCK_SIZE] = np.abs(fD)
+            P[start: start + self.BLOCK_SIZE] = np.angle(fD)
+
+        return A, P
+
 
     def distill(self, data, distanceMetric=None, clusterOnAbsOnly=True,
             *args, **kwargs):
@@ -331,11 +486,10 @@ class ReportBuilderFFT(ReportBuilderBase):
 
         D = np.arange(data.shape[0])
         np.random.shuffle(D)
-        data = data[D[:self.sampleSize]]
+        data = data[np.sort(D[:self.sampleSize])]
 
-        fD = np.fft.rfft(data, axis=1)
+        A, P = self._transform(data)
 
-        A = np.abs(fD)
         V = np.std(A, axis=0) 
         O = self._getLeafOrder(A, distanceMetric, V=V)
 
@@ -349,8 +503,8 @@ class ReportBuilderFFT(ReportBuilderBase):
             axisOff=False,
             *args, **kwargs)
 
-        #A = (np.angle(fD) - np.angle(fD[:, :1])) % (2 * np.pi)
-        A = np.angle(fD)
+        #A = (P - P[:, :1]) % (2 * np.pi)
+        A = P
         V = np.std(A, axis=0) 
         if not clusterOnAbsOnly:
             O = self._getLeafOrder(A, distanceMetric, V=V)
@@ -369,6 +523,12 @@ class ReportBuilderFFT(ReportBuilderBase):
 class ReportBuilderPositionAverage(ReportBuilderBase):
     """Per position analysis builder.
 
+    The data is reduced in blocks of ``BLOCK_SIZE`` rows into a
+    ``fseq.PositionStatistics`` of float64 sums and counts, such that no
+    copy of the whole data is made.
+    The statistics of several sources are merged into reports on the
+    whole run, together with an overlay of the average of each source.
+
     Parameters
     ----------
 
@@ -406,6 +566,7 @@ class ReportBuilderPositionAverage(ReportBuilderBase):
     """
 
     DEFAULT_REPORTS = (fseq.LinePlot, )
+    STATISTICS = PositionStatistics
 
     def __init__(self, *reports, **kwargs):
         """
@@ -450,22 +611,38 @@ class ReportBuilderPositionAverage(ReportBuilderBase):
     def undecidedValue(self, val):
         self._undecidedValue = val
 
-    def _floatBin(self, C):
+    @property
+    def parameters(self):
+
+        p = super(ReportBuilderPositionAverage, self).parameters
+        p.update(undecidedValue=self.undecidedValue)
+        return p
+
+    def summarize(self, data, undecidedValue=None, *args, **kwargs):
+        """The per position sums and counts of the data.
+
+        Parameters
+        ----------
+
+        data: numpy.ndarray
+            An array of numerically encoded sequence information
 
-        u = np.unique(C)
-        return np.histogram(C, bins=np.hstack((np.unique(C), (np.inf,))))
+        undecidedValue: float, optional
+            The value that undecided sequence positions are encoded as.
 
-    def _getF(self, X, Y, val):
+            (Default: Value of ``self.undecidedValue``)
 
-        if val not in Y:
-            return 0
+        Returns
+        -------
 
-        return X[Y[:X.size] == val] / X.sum().astype(np.float)
+        fseq.PositionStatistics
+        """
 
-    def _getNotF(self, X, Y, val):
+        if undecidedValue is None:
+            undecidedValue = self.undecidedValue
 
-        pos = Y[:X.size] != val
-        return (X[pos] * Y[pos]).sum() / X.sum().astype(np.float)
+        return PositionStatistics.fromData(data, undecidedValue,
+                                           self.BLOCK_SIZE)
 
     def distill(self, data, undecidedValue=None, *args, **kwargs):
         """The distiller will create reports for several position-type
@@ -507,34 +684,50 @@ class ReportBuilderPositionAverage(ReportBuilderBase):
         fseq.ReportBuilderPositionAverage
             Returns ``self``
         """
-        
-        if undecidedValue is None:
-            undecidedValue = self.undecidedValue
+
+        return self.distillStatistics(self.summarize(data, undecidedValue),
+                                      *args, **kwargs)
+
+    def distillStatistics(self, statistics, *args, **kwargs):
+        """Makes the reports of ``distill`` from the statistics of the
+        data.
+
+        Parameters
+        ----------
+
+        statistics: fseq.PositionStatistics
+            As made by ``summarize``
+
+        *args:
+            Any args will be passed to the ``ReportBuilderBase.distill``
+
+        **kwargs:
+            Any kwargs will be passed to the ``ReportBuilderBase.distill``
+
+        Returns
+        -------
+
+        fseq.ReportBuilderPositionAverage
+            Returns ``self``
+        """
 
         super(ReportBuilderPositionAverage, self).distill(
-            data.mean(axis=0, dtype=np.float),
+            statistics.average,
             outputNamePrefix='average.total.',
             title='Average GC per position',
             xlabel='Read position',
             ylabel='%GC',
             *args, **kwargs)
 
-        freqs, bins = zip(*(self._floatBin(C) for C in data.T))
-        undecidedV = np.ones_like(freqs) * undecidedValue
-
-        lacking = np.frompyfunc(self._getF, 3, 1)
-
         super(ReportBuilderPositionAverage, self).distill(
-            lacking(freqs, bins, undecidedV),
+            statistics.lacking,
             title='Frequency of missing data per position',
             xlabel='Read position',
             ylabel='f',
             outputNamePrefix='average.lacking.', *args, **kwargs)
     
-        notLacking = np.frompyfunc(self._getNotF, 3, 1)
-
         super(ReportBuilderPositionAverage, self).distill(
-            notLacking(freqs, bins, undecidedV),
+            statistics.notLacking,
             title='Average GC per position, omitting uncertain',
             xlabel='Read position',
             ylabel='%GC',
@@ -542,3 +735,1131 @@ class ReportBuilderPositionAverage(ReportBuilderBase):
 
         return self
 
+    def distillRun(self, statistics, labels, *args, **kwargs):
+        """Makes the reports of ``distill`` for the merged statistics of
+        all sources, and an overlay of the average of each source.
+
+        Parameters
+        ----------
+
+        statistics: list of fseq.PositionStatistics
+            The statistics of each source
+
+        labels: list of str
+            The name of each source
+
+        *args:
+            Any args will be passed to the ``ReportBuilderBase.distill``
+
+        **kwargs:
+            Any kwargs will be passed to the ``ReportBuilderBase.distill``
+
+        Returns
+        -------
+
+        fseq.ReportBuilderPositionAverage
+            Returns ``self``
+        """
+
+        self.distillStatistics(reduce(PositionStatistics.merge, statistics),
+                               *args, **kwargs)
+
+        averages = [s.average for s in statistics]
+
+        if all(A.ndim == 1 for A in averages):
+
+            overlay = np.full((max(A.size for A in averages), len(averages)),
+                              np.nan)
+            for i, A in enumerate(averages):
+                overlay[:A.size, i] = A
+
+            super(ReportBuilderPositionAverage, self).distill(
+                overlay,
+                title='Average GC per position per source',
+                xlabel='Read position',
+                ylabel='%GC',
+                labels=list(labels),
+                outputNamePrefix='average.total.overlay.', *args, **kwargs)
+
+        return self
+
+
+
+class ReportBuilderKmer(ReportBuilderBase):
+    """Per position k-mer frequency builder.
+
+    Expects data encoded by ``fseq.SeqEncoderKmer``, i.e. k-mer code plus
+    one with zero for positions lacking a k-mer, and counts the k-mers
+    per position in one pass over blocks of rows.
+
+    Parameters
+    ----------
+
+    outputRoot: str, optional
+        Path to the directory where all reports should be put
+
+        (Default: ``None``)
+
+    outputNamePrefix: str, optional
+        Partial name to be added to all reports done by the builder
+
+        (Default: ``None``)
+
+    k: int
+        Length of the k-mers encoded, at most ``MAX_K``
+
+    *reports: objects, optional
+        Any number of reports to be added from start
+
+        (Default: fseq.HeatMap)
+
+    Attributes
+    ----------
+
+    k
+    BLOCK_SIZE
+    MAX_K
+
+    See also
+    --------
+
+    ReportBuilderBase
+        Base class which implements some more attributes.
+    fseq.SeqEncoderKmer
+        The encoder producing the data
+    """
+
+    DEFAULT_REPORTS = (fseq.HeatMap, )
+    MAX_K = 6
+
+    def __init__(self, *reports, **kwargs):
+        """
+        Parameters
+        ----------
+
+        outputRoot: str, optional
+            Path to the directory where all reports should be put
+
+            (Default: ``None``)
+
+        outputNamePrefix: str, optional
+            Partial name to be added to all reports done by the builder
+
+            (Default: ``None``)
+
+        k: int
+            Length of the k-mers encoded, at most ``MAX_K``
+
+        *reports: objects, optional
+            Any number of reports to be added from start
+
+            (Default: fseq.HeatMap)
+
+        Raises
+        ------
+
+        ValueError
+            If ``k`` is not given or not between 1 and ``MAX_K``
+        """
+
+        if len(reports) == 0:
+            reports = tuple(r() for r in self.DEFAULT_REPORTS)
+
+        super(ReportBuilderKmer, self).__init__(*reports, **kwargs)
+
+        if kwargs.get('k') is None:
+            raise ValueError("The length k of the k-mers must be given")
+
+        self.k = kwargs['k']
+
+    @property
+    def k(self):
+        """Length of the k-mers: int
+
+        The counts take ``width x 4 ** k`` integers, so k is limited to
+        ``MAX_K``.
+
+        Raises
+        ------
+
+        ValueError
+            If trying to assign a k not between 1 and ``MAX_K``
+        """
+        return self._k
+
+    @k.setter
+    def k(self, val):
+
+        self._k = self._validK(val)
+
+    def _validK(self, k):
+
+        k = int(k)
+        if not 0 < k <= self.MAX_K:
+            raise ValueError("k={0} not in [1, {1}]".format(k, self.MAX_K))
+
+        return k
+
+    @property
+    def parameters(self):
+
+        p = super(ReportBuilderKmer, self).parameters
+        p.update(k=self.k)
+        return p
+
+    def _countKmers(self, data, k):
+
+        nKmers = 4 ** k
+        width = data.shape[1]
+        counts = np.zeros(width * nKmers, dtype=np.int64)
+        offsets = np.arange(width, dtype=np.int64) * nKmers - 1
+
+        for start in range(0, data.shape[0], self.BLOCK_SIZE):
+
+            codes = data[start: start + self.BLOCK_SIZE].astype(np.int64)
+            valid = codes > 0
+            counts += np.bincount((codes + offsets)[valid],
+                                  minlength=counts.size)
+
+        return counts.reshape(width, nKmers).T
+
+    def distill(self, data, k=None, *args, **kwargs):
+        """Makes a heatmap of the k-mer frequencies per position.
+
+        Parameters
+        ----------
+
+        data: numpy.ndarray
+            The 2D-array of k-mer encoded data
+
+        k: int, optional
+            Length of the k-mers, overriding the builder's value
+
+            (Default: Value of ``self.k``)
+
+        *args:
+            Any args will be passed to the ``ReportBuilderBase.distill``
+
+        **kwargs:
+            Any kwargs will be passed to the ``ReportBuilderBase.distill``
+
+            **Note:** ``outputNamePrefix`` will be overwritten/added
+
+        Returns
+        -------
+
+        fseq.ReportBuilderKmer
+            Returns ``self``
+        """
+
+        k = self.k if k is None else self._validK(k)
+
+        counts = self._countKmers(data, k)
+        total = counts.sum(axis=0).astype(np.float64)
+        total[total == 0] = 1
+
+        kmers = fseq.SeqEncoderKmer(k=k).kmers
+
+        if 'parameters' not in kwargs:
+            kwargs['parameters'] = self.parameters
+            kwargs['parameters'].update(k=k, kmers=kmers)
+
+        super(ReportBuilderKmer, self).distill(
+            counts / total,
+            outputNamePrefix='kmer.frequency.',
+            title='{0}-mer frequency per position'.format(k),
+            xlabel='Read position',
+            ylabel='{0}-mer'.format(k),
+            axisOff=False,
+            yticklabels=k <= 3 and kmers or None,
+            *args, **kwargs)
+
+        return self
+
+
+class ReportBuilderSpectrogram(ReportBuilderBase):
+    """Short-time FFT builder showing how periodicities change along the
+    reads.
+
+    Each read is cut into windows of ``window`` positions starting every
+    ``stride`` positions, taken as strided views of the data. Each window
+    has its mean removed and is tapered before its real FFT, and the power
+    per window position and frequency is averaged over all, or a sample
+    of, the reads. The reads are transformed in blocks, such that the
+    windows of only a block are held at a time, and the power is summed
+    in float64.
+
+    The power sums and the number of reads are kept as a
+    ``fseq.PositionStatistics``, such that the spectrograms of several
+    sources are merged into one of the whole run.
+
+    Parameters
+    ----------
+
+    outputRoot: str, optional
+        Path to the directory where all reports should be put
+
+        (Default: ``None``)
+
+    outputNamePrefix: str, optional
+        Partial name to be added to all reports done by the builder
+
+        (Default: ``None``)
+
+    window: int, optional
+        Positions in each window
+
+        (Default: 32)
+
+    stride: int, optional
+        Positions between the starts of two windows
+
+        (Default: Half the window)
+
+    sampleSize: int, optional
+        Reads randomly sampled
+
+        (Default: ``None``, all reads)
+
+    taper: bool, optional
+        If windows are tapered by a Hann window
+
+        (Default: ``True``)
+
+    *reports: objects, optional
+        Any number of reports to be added from start
+
+        (Default: fseq.HeatMap)
+
+    Attributes
+    ----------
+
+    window
+    stride
+    sampleSize
+    taper
+    FRAME_BUDGET
+
+    See also
+    --------
+
+    ReportBuilderFFT
+        The FFT of the whole reads
+    fseq.SeqEncoderGCWindow
+        Encoder for long reads and contigs
+    """
+
+    DEFAULT_REPORTS = (fseq.HeatMap, )
+    STATISTICS = PositionStatistics
+    FRAME_BUDGET = 2 ** 22
+    """Values of windows transformed at a time"""
+
+    def __init__(self, *reports, **kwargs):
+        """
+        Parameters
+        ----------
+
+        outputRoot: str, optional
+            Path to the directory where all reports should be put
+
+            (Default: ``None``)
+
+        outputNamePrefix: str, optional
+            Partial name to be added to all reports done by the builder
+
+            (Default: ``None``)
+
+        window: int, optional
+            Positions in each window
+
+            (Default: 32)
+
+        stride: int, optional
+            Positions between the starts of two windows
+
+            (Default: Half the window)
+
+        sampleSize: int, optional
+            Reads randomly sampled
+
+            (Default: ``None``, all reads)
+
+        taper: bool, optional
+            If windows are tapered by a Hann window
+
+            (Default: ``True``)
+
+        *reports: objects, optional
+            Any number of reports to be added from start
+
+            (Default: fseq.HeatMap)
+
+        Raises
+        ------
+
+        ValueError
+            If the window is shorter than 2 or the stride not positive
+        """
+
+        if len(reports) == 0:
+            reports = tuple(r() for r in self.DEFAULT_REPORTS)
+
+        super(ReportBuilderSpectrogram, self).__init__(*reports, **kwargs)
+
+        self.window = kwargs.get('window', 32)
+        self.stride = kwargs.get('stride', None)
+        self.sampleSize = kwargs.get('sampleSize', None)
+        self.taper = kwargs.get('taper', True)
+
+    @property
+    def window(self):
+        """Positions in each window: int"""
+        return self._window
+
+    @window.setter
+    def window(self, val):
+
+        val = int(val)
+        if val < 2:
+            raise ValueError("Window {0} shorter than 2".format(val))
+
+        self._window = val
+
+    @property
+    def stride(self):
+        """Positions between the starts of two windows: int"""
+        return self._stride or max(1, self._window // 2)
+
+    @stride.setter
+    def stride(self, val):
+
+        if val is not None:
+            val = int(val)
+            if val < 1:
+                raise ValueError("Stride {0} not positive".format(val))
+
+        self._stride = val
+
+    @property
+    def sampleSize(self):
+        """Reads sampled, ``None`` for all: int"""
+        return self._sampleSize
+
+    @sampleSize.setter
+    def sampleSize(self, val):
+
+        self._sampleSize = val if val is None else int(val)
+
+    @property
+    def taper(self):
+        """If windows are tapered by a Hann window: bool"""
+        return self._taper
+
+    @taper.setter
+    def taper(self, val):
+
+        self._taper = bool(val)
+
+    @property
+    def parameters(self):
+
+        p = super(ReportBuilderSpectrogram, self).parameters
+        p.update(window=self.window, stride=self.stride,
+                 sampleSize=self.sampleSize, taper=self.taper)
+        return p
+
+    def _windows(self, width):
+
+        return max(0, (width - self._window) // self.stride + 1)
+
+    def _power(self, block, nWindows):
+
+        block = np.ascontiguousarray(block, dtype=np.float32)
+        s0, s1 = block.strides
+
+        frames = np.lib.stride_tricks.as_strided(
+            block, shape=(block.shape[0], nWindows, self._window),
+            strides=(s0, self.stride * s1, s1), writeable=False)
+
+        frames = frames - frames.mean(axis=2, keepdims=True)
+        if self._taper:
+            frames *= np.hanning(self._window).astype(np.float32)
+
+        F = np.fft.rfft(frames, axis=2)
+
+        return (F.real ** 2 + F.imag ** 2).sum(axis=0, dtype=np.float64)
+
+    def summarize(self, data, *args, **kwargs):
+        """The summed power per window position and frequency.
+
+        Parameters
+        ----------
+
+        data: numpy.ndarray
+            The 2D-array of numerically encoded reads
+
+        Returns
+        -------
+
+        fseq.PositionStatistics
+            Where the sums are of shape ``(windows, frequencies)`` and the
+            count is the number of reads transformed
+        """
+
+        if self._sampleSize is not None and \
+                self._sampleSize < data.shape[0]:
+
+            D = np.arange(data.shape[0])
+            np.random.shuffle(D)
+            data = data[np.sort(D[:self._sampleSize])]
+
+        nWindows = self._windows(data.shape[1])
+        nFreqs = self._window // 2 + 1
+        sums = np.zeros((nWindows, nFreqs), dtype=np.float64)
+
+        if nWindows:
+
+            rows = max(1, min(self.BLOCK_SIZE,
+                              self.FRAME_BUDGET // (nWindows * self._window)))
+
+            for start in range(0, data.shape[0], rows):
+                sums += self._power(data[start: start + rows], nWindows)
+
+        return PositionStatistics(data.shape[0], sums)
+
+    def distill(self, data, *args, **kwargs):
+        """Makes a heatmap of the average power per window position and
+        frequency.
+
+        Parameters
+        ----------
+
+        data: numpy.ndarray
+            The 2D-array of numerically encoded reads
+
+        *args:
+            Any args will be passed to the ``ReportBuilderBase.distill``
+
+        **kwargs:
+            Any kwargs will be passed to the ``ReportBuilderBase.distill``
+
+            **Note:** ``outputNamePrefix`` will be overwritten/added
+
+        Returns
+        -------
+
+        fseq.ReportBuilderSpectrogram
+            Returns ``self``
+        """
+
+        return self.distillStatistics(self.summarize(data), *args, **kwargs)
+
+    def distillStatistics(self, statistics, *args, **kwargs):
+        """Makes the heatmap of ``distill`` from the summed power.
+
+        Parameters
+        ----------
+
+        statistics: fseq.PositionStatistics
+            As made by ``summarize``
+
+        *args:
+            Any args will be passed to the ``ReportBuilderBase.distill``
+
+        **kwargs:
+            Any kwargs will be passed to the ``ReportBuilderBase.distill``
+
+        Returns
+        -------
+
+        fseq.ReportBuilderSpectrogram
+            Returns ``self``
+        """
+
+        frequencies = np.fft.rfftfreq(self._window)
+
+        if 'parameters' not in kwargs:
+            kwargs['parameters'] = self.parameters
+            kwargs['parameters'].update(
+                count=statistics.count,
+                windowStarts=list(range(0, statistics.sums.shape[0] *
+                                        self.stride, self.stride)),
+                frequencies=frequencies.tolist())
+
+        super(ReportBuilderSpectrogram, self).distill(
+            statistics.average.T,
+            outputNamePrefix='spectrogram.power.',
+            title='Average power per window of {0} positions'.format(
+                self._window),
+            xlabel='Window (every {0} positions)'.format(self.stride),
+            ylabel='Frequency (cycles per position)',
+            axisOff=False,
+            yticklabels=frequencies.size <= 33 and
+            ["{0:.3g}".format(f) for f in frequencies] or None,
+            *args, **kwargs)
+
+        return self
+
+    def distillRun(self, statistics, labels, *args, **kwargs):
+        """Makes the heatmap of ``distill`` for the merged power of all
+        sources.
+
+        Parameters
+        ----------
+
+        statistics: list of fseq.PositionStatistics
+            The statistics of each source
+
+        labels: list of str
+            The name of each source
+
+        Returns
+        -------
+
+        fseq.ReportBuilderSpectrogram
+            Returns ``self``
+        """
+
+        return self.distillStatistics(
+            reduce(PositionStatistics.merge, statistics), *args, **kwargs)
+
+
+class ReportBuilderPeriodicity(ReportBuilderBase):
+    """Scores every read for periodicity at a few given periods, such as
+    the about 10.4 positions of the helical periodicity of nucleosome
+    bound DNA.
+
+    Instead of a full FFT, each read with its mean removed is projected
+    onto the cosines and sines of the given periods only, as one matrix
+    product per block of ``BLOCK_SIZE`` reads with a basis of
+    ``width x 2 periods``, which costs ``O(reads x width x periods)``.
+
+    The score of a read at a period is the power there over the read's
+    total power, scaled such that a pure sinusoid of that period scores 1
+    and a read without variation 0.
+
+    In one pass over the data it produces the score of every read, sent
+    to the ``perReadReports``, and the distribution of the scores of each
+    period, sent to the other reports.
+
+    Parameters
+    ----------
+
+    outputRoot: str, optional
+        Path to the directory where all reports should be put
+
+        (Default: ``None``)
+
+    outputNamePrefix: str, optional
+        Partial name to be added to all reports done by the builder
+
+        (Default: ``None``)
+
+    periods: float or sequence of float, optional
+        The periods in positions
+
+        (Default: ``(10.4, )``)
+
+    bins: int, optional
+        Bins of the distribution of scores between 0 and 1
+
+        (Default: 50)
+
+    perReadReports: sequence of reports, optional
+        Reports getting the ``(reads, periods)`` array of scores
+
+        (Default: A fseq.ArrayReport)
+
+    *reports: objects, optional
+        Any number of reports to be added from start
+
+        (Default: fseq.LinePlot)
+
+    Attributes
+    ----------
+
+    periods
+    bins
+    perReadReports
+
+    See also
+    --------
+
+    ReportBuilderFFT
+        The full FFT of a sample of the reads
+    """
+
+    DEFAULT_REPORTS = (fseq.LinePlot, )
+    DEFAULT_PER_READ_REPORTS = (fseq.ArrayReport, )
+
+    def __init__(self, *reports, **kwargs):
+        """
+        Parameters
+        ----------
+
+        outputRoot: str, optional
+            Path to the directory where all reports should be put
+
+            (Default: ``None``)
+
+        outputNamePrefix: str, optional
+            Partial name to be added to all reports done by the builder
+
+            (Default: ``None``)
+
+        periods: float or sequence of float, optional
+            The periods in positions
+
+            (Default: ``(10.4, )``)
+
+        bins: int, optional
+            Bins of the distribution of scores between 0 and 1
+
+            (Default: 50)
+
+        perReadReports: sequence of reports, optional
+            Reports getting the ``(reads, periods)`` array of scores
+
+            (Default: A fseq.ArrayReport)
+
+        *reports: objects, optional
+            Any number of reports to be added from start
+
+            (Default: fseq.LinePlot)
+
+        Raises
+        ------
+
+        ValueError
+            If a period is not above 1 or the number of bins not positive
+        """
+
+        if len(reports) == 0:
+            reports = tuple(r() for r in self.DEFAULT_REPORTS)
+
+        super(ReportBuilderPeriodicity, self).__init__(*reports, **kwargs)
+
+        self.periods = kwargs.get('periods', (10.4, ))
+        self.bins = kwargs.get('bins', 50)
+
+        perReadReports = kwargs.get('perReadReports', None)
+        if perReadReports is None:
+            perReadReports = tuple(
+                r() for r in self.DEFAULT_PER_READ_REPORTS)
+
+        self._perReadReports = tuple(perReadReports)
+
+    @property
+    def periods(self):
+        """The periods in positions: tuple of float"""
+        return self._periods
+
+    @periods.setter
+    def periods(self, val):
+
+        if np.isscalar(val):
+            val = (val, )
+
+        val = tuple(float(p) for p in val)
+        if not val or min(val) <= 1:
+            raise ValueError("Periods {0} must be above 1".format(val))
+
+        self._periods = val
+
+    @property
+    def bins(self):
+        """Bins of the distribution of scores: int"""
+        return self._bins
+
+    @bins.setter
+    def bins(self, val):
+
+        val = int(val)
+        if val < 1:
+            raise ValueError("Bins {0} not positive".format(val))
+
+        self._bins = val
+
+    @property
+    def perReadReports(self):
+        """Reports getting the scores of each read: tuple"""
+        return self._perReadReports
+
+    @property
+    def parameters(self):
+
+        p = super(ReportBuilderPeriodicity, self).parameters
+        p.update(periods=list(self.periods), bins=self.bins)
+        return p
+
+    def _basis(self, width):
+
+        angles = 2 * np.pi * np.arange(width, dtype=np.float64)[:, None] / \
+            np.array(self._periods)[None, :]
+
+        return np.hstack((np.cos(angles), np.sin(angles))).astype(np.float32)
+
+    def scores(self, data):
+        """The periodicity score of each read at each period.
+
+        Parameters
+        ----------
+
+        data: numpy.ndarray
+            The 2D-array of numerically encoded reads
+
+        Returns
+        -------
+
+        numpy.ndarray
+            float32 array of shape ``(reads, periods)``
+        """
+
+        nPeriods = len(self._periods)
+        width = data.shape[1]
+        basis = self._basis(width)
+        scores = np.zeros((data.shape[0], nPeriods), dtype=np.float32)
+
+        for start in range(0, data.shape[0], self.BLOCK_SIZE):
+
+            X = data[start: start + self.BLOCK_SIZE].astype(np.float32)
+            X -= X.mean(axis=1, keepdims=True)
+
+            Y = np.dot(X, basis)
+            power = Y[:, :nPeriods] ** 2 + Y[:, nPeriods:] ** 2
+            energy = (X ** 2).sum(axis=1) * (width / 2.0)
+
+            np.divide(power, energy[:, None],
+                      out=scores[start: start + self.BLOCK_SIZE],
+                      where=energy[:, None] > 0)
+
+        return scores
+
+    def distribution(self, scores):
+        """The fraction of reads per bin of scores for each period.
+
+        Scores above 1, possible for short reads and periods that don't
+        divide the width, count in the last bin.
+
+        Parameters
+        ----------
+
+        scores: numpy.ndarray
+            As made by ``scores``
+
+        Returns
+        -------
+
+        numpy.ndarray
+            Array of shape ``(bins, periods)``
+        """
+
+        index = np.minimum((scores * self._bins).astype(np.int64),
+                           self._bins - 1)
+        counts = np.array(
+            [np.bincount(index[:, i], minlength=self._bins)
+             for i in range(scores.shape[1])], dtype=np.float64).T
+
+        return counts / max(1, scores.shape[0])
+
+    def distill(self, data, *args, **kwargs):
+        """Makes the reports of the scores of each read and of their
+        distribution.
+
+        Parameters
+        ----------
+
+        data: numpy.ndarray
+            The 2D-array of numerically encoded reads
+
+        *args:
+            Any args will be passed to the ``ReportBuilderBase.distill``
+
+        **kwargs:
+            Any kwargs will be passed to the ``ReportBuilderBase.distill``
+
+            **Note:** ``outputNamePrefix`` will be overwritten/added
+
+        Returns
+        -------
+
+        fseq.ReportBuilderPeriodicity
+            Returns ``self``
+        """
+
+        scores = self.scores(data)
+        labels = ["{0:g} positions".format(p) for p in self._periods]
+
+        parameters = kwargs.pop('parameters', None) or self.parameters
+        parameters = dict(parameters, mean=scores.mean(axis=0).tolist())
+
+        self._distillReports(
+            self._perReadReports, scores,
+            outputNamePrefix='periodicity.reads.',
+            title='Periodicity score per read',
+            xlabel=', '.join(labels),
+            ylabel='Read n',
+            parameters=parameters,
+            *args, **kwargs)
+
+        super(ReportBuilderPeriodicity, self).distill(
+            self.distribution(scores),
+            outputNamePrefix='periodicity.distribution.',
+            title='Distribution of periodicity scores',
+            xlabel='Score (bins of {0:g})'.format(1.0 / self._bins),
+            ylabel='Fraction of reads',
+            labels=labels,
+            parameters=parameters,
+            *args, **kwargs)
+
+        return self
+
+
+class ReportBuilderSpectralFeatures(ReportBuilderBase):
+    """Makes a table of spectral features of every read.
+
+    Each read with its mean removed is transformed with ``numpy.fft.rfft``
+    in blocks of ``BLOCK_SIZE`` reads in single precision, and reduced to
+    a row of ``FEATURES_DTYPE``, 20 bytes per read, such that the table of
+    a whole run can be scanned for outliers without the encoding.
+
+    The features are
+
+    ``dominantFrequency``
+        Frequency in cycles per position with the most power
+    ``entropy``
+        Entropy of the power spectrum, normalized to be 1 for a flat
+        spectrum
+    ``bandRatio``
+        Power at frequencies up to ``split`` over that above, which is
+        ``inf`` if there is no power above
+    ``mean``
+        The mean of the read, the GC-content for the GC encoding
+    ``variance``
+        The variance of the read
+
+    Reads without variation have all spectral features 0.
+
+    Each read is taken over its own length, up to its first NaN unless
+    the lengths are given, as the zeros that pad shorter reads are also
+    the code of A and T. For reads of mixed lengths, either pass their
+    lengths or read them into an array filled with NaN, e.g. through
+    ``fseq.SeqReader.dataArrayConstructor``.
+
+    Parameters
+    ----------
+
+    outputRoot: str, optional
+        Path to the directory where all reports should be put
+
+        (Default: ``None``)
+
+    outputNamePrefix: str, optional
+        Partial name to be added to all reports done by the builder
+
+        (Default: ``None``)
+
+    split: float, optional
+        Frequency in cycles per position between the low and high band
+
+        (Default: 0.25)
+
+    *reports: objects, optional
+        Any number of reports to be added from start
+
+        (Default: fseq.ArrayReport)
+
+    Attributes
+    ----------
+
+    split
+    FEATURES_DTYPE
+
+    Examples
+    --------
+
+    >>> table = fseq.ReportBuilderSpectralFeatures().features(data)
+    >>> table[table['entropy'] < 0.5]
+
+    >>> seqReader = fseq.SeqReader(
+    ...     dataSourcePaths='reads.fastq', reportBuilders=(),
+    ...     dataArrayConstructor=lambda s, dtype: np.full(s, np.nan, dtype))
+    >>> table = fseq.ReportBuilderSpectralFeatures().features(
+    ...     seqReader.next())
+    """
+
+    DEFAULT_REPORTS = (fseq.ArrayReport, )
+    FEATURES_DTYPE = np.dtype([
+        ('dominantFrequency', np.float32), ('entropy', np.float32),
+        ('bandRatio', np.float32), ('mean', np.float32),
+        ('variance', np.float32)])
+
+    def __init__(self, *reports, **kwargs):
+        """
+        Parameters
+        ----------
+
+        outputRoot: str, optional
+            Path to the directory where all reports should be put
+
+            (Default: ``None``)
+
+        outputNamePrefix: str, optional
+            Partial name to be added to all reports done by the builder
+
+            (Default: ``None``)
+
+        split: float, optional
+            Frequency in cycles per position between the low and high band
+
+            (Default: 0.25)
+
+        *reports: objects, optional
+            Any number of reports to be added from start
+
+            (Default: fseq.ArrayReport)
+
+        Raises
+        ------
+
+        ValueError
+            If the split is not between 0 and 0.5
+        """
+
+        if len(reports) == 0:
+            reports = tuple(r() for r in self.DEFAULT_REPORTS)
+
+        super(ReportBuilderSpectralFeatures, self).__init__(
+            *reports, **kwargs)
+
+        self.split = kwargs.get('split', 0.25)
+
+    @property
+    def split(self):
+        """Frequency between the low and high band: float"""
+        return self._split
+
+    @split.setter
+    def split(self, val):
+
+        val = float(val)
+        if not 0 < val < 0.5:
+            raise ValueError("Split {0} not between 0 and 0.5".format(val))
+
+        self._split = val
+
+    @property
+    def parameters(self):
+
+        p = super(ReportBuilderSpectralFeatures, self).parameters
+        p.update(split=self.split, fields=list(self.FEATURES_DTYPE.names))
+        return p
+
+    def features(self, data, lengths=None):
+        """The spectral features of each read.
+
+        Parameters
+        ----------
+
+        data: numpy.ndarray
+            The 2D-array of numerically encoded reads
+
+        lengths: numpy.ndarray, optional
+            The number of positions of each read, the rest of its row
+            being padding.
+            (Default: Each read up to its first NaN)
+
+        Returns
+        -------
+
+        numpy.ndarray
+            Structured array of ``FEATURES_DTYPE`` with a row per read
+        """
+
+        width = data.shape[1]
+        table = np.zeros((data.shape[0], ), dtype=self.FEATURES_DTYPE)
+
+        for start in range(0, data.shape[0], self.BLOCK_SIZE):
+
+            X = data[start: start + self.BLOCK_SIZE].astype(np.float32)
+            rows = table[start: start + self.BLOCK_SIZE]
+
+            if lengths is None:
+                padded = np.isnan(X)
+                L = np.where(padded.any(axis=1), padded.argmax(axis=1), width)
+            else:
+                L = np.clip(np.asarray(
+                    lengths[start: start + self.BLOCK_SIZE]), 0, width)
+
+            #Reads of the same length share their frequencies
+            for length in np.unique(L[L > 0]):
+                same = np.flatnonzero(L == length)
+                rows[same] = self._features(X[same, :length])
+
+        return table
+
+    def _features(self, X):
+
+        frequencies = np.fft.rfftfreq(X.shape[1])[1:]
+        low = frequencies <= self._split
+        flat = np.log(max(2, frequencies.size))
+
+        rows = np.zeros((X.shape[0], ), dtype=self.FEATURES_DTYPE)
+
+        rows['mean'] = X.mean(axis=1)
+        X = X - rows['mean'][:, None]
+        rows['variance'] = (X ** 2).mean(axis=1)
+
+        P = np.abs(np.fft.rfft(X, axis=1)[:, 1:]) ** 2
+        total = P.sum(axis=1)
+        varied = total > 0
+
+        P = P[varied] / total[varied, None]
+
+        rows['dominantFrequency'][varied] = frequencies[P.argmax(axis=1)]
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+
+            rows['entropy'][varied] = -np.where(
+                P > 0, P * np.log(P), 0).sum(axis=1) / flat
+
+            rows['bandRatio'][varied] = \
+                P[:, low].sum(axis=1) / P[:, ~low].sum(axis=1)
+
+        return rows
+
+    def distill(self, data, lengths=None, *args, **kwargs):
+        """Makes the table of spectral features of the reads.
+
+        Parameters
+        ----------
+
+        data: numpy.ndarray
+            The 2D-array of numerically encoded reads
+
+        lengths: numpy.ndarray, optional
+            The number of positions of each read, see
+            ``ReportBuilderSpectralFeatures.features``.
+            (Default: Each read up to its first NaN)
+
+        *args:
+            Any args will be passed to the ``ReportBuilderBase.distill``
+
+        **kwargs:
+            Any kwargs will be passed to the ``ReportBuilderBase.distill``
+
+            **Note:** ``outputNamePrefix`` will be overwritten/added
+
+        Returns
+        -------
+
+        fseq.ReportBuilderSpectralFeatures
+            Returns ``self``
+        """
+
+        return super(ReportBuilderSpectralFeatures, self).distill(
+            self.features(data, lengths),
+            outputNamePrefix='spectral.features.',
+            title='Spectral features per read',
+            xlabel=', '.join(self.FEATURES_DTYPE.names),
+            ylabel='Read n', *args, **kwargs)
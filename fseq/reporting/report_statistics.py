@@ -0,0 +1,256 @@
+#!/usr/bin/env python
+"""Module for small statistics of encodings that can be merged across
+sources"""
+
+import numpy as np
+
+
+class PositionStatistics(object):
+    """Per position sums and counts of an encoding.
+
+    The statistics are small, of the size of a row of the encoding, and
+    can be merged associatively, such that the statistics of many sources
+    can be combined into those of a whole run without keeping any of the
+    encodings.
+
+    Attributes
+    ----------
+
+    count
+    sums
+    undecided
+    undecidedValue
+    average
+    lacking
+    notLacking
+
+    Examples
+    --------
+
+    >>> run = sum((fseq.PositionStatistics.fromData(D) for D in encodings),
+    ...           fseq.PositionStatistics())
+    >>> run.average
+    """
+
+    def __init__(self, count=0, sums=None, undecided=None,
+                 undecidedValue=0.5):
+        """
+        Parameters
+        ----------
+
+        count: int, optional
+            Number of rows summed
+
+            (Default: 0)
+
+        sums: array-like, optional
+            Per position sums
+
+            (Default: ``None``, nothing summed)
+
+        undecided: array-like, optional
+            Per position counts of the undecided value
+
+            (Default: ``None``, nothing counted)
+
+        undecidedValue: float, optional
+            The value that undecided positions are encoded as
+
+            (Default: 0.5)
+
+        Raises
+        ------
+
+        ValueError
+            If the sums and counts differ in shape
+        """
+
+        if sums is None:
+            sums = np.zeros((0, ), dtype=np.float64)
+        if undecided is None:
+            undecided = np.zeros(np.shape(sums), dtype=np.int64)
+
+        self._count = int(count)
+        self._sums = np.asarray(sums, dtype=np.float64)
+        self._undecided = np.asarray(undecided, dtype=np.int64)
+        self._undecidedValue = float(undecidedValue)
+
+        if self._sums.shape != self._undecided.shape:
+            raise ValueError("Sums {0} and undecided {1} differ in shape".format(
+                self._sums.shape, self._undecided.shape))
+
+    @classmethod
+    def fromData(cls, data, undecidedValue=0.5, blockSize=16384):
+        """The statistics of an encoding.
+
+        The data is reduced in blocks of rows into float64 sums and int64
+        counts, such that no copy of the whole data is made.
+
+        Parameters
+        ----------
+
+        data: numpy.ndarray
+            The encoding
+
+        undecidedValue: float, optional
+            The value that undecided positions are encoded as
+
+            (Default: 0.5)
+
+        blockSize: int, optional
+            Rows reduced at a time
+
+            (Default: 16384)
+
+        Returns
+        -------
+
+        fseq.PositionStatistics
+        """
+
+        sums = np.zeros(data.shape[1:], dtype=np.float64)
+        undecided = np.zeros(data.shape[1:], dtype=np.int64)
+
+        for start in range(0, data.shape[0], blockSize):
+
+            block = data[start: start + blockSize]
+            sums += block.sum(axis=0, dtype=np.float64)
+            undecided += np.count_nonzero(block == undecidedValue, axis=0)
+
+        return cls(data.shape[0], sums, undecided, undecidedValue)
+
+    @classmethod
+    def fromDict(cls, d):
+        """The statistics from their ``dict`` representation.
+
+        Parameters
+        ----------
+
+        d: dict
+            As made by ``PositionStatistics.asDict``
+
+        Returns
+        -------
+
+        fseq.PositionStatistics
+        """
+
+        return cls(d['count'], d['sums'], d['undecided'], d['undecidedValue'])
+
+    @property
+    def count(self):
+        """Number of rows summed: int"""
+        return self._count
+
+    @property
+    def sums(self):
+        """Per position sums: numpy.ndarray"""
+        return self._sums
+
+    @property
+    def undecided(self):
+        """Per position counts of the undecided value: numpy.ndarray"""
+        return self._undecided
+
+    @property
+    def undecidedValue(self):
+        """The value that undecided positions are encoded as: float"""
+        return self._undecidedValue
+
+    @property
+    def average(self):
+        """Per position average as encoded: numpy.ndarray"""
+
+        return self._sums / max(1, self._count)
+
+    @property
+    def lacking(self):
+        """Per position frequency of undecided values: numpy.ndarray"""
+
+        return self._undecided / float(max(1, self._count))
+
+    @property
+    def notLacking(self):
+        """Per position sum of the values that are not undecided over the
+        number of rows: numpy.ndarray"""
+
+        return (self._sums - self._undecided * self._undecidedValue) / \
+            max(1, self._count)
+
+    @staticmethod
+    def _padded(A, shape):
+
+        if A.shape == shape:
+            return A
+
+        P = np.zeros(shape, dtype=A.dtype)
+        P[tuple(slice(0, n) for n in A.shape)] = A
+
+        return P
+
+    def merge(self, other):
+        """The statistics of both together.
+
+        Positions only present in one of them, as when the encodings
+        differ in width, count as summing to zero in the other.
+
+        Parameters
+        ----------
+
+        other: fseq.PositionStatistics
+            The statistics to merge with
+
+        Returns
+        -------
+
+        fseq.PositionStatistics
+            New merged statistics
+
+        Raises
+        ------
+
+        ValueError
+            If the statistics use different undecided values or differ in
+            number of dimensions
+        """
+
+        if other._count and self._count and \
+                other._undecidedValue != self._undecidedValue:
+
+            raise ValueError("Undecided values differ ({0} and {1})".format(
+                self._undecidedValue, other._undecidedValue))
+
+        if not self._sums.size:
+            return other
+        if not other._sums.size:
+            return self
+
+        if self._sums.ndim != other._sums.ndim:
+            raise ValueError("Can't merge {0} with {1} dimensions".format(
+                self._sums.ndim, other._sums.ndim))
+
+        shape = tuple(max(a, b) for a, b in
+                      zip(self._sums.shape, other._sums.shape))
+
+        return PositionStatistics(
+            self._count + other._count,
+            self._padded(self._sums, shape) +
+            self._padded(other._sums, shape),
+            self._padded(self._undecided, shape) +
+            self._padded(other._undecided, shape),
+            self._undecidedValue if self._count else other._undecidedValue)
+
+    __add__ = merge
+
+    def asDict(self):
+        """JSON-serializable representation.
+
+        Returns
+        -------
+
+        dict
+        """
+
+        return dict(count=self._count, sums=self._sums.tolist(),
+                    undecided=self._undecided.tolist(),
+                    undecidedValue=self._undecidedValue)
@@ -1,12 +1,56 @@
 #!/usr/bin/env python
-"""Module for holding the various implemented reporting classes"""
+"""Module for holding the various implemented reporting classes.
 
-import matplotlib
-matplotlib.use('Agg')
-import matplotlib.pyplot as plt
+Figures are drawn on new pyplot figures that are closed once saved, while
+holding a lock for the process, as pyplot's state is global and shared by
+the report threads of all readers, such as those of the jobs of a
+``fseq.server.SeqServer``.
+"""
+
+import numpy as np
 import os
+import json
+import threading
 import warnings
 
+from contextlib import contextmanager
+
+_plt = None
+_RENDER_LOCK = threading.RLock()
+
+
+def _pyplot():
+    """Imports matplotlib on first use, such that reading data does not
+    require nor pay for it."""
+
+    global _plt
+
+    if _plt is None:
+        import matplotlib
+        matplotlib.use('Agg')
+        import matplotlib.pyplot as plt
+        _plt = plt
+
+    return _plt
+
+
+@contextmanager
+def _figure():
+    """A new figure, drawn and saved while holding a lock on the global
+    state of pyplot, shared by the report threads of all readers in the
+    process, and closed when done."""
+
+    plt = _pyplot()
+
+    with _RENDER_LOCK:
+
+        f = plt.figure()
+
+        try:
+            yield plt, f
+        finally:
+            plt.close(f)
+
 
 class ReportBase(object):
     """Base class for simple report creations.
@@ -32,15 +76,22 @@ class ReportBase(object):
 
         (Default: Empty ``dict``)
 
+    saveData: bool, optional
+        If the data plotted should also be saved next to the figure
+
+        (Default: ``False``)
+
     Attributes
     ----------
 
     name
     saveArgs
     saveKwargs
+    saveData
     """
 
-    def __init__(self, name=None, saveArgs=tuple(), saveKwargs=dict()):
+    def __init__(self, name=None, saveArgs=tuple(), saveKwargs=dict(),
+            saveData=False):
         """
         Parameters
         ----------
@@ -59,11 +110,17 @@ class ReportBase(object):
             Any keyword args to be passed to ``matplotlib.savefig``
 
             (Default: Empty ``dict``)
+
+        saveData: bool, optional
+            If the data plotted should also be saved next to the figure
+
+            (Default: ``False``)
         """
 
         self.name = name
         self.saveArgs = saveArgs
         self.saveKwargs = saveKwargs
+        self.saveData = saveData
 
     @property
     def name(self):
@@ -97,6 +154,47 @@ class ReportBase(object):
 
         self._saveKwargs = kwargs
 
+    @property
+    def saveData(self):
+        """If the data of the report is saved as ``.npy`` (or ``.npz``) with
+        a ``.json`` sidecar describing it next to the figure: bool
+
+        See also
+        --------
+
+        ReportBase.saveArray
+            The method writing the data
+        """
+
+        return self._saveData
+
+    @saveData.setter
+    def saveData(self, val):
+
+        self._saveData = bool(val)
+
+    def _getPath(self, outputRoot, outputNamePrefix, name):
+
+        if name is None:
+            name = self._name
+            if name is None:
+                raise ValueError("Can't save file when no name give to report")
+
+        if outputRoot is None:
+            outputRoot = ''
+
+        if outputNamePrefix is None:
+            outputNamePrefix = ''
+
+        path = os.path.join(outputRoot, outputNamePrefix + name)
+
+        try:
+            os.makedirs(os.path.dirname(path))
+        except OSError:
+            pass
+
+        return path
+
     def saveFig(self, fig, outputRoot, outputNamePrefix, name=None,
             *args, **kwargs):
         """Saves a figure and creates directories if needed.
@@ -144,17 +242,7 @@ class ReportBase(object):
             If no name has been given.
         """
 
-        if name is None:
-            name = self._name
-            if name is None:
-                raise ValueError("Can't save file when no name give to report")
-
-        path = os.path.join(outputRoot, outputNamePrefix + name)
-
-        try:
-            os.makedirs(os.path.dirname(path))
-        except OSError:
-            pass
+        path = self._getPath(outputRoot, outputNamePrefix, name)
 
         if len(args) == 0:
             args = self.saveArgs
@@ -168,6 +256,92 @@ class ReportBase(object):
 
         return self
 
+    def saveArray(self, data, outputRoot, outputNamePrefix, name=None,
+            **meta):
+        """Saves the data of a report together with a ``.json`` sidecar.
+
+        The files get the same base path as the figure would get, but with
+        the figure's file-extension replaced.
+        A single array is saved as ``.npy`` while a ``dict`` of arrays is
+        saved as ``.npz``.
+
+        Parameters
+        ----------
+
+        data: numpy.ndarray or dict
+            The data shown in the report, or a ``dict`` of named arrays
+
+        outputRoot: str
+            The root directory for reports
+
+        outputNamePrefix: str
+            If the name of the file should be prepended by some string.
+            Normally added by the *Report Builder*
+
+        name: str, optional
+            A specific name for the figure-file that the data belongs to.
+
+            (Default: Use the ``self.name`` of the instance)
+
+        **meta:
+            Any further information to be stored in the sidecar, e.g.
+            ``title``, ``xlabel``, ``ylabel`` and ``parameters``.
+            Values that can't be represented in JSON are stored as strings.
+
+        Returns
+        -------
+
+        ReportBase
+            Returns ``self``
+
+        Raises
+        ------
+
+        ValueError
+            If no name has been given.
+        """
+
+        path = self._getPath(outputRoot, outputNamePrefix, name)
+        base = os.path.splitext(path)[0]
+
+        if isinstance(data, dict):
+
+            arrays = dict((k, self._asArray(v)) for k, v in data.items())
+            dataPath = base + ".npz"
+            print("Saving -> {0}".format(dataPath))
+            np.savez(dataPath, **arrays)
+            meta['shape'] = dict((k, v.shape) for k, v in arrays.items())
+            meta['dtype'] = dict((k, str(v.dtype)) for k, v in arrays.items())
+
+        else:
+
+            data = self._asArray(data)
+            dataPath = base + ".npy"
+            print("Saving -> {0}".format(dataPath))
+            np.save(dataPath, data)
+            meta['shape'] = data.shape
+            meta['dtype'] = str(data.dtype)
+
+        meta['figure'] = os.path.basename(path)
+        meta['data'] = os.path.basename(dataPath)
+
+        with open(base + ".json", 'w') as fh:
+            json.dump(meta, fh, indent=2, sort_keys=True, default=str)
+
+        return self
+
+    def _asArray(self, data):
+
+        data = np.asarray(data)
+
+        if data.dtype == object:
+            try:
+                data = data.astype(np.float64)
+            except (TypeError, ValueError):
+                pass
+
+        return data
+
     def distill(self, data, outputRoot=None, outputNamePrefix=None,
             *args, **kwargs):
         """Placeholder distill interface not to be used.
@@ -202,9 +376,15 @@ class HeatMap(ReportBase):
         Any keyword args to be passed to ``matplotlib.savefig``
 
         (Default: Empty dict)
+
+    saveData: bool, optional
+        If the data plotted should also be saved next to the figure
+
+        (Default: ``False``)
     """
 
-    def __init__(self, name='heatmap.pdf', saveArgs=tuple(), saveKwargs=dict()):
+    def __init__(self, name='heatmap.pdf', saveArgs=tuple(), saveKwargs=dict(),
+            saveData=False):
         """
         Parameters
         ----------
@@ -223,16 +403,22 @@ class HeatMap(ReportBase):
             Any keyword args to be passed to ``matplotlib.savefig``
 
             (Default: Empty dict)
+
+        saveData: bool, optional
+            If the data plotted should also be saved next to the figure
+
+            (Default: ``False``)
         """
 
         super(HeatMap, self).__init__(name=name, saveArgs=saveArgs,
-            saveKwargs=saveKwargs)
+            saveKwargs=saveKwargs, saveData=saveData)
 
     def distill(self, data, name=None, outputRoot=None, outputNamePrefix=None,
             title=None, text=None, ylabel=None, xlabel=None,
             saveArgs=tuple(), saveKwargs=dict(), vmin=None, vmax=None,
             aspect='auto', axisOff=True,
-            cmap=plt.cm.RdBu, *args, **kwargs):
+            cmap=None, yticklabels=None, saveData=None,
+            parameters=None, *args, **kwargs):
         """Creates the actual heatmap.
 
         Parameters
@@ -315,6 +501,22 @@ class HeatMap(ReportBase):
             A colormap to be used when plotting.
 
             (Default: Red -- Blue)
+
+        yticklabels: iterable of str, optional
+            A label for each row of the data
+
+            (Default: ``None``)
+
+        saveData: bool, optional
+            If the data should be saved next to the figure.
+
+            (Default: ``None``, use the value of ``self.saveData``)
+
+        parameters: dict, optional
+            Parameters of the builder that produced the data, stored in the
+            sidecar if data is saved.
+
+            (Default: ``None``)
         """
 
         if len(args):
@@ -322,29 +524,45 @@ class HeatMap(ReportBase):
         if len(kwargs):
             warnings.warn("Unused keyword arguments: {0}".format(kwargs))
 
-        f = plt.figure(name)
-        ax = f.gca()
-        im = ax.imshow(data, aspect=aspect, cmap=cmap, interpolation='nearest',
-                       vmin=vmin, vmax=vmax)
+        with _figure() as (plt, f):
+
+            if cmap is None:
+                cmap = plt.cm.RdBu
 
-        if ylabel is not None:
-            ax.set_ylabel(ylabel)
-        if xlabel is not None:
-            ax.set_xlabel(xlabel)
+            ax = f.gca()
+            im = ax.imshow(data, aspect=aspect, cmap=cmap,
+                           interpolation='nearest', vmin=vmin, vmax=vmax)
 
-        plt.colorbar(im, ax=ax)
+            if ylabel is not None:
+                ax.set_ylabel(ylabel)
+            if xlabel is not None:
+                ax.set_xlabel(xlabel)
+            if yticklabels is not None:
+                ax.set_yticks(range(len(yticklabels)))
+                ax.set_yticklabels(yticklabels, size='x-small')
 
-        if axisOff:
-            ax.axis('off')
+            plt.colorbar(im, ax=ax)
 
-        if title is not None:
-            ax.set_title(title)
+            if axisOff:
+                ax.axis('off')
 
-        f.tight_layout()
+            if title is not None:
+                ax.set_title(title)
+
+            f.tight_layout()
+
+            self.saveFig(f, outputRoot=outputRoot,
+                    outputNamePrefix=outputNamePrefix,
+                    name=name, *saveArgs, **saveKwargs)
+
+        if saveData is None:
+            saveData = self.saveData
+
+        if saveData:
+            self.saveArray(data, outputRoot=outputRoot,
+                outputNamePrefix=outputNamePrefix, name=name, title=title,
+                xlabel=xlabel, ylabel=ylabel, parameters=parameters)
 
-        self.saveFig(f, outputRoot=outputRoot,
-                outputNamePrefix=outputNamePrefix,
-                name=name, *saveArgs, **saveKwargs)
 
 
 class LinePlot(ReportBase):
@@ -367,9 +585,15 @@ class LinePlot(ReportBase):
         Any keyword args to be passed to ``matplotlib.savefig``
 
         (Default: Empty dict)
+
+    saveData: bool, optional
+        If the data plotted should also be saved next to the figure
+
+        (Default: ``False``)
     """
 
-    def __init__(self, name="line.pdf", saveArgs=tuple(), saveKwargs=dict()):
+    def __init__(self, name="line.pdf", saveArgs=tuple(), saveKwargs=dict(),
+            saveData=False):
         """
         Parameters
         ----------
@@ -388,16 +612,21 @@ class LinePlot(ReportBase):
             Any keyword args to be passed to ``matplotlib.savefig``
 
             (Default: Empty dict)
+
+        saveData: bool, optional
+            If the data plotted should also be saved next to the figure
+
+            (Default: ``False``)
         """
 
         super(LinePlot, self).__init__(name=name, saveArgs=saveArgs,
-            saveKwargs=saveKwargs)
+            saveKwargs=saveKwargs, saveData=saveData)
 
     def distill(self, data, name=None, outputRoot=None, outputNamePrefix=None,
             title=None, text=None, ylabel=None, xlabel=None,
             saveArgs=tuple(), saveKwargs=dict(), logX=False, logY=False,
-            basex=None, basey=None, labels=None,
-            *args, **kwargs):
+            basex=None, basey=None, labels=None, saveData=None,
+            parameters=None, *args, **kwargs):
 
         """Creates the actual heatmap.
 
@@ -477,8 +706,21 @@ class LinePlot(ReportBase):
 
             (Default: ``None``, uses 10-base)
 
-        labels: str, optional
+        labels: str or list of str, optional
             To name the line plotted and thus add a legend to the plot.
+            With a list, each column of a 2D ``data`` is plotted as a line
+            of its own, named by the list.
+
+            (Default: ``None``)
+
+        saveData: bool, optional
+            If the data should be saved next to the figure.
+
+            (Default: ``None``, use the value of ``self.saveData``)
+
+        parameters: dict, optional
+            Parameters of the builder that produced the data, stored in the
+            sidecar if data is saved.
 
             (Default: ``None``)
         """
@@ -487,36 +729,156 @@ class LinePlot(ReportBase):
         if len(kwargs):
             warnings.warn("Unused keyword arguments: {0}".format(kwargs))
 
-        f = plt.figure(name)
-        ax = f.gca()
-        if logX and logY:
-            ax.loglog(data, '-g', lw=2, basey=basey, basex=basex, label=labels)
-        elif logX:
-            ax.semilogx(data, '-g', lw=2, basex=basex, label=labels)
-        elif logY:
-            ax.semilogy(data, '-g', lw=2, basey=basey, label=labels)
-        else:
-            ax.plot(data, '-g', lw=2)
+        with _figure() as (plt, f):
+
+            ax = f.gca()
+            if logX and logY:
+                plot = ax.loglog
+                logKwargs = dict(basey=basey, basex=basex)
+            elif logX:
+                plot = ax.semilogx
+                logKwargs = dict(basex=basex)
+            elif logY:
+                plot = ax.semilogy
+                logKwargs = dict(basey=basey)
+            else:
+                plot = ax.plot
+                logKwargs = dict()
+
+            data = np.asarray(data)
+
+            if data.ndim == 2 and isinstance(labels, (list, tuple)):
+                for line, label in zip(data.T, labels):
+                    plot(line, '-', lw=1, label=label, **logKwargs)
+            else:
+                plot(data, '-g', lw=2, label=labels, **logKwargs)
+
+            if labels:
+                ax.legend(prop={'size': 'x-small'},
+                          ncol=max(1, len(labels) // 20)
+                          if isinstance(labels, (list, tuple)) else 1)
+
+            if title is not None:
+                ax.set_title(title)
+            if text is not None:
+                pass
+            if ylabel is not None:
+                ax.set_ylabel(ylabel)
+            if xlabel is not None:
+                ax.set_xlabel(xlabel)
+
+            ax.spines['top'].set_visible(False)
+            ax.spines['right'].set_visible(False)
+            ax.get_xaxis().tick_bottom()
+            ax.get_yaxis().tick_right()
+
+            f.tight_layout()
+
+            self.saveFig(f, outputRoot=outputRoot,
+                    outputNamePrefix=outputNamePrefix,
+                    name=name, *saveArgs, **saveKwargs)
+
+        if saveData is None:
+            saveData = self.saveData
+
+        if saveData:
+            self.saveArray(data, outputRoot=outputRoot,
+                outputNamePrefix=outputNamePrefix, name=name, title=title,
+                xlabel=xlabel, ylabel=ylabel, parameters=parameters)
+
+
+class ArrayReport(ReportBase):
+    """Saves the data sent to it as an array, without any figure.
+
+    It suits data too large to be shown, such as values per read, which is
+    saved as ``.npy`` (or ``.npz`` for a ``dict`` of arrays) with a
+    ``.json`` sidecar, see ``ReportBase.saveArray``. It does not need
+    matplotlib.
+
+    Parameters
+    ----------
+
+    name: str, optional
+        A specific name of the report
 
-        if labels:
-            ax.legend(prop={'size': 'x-small'})
+        (Default: "array.npy")
+    """
 
-        if title is not None:
-            ax.set_title(title)
-        if text is not None:
-            pass
-        if ylabel is not None:
-            ax.set_ylabel(ylabel)
-        if xlabel is not None:
-            ax.set_xlabel(xlabel)
+    def __init__(self, name='array.npy'):
+        """
+        Parameters
+        ----------
+
+        name: str, optional
+            A specific name of the report
 
-        ax.spines['top'].set_visible(False)
-        ax.spines['right'].set_visible(False)
-        ax.get_xaxis().tick_bottom()
-        ax.get_yaxis().tick_right()
+            (Default: "array.npy")
+        """
+
+        super(ArrayReport, self).__init__(name=name, saveData=True)
+
+    def distill(self, data, name=None, outputRoot=None, outputNamePrefix=None,
+            title=None, xlabel=None, ylabel=None, parameters=None,
+            saveData=None, *args, **kwargs):
+        """Saves the data.
+
+        Parameters
+        ----------
+
+        data: numpy.ndarray or dict
+            The data to be saved
+
+        name: str, optional
+            If the default name of the instance should be overwritten
+
+            (Default: Use the value of ``self.name``)
+
+        outputRoot: str, optional
+            The directory in which to place the report
+
+            (Default: ``None``)
+
+        outputNamePrefix: str, optional
+            A prefix to prepend the name when saving the output.
+
+            (Default: ``None``)
+
+        title: str, optional
+            A description of the data, stored in the sidecar
 
-        f.tight_layout()
+            (Default: ``None``)
+
+        xlabel: str, optional
+            A description of the columns, stored in the sidecar
+
+            (Default: ``None``)
+
+        ylabel: str, optional
+            A description of the rows, stored in the sidecar
+
+            (Default: ``None``)
+
+        parameters: dict, optional
+            Parameters of the builder that produced the data, stored in the
+            sidecar
+
+            (Default: ``None``)
+
+        saveData: bool, optional
+            Ignored, the data is always saved
+
+        Returns
+        -------
+
+        fseq.ArrayReport
+            Returns ``self``
+        """
+
+        if len(args):
+            warnings.warn("Unused arguments: {0}".format(args))
+        if len(kwargs):
+            warnings.warn("Unused keyword arguments: {0}".format(kwargs))
 
-        self.saveFig(f, outputRoot=outputRoot,
-                outputNamePrefix=outputNamePrefix,
-                name=name, *saveArgs, **saveKwargs)
+        return self.saveArray(data, outputRoot=outputRoot,
+            outputNamePrefix=outputNamePrefix, name=name, title=title,
+            xlabel=xlabel, ylabel=ylabel, parameters=parameters)
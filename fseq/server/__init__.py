@@ -0,0 +1,31 @@
+#!/usr/bin/env python
+"""Serving-related modules of fseq.
+
+The server package contains one module: `seq_server`.
+
+It holds a long-lived server that keeps `fseq` and its dependencies loaded
+and runs jobs submitted over a local Unix socket, and the client that
+submits them.
+This spares many short runs on small files the start-up of the interpreter
+and the imports.
+
+The server can be started from the command line::
+
+    $ python -m fseq.server --socket /tmp/fseq.sock
+
+and jobs submitted with the ``fseq`` script::
+
+    $ fseq --connect /tmp/fseq.sock reads.fastq
+
+fseq.server.SeqServer
+    Server running jobs from a Unix socket
+fseq.server.SeqClient
+    Client submitting jobs to the server
+fseq.server.jobReader
+    Sets up a ``SeqReader`` from the description of a job
+fseq.server.runJob
+    Runs a job in the current process
+"""
+
+from fseq.server.seq_server import SeqServer, SeqClient, jobReader, runJob, \
+    autoWidth, ENCODERS, BUILDERS, JOB_DEFAULTS
@@ -0,0 +1,24 @@
+#!/usr/bin/env python
+"""Run-script for serving fseq jobs over a Unix socket"""
+
+import argparse
+
+from fseq.server import SeqServer
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(
+        description="fSeq server running jobs submitted over a Unix socket")
+
+    parser.add_argument('--socket', dest='socket', type=str, required=True,
+                        help="path of the Unix socket to listen on")
+    parser.add_argument('--max-jobs', dest='maxJobs', type=int, default=None,
+                        help="jobs run at the same time " +
+                        "(default: number of processors)")
+
+    args = parser.parse_args()
+
+    try:
+        SeqServer(args.socket, maxJobs=args.maxJobs).serve()
+    except KeyboardInterrupt:
+        pass
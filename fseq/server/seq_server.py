@@ -0,0 +1,626 @@
+#!/usr/bin/env python
+"""Module for serving reading and reporting jobs from a long-lived process"""
+
+import os
+import json
+import socket
+import threading
+import traceback
+import numpy as np
+
+try:
+    import socketserver
+except ImportError:
+    import SocketServer as socketserver
+
+from time import time
+
+import fseq
+
+ENCODERS = {
+    'gc': 'SeqEncoderGC',
+    'gcwindow': 'SeqEncoderGCWindow',
+    'kmer': 'SeqEncoderKmer',
+    'onehot': 'SeqEncoderOneHot'}
+"""Names of encoders in jobs to the classes in the package root"""
+
+BUILDERS = {
+    'fft': 'ReportBuilderFFT',
+    'average': 'ReportBuilderPositionAverage',
+    'kmer': 'ReportBuilderKmer',
+    'spectrogram': 'ReportBuilderSpectrogram',
+    'periodicity': 'ReportBuilderPeriodicity',
+    'spectral': 'ReportBuilderSpectralFeatures'}
+"""Names of report builders in jobs to the classes in the package root"""
+
+AUTO_WIDTH_LINES = 40000
+
+JOB_DEFAULTS = dict(
+    encoder='gc', builders=None, builderOptions=None, width=101,
+    dtype=None, batchSize=None, workers=None, backend='thread',
+    initialRows=None, outputDir=None, journal=None, maxMemory=None,
+    shards=None, verbose=False)
+"""The keys of a job, besides ``files``, and their defaults"""
+
+JOB_PATHS = ('outputDir', 'journal')
+
+
+def autoWidth(paths, default):
+    """The longest sequence line among the first lines of the files.
+
+    Header, separator and quality lines are recognized by their leading
+    character, and the standard input is not peeked at.
+
+    Parameters
+    ----------
+
+    paths: iterable of str
+        The files
+
+    default: int
+        The width if no sequence line was found
+
+    Returns
+    -------
+
+    int
+    """
+
+    width = 0
+
+    for path in paths:
+
+        if path == fseq.SeqReader.STDIN:
+            continue
+
+        with open(path) as fh:
+            for i, line in enumerate(fh):
+                if i >= AUTO_WIDTH_LINES:
+                    break
+                if line[:1] not in ('>', '@', '+'):
+                    width = max(width, len(line.rstrip("\n")))
+
+    return width or default
+
+
+def jobReader(job):
+    """Sets up a reader for a job.
+
+    Parameters
+    ----------
+
+    job: dict
+        The ``files`` to read and optionally any of the keys in
+        ``JOB_DEFAULTS``, where ``encoder`` and ``builders`` are keys of
+        ``ENCODERS`` and ``BUILDERS``, ``builderOptions`` maps builder
+        names to their keyword arguments, also applied to the builders
+        requested by the encoder if no ``builders`` are given, and
+        ``width`` may be ``'auto'``. The ``kmer`` builder gets the ``k`` of
+        a k-mer encoder unless given
+
+    Returns
+    -------
+
+    fseq.SeqReader
+        The reader with the files added but not read
+
+    Raises
+    ------
+
+    ValueError
+        If the job has unknown keys, no files or unknown encoder or builders
+    """
+
+    unknown = set(job).difference(JOB_DEFAULTS).difference(('files', ))
+    if unknown:
+        raise ValueError("Unknown job keys {0}".format(sorted(unknown)))
+
+    if not job.get('files'):
+        raise ValueError("Job has no files")
+
+    settings = dict(JOB_DEFAULTS)
+    settings.update(job)
+
+    if settings['encoder'] not in ENCODERS:
+        raise ValueError("Unknown encoder {0}".format(settings['encoder']))
+
+    encoder = getattr(fseq, ENCODERS[settings['encoder']])()
+
+    options = settings['builderOptions'] or {}
+
+    if settings['builders'] is None:
+        names = dict((v, k) for k, v in BUILDERS.items())
+        builders = tuple(
+            r(**options.get(names.get(getattr(r, 'func', r).__name__), {}))
+            for r in encoder.requestReports)
+    else:
+        builders = []
+        for name in settings['builders']:
+            if name not in BUILDERS:
+                raise ValueError("Unknown builder {0}".format(name))
+            kwargs = dict(options.get(name, {}))
+            if name == 'kmer' and kwargs.get('k') is None:
+                kwargs['k'] = getattr(encoder, 'k', None)
+            builders.append(getattr(fseq, BUILDERS[name])(**kwargs))
+
+    width = settings['width']
+    if width == 'auto':
+        width = autoWidth(job['files'], 101)
+
+    dataType = settings['dtype']
+    if dataType is not None:
+        dataType = np.dtype(dataType).type
+
+    reader = fseq.SeqReader(
+        seqEncoder=encoder, dataSourcePaths=list(job['files']),
+        reportBuilders=builders, verbose=settings['verbose'],
+        dataWidth=int(width), dataType=dataType,
+        batchSize=settings['batchSize'], workers=settings['workers'],
+        backend=settings['backend'], reportRoot=settings['outputDir'],
+        journal=settings['journal'] and fseq.SeqJournal(settings['journal']),
+        maxMemory=settings['maxMemory'], shards=settings['shards'])
+
+    if settings['initialRows'] is not None:
+        reader.DATA_INITIAL_SIZE = settings['initialRows']
+
+    return reader
+
+
+def runJob(job):
+    """Reads and reports all files of a job.
+
+    Parameters
+    ----------
+
+    job: dict
+        The job, see ``jobReader``
+
+    Returns
+    -------
+
+    dict
+        The summary of the run, as made by ``SeqReader.summary``
+    """
+
+    return jobReader(job).run().summary()
+
+
+def _warmUp():
+
+    #Imports what the first job would otherwise have to
+    fseq.ReportBuilderBase
+
+    try:
+        from fseq.reporting.reports import _pyplot
+        _pyplot()
+    except ImportError:
+        pass
+
+
+class _Handler(socketserver.StreamRequestHandler):
+
+    def handle(self):
+
+        line = self.rfile.readline()
+        if not line:
+            return
+
+        try:
+            request = json.loads(line.decode('utf-8'))
+            response = self.server.seqServer.respond(request)
+        except Exception as e:
+            response = dict(ok=False, error=repr(e),
+                            traceback=traceback.format_exc())
+
+        self.wfile.write(
+            (json.dumps(response, sort_keys=True) + "\n").encode('utf-8'))
+
+
+class _UnixServer(socketserver.ThreadingMixIn,
+                  socketserver.UnixStreamServer):
+
+    daemon_threads = True
+
+
+class SeqServer(object):
+    """Long-lived process serving reading and reporting jobs.
+
+    The server listens on a local Unix socket and keeps the package and
+    its dependencies, including matplotlib which is imported when the
+    server starts, loaded, such that each job is spared the start-up of
+    the interpreter and the imports, which for small files dominate the
+    time of a run of the ``fseq`` script. What stays warm is the process
+    and its modules: each job still sets up its own ``SeqReader`` with
+    its reading, encoding and reporting threads, which is cheap next to
+    the imports.
+
+    Each connection carries one request as a line of JSON and gets one
+    line of JSON in response. The requests are
+
+    ``{"job": {...}}``
+        Reads and reports the files of the job, see ``jobReader``,
+        responding with the run summary under ``summary``
+
+    ``{"ping": true}``
+        Responds with the process id and the number of jobs served
+
+    ``{"shutdown": true}``
+        Stops the server once the response is sent
+
+    All responses have ``ok`` set, and if not ok an ``error``.
+
+    Jobs are run in a thread per connection, at most ``maxJobs`` at a
+    time, while further jobs wait their turn. Jobs encode concurrently,
+    but as pyplot's state is global to the process, figures are drawn
+    one at a time by all jobs, see ``fseq.reporting.reports``.
+
+    Attributes
+    ----------
+
+    path
+    maxJobs
+    jobs
+    serving
+
+    Examples
+    --------
+
+    >>> server = fseq.server.SeqServer('/tmp/fseq.sock').start()
+    >>> fseq.server.SeqClient('/tmp/fseq.sock').submit(
+    ...     dict(files=['reads.fastq'], builders=['average']))
+    >>> server.shutdown()
+    """
+
+    def __init__(self, path, maxJobs=None):
+        """
+        Parameters
+        ----------
+
+        path: str
+            Path of the Unix socket
+
+        maxJobs: int, optional
+            Jobs run at the same time
+
+            (Default: The number of processors)
+
+        Raises
+        ------
+
+        ValueError
+            If ``maxJobs`` is not positive
+        """
+
+        if maxJobs is None:
+            try:
+                import multiprocessing
+                maxJobs = multiprocessing.cpu_count()
+            except NotImplementedError:
+                maxJobs = 1
+
+        if maxJobs < 1:
+            raise ValueError("Max jobs {0} not positive".format(maxJobs))
+
+        self._path = path
+        self._maxJobs = int(maxJobs)
+        self._slots = threading.Semaphore(self._maxJobs)
+        self._lock = threading.Lock()
+        self._jobs = 0
+        self._server = None
+        self._thread = None
+
+    @property
+    def path(self):
+        """Path of the Unix socket: str"""
+        return self._path
+
+    @property
+    def maxJobs(self):
+        """Jobs run at the same time: int"""
+        return self._maxJobs
+
+    @property
+    def jobs(self):
+        """Number of jobs served: int"""
+        return self._jobs
+
+    @property
+    def serving(self):
+        """If the server is listening: bool"""
+        return self._server is not None
+
+    def respond(self, request):
+        """The response to a request.
+
+        Parameters
+        ----------
+
+        request: dict
+            The request as described in the class documentation
+
+        Returns
+        -------
+
+        dict
+            The response
+        """
+
+        if request.get('ping'):
+
+            return dict(ok=True, pid=os.getpid(), jobs=self._jobs,
+                        maxJobs=self._maxJobs)
+
+        elif request.get('shutdown'):
+
+            threading.Thread(target=self.shutdown).start()
+            return dict(ok=True)
+
+        elif 'job' in request:
+
+            with self._slots:
+                tStart = time()
+                summary = runJob(request['job'])
+
+            with self._lock:
+                self._jobs += 1
+
+            return dict(ok=True, summary=summary, seconds=time() - tStart)
+
+        return dict(ok=False, error="Unknown request {0}".format(
+            sorted(request)))
+
+    def _bind(self):
+
+        if self._server is not None:
+            raise ValueError("Server already serving on {0}".format(
+                self._path))
+
+        if os.path.exists(self._path):
+            try:
+                SeqClient(self._path, timeout=1).ping()
+            except socket.error:
+                os.unlink(self._path)
+            else:
+                raise ValueError("Another server is serving on {0}".format(
+                    self._path))
+
+        self._server = _UnixServer(self._path, _Handler)
+        self._server.seqServer = self
+
+        _warmUp()
+
+    def serve(self):
+        """Serves requests until shut down.
+
+        Returns
+        -------
+
+        fseq.server.SeqServer
+            Returns ``self``
+
+        Raises
+        ------
+
+        ValueError
+            If already serving or another server listens on the path
+        """
+
+        self._bind()
+
+        try:
+            self._server.serve_forever()
+        finally:
+            self._close()
+
+        return self
+
+    def start(self):
+        """Serves requests in a background thread.
+
+        Returns
+        -------
+
+        fseq.server.SeqServer
+            Returns ``self``
+
+        Raises
+        ------
+
+        ValueError
+            If already serving or another server listens on the path
+        """
+
+        self._bind()
+
+        self._thread = threading.Thread(target=self._server.serve_forever)
+        self._thread.daemon = True
+        self._thread.start()
+
+        return self
+
+    def shutdown(self):
+        """Stops serving and removes the socket.
+
+        Returns
+        -------
+
+        fseq.server.SeqServer
+            Returns ``self``
+        """
+
+        server = self._server
+        if server is None:
+            return self
+
+        server.shutdown()
+
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+            self._close()
+
+        return self
+
+    def _close(self):
+
+        if self._server is None:
+            return
+
+        self._server.server_close()
+
+        if os.path.exists(self._path):
+            os.unlink(self._path)
+
+        self._server = None
+
+
+class SeqClient(object):
+    """Client submitting jobs to a ``SeqServer``.
+
+    Attributes
+    ----------
+
+    path
+    timeout
+
+    Examples
+    --------
+
+    >>> client = fseq.server.SeqClient('/tmp/fseq.sock')
+    >>> summary = client.submit(dict(files=['reads.fastq']))
+    """
+
+    def __init__(self, path, timeout=None):
+        """
+        Parameters
+        ----------
+
+        path: str
+            Path of the server's Unix socket
+
+        timeout: float, optional
+            Seconds to wait for a response
+
+            (Default: ``None``, wait until the job is done)
+        """
+
+        self._path = path
+        self._timeout = timeout
+
+    @property
+    def path(self):
+        """Path of the server's Unix socket: str"""
+        return self._path
+
+    @property
+    def timeout(self):
+        """Seconds to wait for a response, ``None`` waits forever: float"""
+        return self._timeout
+
+    def request(self, request):
+        """Sends a request and waits for the response.
+
+        Parameters
+        ----------
+
+        request: dict
+            The request as described in ``SeqServer``
+
+        Returns
+        -------
+
+        dict
+            The response
+
+        Raises
+        ------
+
+        socket.error
+            If there is no server on the path
+        """
+
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self._timeout)
+
+        try:
+            sock.connect(self._path)
+            sock.sendall((json.dumps(request) + "\n").encode('utf-8'))
+
+            chunks = []
+            while True:
+                chunk = sock.recv(65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+        finally:
+            sock.close()
+
+        return json.loads(b"".join(chunks).decode('utf-8'))
+
+    def ping(self):
+        """Checks the server.
+
+        Returns
+        -------
+
+        dict
+            The process id of the server and the number of jobs served
+        """
+
+        return self.request(dict(ping=True))
+
+    def shutdown(self):
+        """Asks the server to stop.
+
+        Returns
+        -------
+
+        fseq.server.SeqClient
+            Returns ``self``
+        """
+
+        self.request(dict(shutdown=True))
+        return self
+
+    def submit(self, job):
+        """Submits a job and waits for it to complete.
+
+        Relative paths of the job are made absolute, as the server does
+        not share the working directory of the client.
+
+        Parameters
+        ----------
+
+        job: dict
+            The job, see ``fseq.server.jobReader``
+
+        Returns
+        -------
+
+        dict
+            The summary of the run
+
+        Raises
+        ------
+
+        ValueError
+            If the job reads the standard input or failed on the server
+        """
+
+        job = dict(job)
+
+        if fseq.SeqReader.STDIN in job.get('files', ()):
+            raise ValueError("Standard input can't be served")
+
+        job['files'] = [os.path.abspath(p) for p in job.get('files', ())]
+        for key in JOB_PATHS:
+            if job.get(key):
+                job[key] = os.path.abspath(job[key])
+
+        response = self.request(dict(job=job))
+
+        if not response.get('ok'):
+            raise ValueError("Job failed on server: {0}".format(
+                response.get('error')))
+
+        return response['summary']
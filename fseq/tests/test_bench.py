@@ -0,0 +1,180 @@
+#!/usr/bin/env python
+
+import unittest
+import tempfile
+import shutil
+import json
+import os
+
+import fseq
+from fseq.bench import SyntheticSeqs, SeqBenchmark, compareResults, \
+    importTime
+
+
+class TestSyntheticSeqs(unittest.TestCase):
+
+    def setUp(self):
+
+        self._dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+
+        shutil.rmtree(self._dir)
+
+    def _path(self, name):
+
+        return os.path.join(self._dir, name)
+
+    def test_deterministic(self):
+
+        SyntheticSeqs(reads=50, seed=3).writeFastq(self._path('a.fastq'))
+        SyntheticSeqs(reads=50, seed=3).writeFastq(self._path('b.fastq'))
+        SyntheticSeqs(reads=50, seed=4).writeFastq(self._path('c.fastq'))
+
+        with open(self._path('a.fastq')) as a, open(self._path('b.fastq')) as b:
+            self.assertEqual(a.read(), b.read())
+
+        with open(self._path('a.fastq')) as a, open(self._path('c.fastq')) as c:
+            self.assertNotEqual(a.read(), c.read())
+
+    def test_lengths(self):
+
+        lengths = [len(r[1]) for r in
+                   SyntheticSeqs(reads=20, length=33).records()]
+
+        self.assertEqual(lengths, [33] * 20)
+
+        lengths = [len(r[1]) for r in
+                   SyntheticSeqs(reads=200, length=50, lengthSD=20,
+                                 minLength=10).records()]
+
+        self.assertGreaterEqual(min(lengths), 10)
+        self.assertGreater(len(set(lengths)), 1)
+
+    def test_composition(self):
+
+        seq = "".join(r[1] for r in
+                      SyntheticSeqs(reads=100, gc=1, nRate=0).records())
+
+        self.assertEqual(set(seq), {'G', 'C'})
+
+        seq = "".join(r[1] for r in
+                      SyntheticSeqs(reads=100, gc=0, nRate=0).records())
+
+        self.assertEqual(set(seq), {'A', 'T'})
+
+        seq = "".join(r[1] for r in SyntheticSeqs(reads=100, nRate=1).records())
+
+        self.assertEqual(set(seq), {'N'})
+
+    def test_badRates(self):
+
+        self.assertRaises(ValueError, SyntheticSeqs, gc=1.5)
+        self.assertRaises(ValueError, SyntheticSeqs, nRate=-0.1)
+
+    def test_detectedFormats(self):
+
+        s = SyntheticSeqs(reads=100, length=150)
+
+        for name, write, fmt in (
+                ('s.fastq', s.writeFastq, fseq.FastQ()),
+                ('s.fasta', s.writeFasta, fseq.FastaSingleline())):
+
+            write(self._path(name))
+            d = fseq.SeqFormatDetector()
+
+            with open(self._path(name)) as fh:
+                for line in fh:
+                    if not d.detecting:
+                        break
+                    d.feed(line.rstrip("\n"))
+
+            self.assertEqual(d.format, fmt.name)
+
+        s.writeFasta(self._path('m.fasta'), lineWidth=60)
+
+        with open(self._path('m.fasta')) as fh:
+            self.assertTrue(fh.readline().startswith(">"))
+            self.assertEqual(len(fh.readline()), 61)
+
+
+class TestSeqBenchmark(unittest.TestCase):
+
+    def setUp(self):
+
+        self._dir = tempfile.mkdtemp()
+        self._path = os.path.join(self._dir, 's.fastq')
+        SyntheticSeqs(reads=200, length=60).writeFastq(self._path)
+
+    def tearDown(self):
+
+        shutil.rmtree(self._dir)
+
+    def test_run(self):
+
+        b = SeqBenchmark(self._path, reportBuilders=(), dataWidth=60).run()
+
+        res = b.results['sources'][0]
+
+        self.assertEqual(res['format'], fseq.FastQ().name)
+        self.assertEqual(res['records'], 200)
+        self.assertEqual(set(res['stages']),
+                         {'detection', 'reading', 'encoding', 'reader'})
+        self.assertEqual(res['stages']['encoding']['records'], 200)
+
+        out = os.path.join(self._dir, 'bench.json')
+        b.save(out)
+
+        with open(out) as fh:
+            saved = json.load(fh)
+
+        self.assertEqual(set(compareResults(saved, b.results)['s.fastq']),
+                         set(res['stages']))
+
+    def test_crlf(self):
+
+        path = os.path.join(self._dir, 'crlf.fastq')
+        with open(self._path, 'rb') as fh:
+            data = fh.read()
+        with open(path, 'wb') as fh:
+            fh.write(data.replace(b"\n", b"\r\n"))
+
+        #Wider than the reads, such that any carriage return is encoded
+        res = SeqBenchmark(path, reportBuilders=(), dataWidth=70).run(
+            ).results['sources'][0]
+
+        self.assertEqual(res['stages']['encoding']['records'], 200)
+
+    def test_saveRequiresRun(self):
+
+        self.assertRaises(ValueError, SeqBenchmark(self._path).save,
+                          os.path.join(self._dir, 'bench.json'))
+
+
+class TestImportTime(unittest.TestCase):
+
+    def test_readingOnly(self):
+
+        res = importTime(repeats=1, budget=60)
+
+        self.assertEqual(len(res['seconds']), 1)
+        self.assertTrue(res['withinBudget'])
+        self.assertEqual(res['heavyModules'], [])
+
+    def test_reporting(self):
+
+        res = importTime("import fseq.reporting.reports as r; r._pyplot()",
+                         repeats=1, budget=60)
+
+        self.assertIn('matplotlib', res['heavyModules'])
+
+    def test_lazyAttributes(self):
+
+        self.assertIn('HeatMap', dir(fseq))
+        self.assertTrue(issubclass(fseq.ReportBuilderFFT,
+                                   fseq.ReportBuilderBase))
+        self.assertRaises(AttributeError, getattr, fseq, 'NoSuchThing')
+
+
+if __name__ == '__main__':
+    unittest.main()
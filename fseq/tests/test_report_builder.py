@@ -1,9 +1,23 @@
 #!/usr/bin/env python
 
 import unittest
+import json
+import numpy as np
 
 import fseq
 
+class CollectingReport(object):
+
+    def __init__(self):
+
+        self.data = {}
+
+    def distill(self, data, *args, **kwargs):
+
+        self.data[kwargs['outputNamePrefix']] = np.asarray(data)
+        self.labels = kwargs.get('labels')
+
+
 class TestGenericBuilder(unittest.TestCase):
 
     def setUp(self):
@@ -73,6 +87,21 @@ class TestGenericBuilder(unittest.TestCase):
 
         self.assertEqual(rb.outputRoot, root2)
 
+    def test_saveData(self):
+
+        self.assertIsNone(self._builderConstructor().saveData)
+
+        rb = self._builderConstructor(saveData=True)
+
+        self.assertTrue(rb.saveData)
+
+    def test_parameters(self):
+
+        rb = self._builderConstructor()
+
+        self.assertEqual(rb.parameters['builder'],
+                         self._builderConstructor.__name__)
+
 
 class TestFFTBulder(TestGenericBuilder):
 
@@ -105,6 +134,36 @@ class TestFFTBulder(TestGenericBuilder):
                 self.assertEqual(rb.distanceMetric, m2)
             m2 = m
 
+    def test_transform(self):
+
+        data = np.random.RandomState(0).randint(
+            0, 2, size=(50, 20)).astype(np.float16)
+
+        rb = self._builderConstructor()
+        rb.BLOCK_SIZE = 7
+        A, P = rb._transform(data)
+
+        fD = np.fft.rfft(data.astype(np.float64), axis=1)
+
+        self.assertEqual(A.dtype, np.float32)
+        self.assertEqual(A.shape, (50, 11))
+        np.testing.assert_allclose(A, np.abs(fD), atol=1e-4)
+
+    def test_distill(self):
+
+        data = np.random.RandomState(0).randint(
+            0, 2, size=(300, 20)).astype(np.float16)
+
+        for metric in ('correlation', 'seuclidean', 'euclidean'):
+
+            report = CollectingReport()
+            self._builderConstructor(
+                report, sampleSize=100, distanceMetric=metric).distill(data)
+
+            self.assertEqual(report.data['fft-sample.abs.'].shape, (100, 11))
+            self.assertEqual(report.data['fft-sample.angle.'].shape,
+                             (100, 11))
+
         
 class TestAverageBuilder(TestGenericBuilder):
 
@@ -124,3 +183,409 @@ class TestAverageBuilder(TestGenericBuilder):
         rb.undecidedValue = 0.5
 
         self.assertEqual(rb.undecidedValue, 0.5)
+
+    def test_distill(self):
+
+        data = np.array([[1, 0.5, 0], [0, 0.5, 1], [1, 1, 0.5],
+                         [1, 0, 0]], dtype=np.float16)
+
+        report = CollectingReport()
+        rb = self._builderConstructor(report)
+        rb.BLOCK_SIZE = 3
+        rb.distill(data)
+
+        np.testing.assert_allclose(report.data['average.total.'],
+                                   [0.75, 0.5, 0.375])
+        np.testing.assert_allclose(report.data['average.lacking.'],
+                                   [0, 0.5, 0.25])
+        np.testing.assert_allclose(report.data['average.not-lacking.'],
+                                   [0.75, 0.25, 0.25])
+
+    def test_distillRun(self):
+
+        rb = self._builderConstructor(CollectingReport())
+        statistics = [rb.summarize(np.array([[1, 0.5]], dtype=np.float16)),
+                      rb.summarize(np.array([[0, 0], [0, 1], [1, 1]],
+                                            dtype=np.float16)),
+                      rb.summarize(np.array([[1]], dtype=np.float16))]
+
+        report = CollectingReport()
+        rb = self._builderConstructor(report)
+        rb.distillRun(statistics, ['a', 'b', 'c'])
+
+        np.testing.assert_allclose(report.data['average.total.'],
+                                   [0.6, 0.5])
+        np.testing.assert_allclose(report.data['average.lacking.'],
+                                   [0, 0.2])
+        np.testing.assert_allclose(report.data['average.total.overlay.'],
+                                   [[1, 1 / 3., 1], [0.5, 2 / 3., np.nan]])
+        self.assertEqual(report.labels, ['a', 'b', 'c'])
+
+
+class TestPositionStatistics(unittest.TestCase):
+
+    def setUp(self):
+
+        rng = np.random.RandomState(0)
+        self._data = rng.choice([0, 0.5, 1], size=(30, 6)).astype(np.float16)
+
+    def test_fromData(self):
+
+        ps = fseq.PositionStatistics.fromData(self._data, blockSize=7)
+
+        self.assertEqual(ps.count, 30)
+        np.testing.assert_allclose(
+            ps.average, self._data.astype(np.float64).mean(axis=0))
+        np.testing.assert_allclose(ps.lacking,
+                                   (self._data == 0.5).mean(axis=0))
+        np.testing.assert_allclose(
+            ps.notLacking, (self._data == 1).sum(axis=0) / 30.)
+
+    def test_merge(self):
+
+        parts = [fseq.PositionStatistics.fromData(self._data[a: b])
+                 for a, b in ((0, 5), (5, 17), (17, 30))]
+        whole = fseq.PositionStatistics.fromData(self._data)
+
+        left = (parts[0] + parts[1]) + parts[2]
+        right = parts[0] + (parts[1] + parts[2])
+        total = sum(parts, fseq.PositionStatistics())
+
+        for ps in (left, right, total):
+            self.assertEqual(ps.count, whole.count)
+            np.testing.assert_allclose(ps.sums, whole.sums)
+            np.testing.assert_array_equal(ps.undecided, whole.undecided)
+
+    def test_mergeWidths(self):
+
+        ps = fseq.PositionStatistics.fromData(self._data[:, :4]).merge(
+            fseq.PositionStatistics.fromData(self._data))
+
+        self.assertEqual(ps.sums.shape, (6, ))
+        self.assertEqual(ps.count, 60)
+
+    def test_mergeBadUndecided(self):
+
+        self.assertRaises(
+            ValueError, fseq.PositionStatistics.fromData(self._data).merge,
+            fseq.PositionStatistics.fromData(self._data, undecidedValue=-1))
+
+    def test_asDict(self):
+
+        ps = fseq.PositionStatistics.fromData(self._data)
+        copy = fseq.PositionStatistics.fromDict(
+            json.loads(json.dumps(ps.asDict())))
+
+        self.assertEqual(copy.count, ps.count)
+        np.testing.assert_array_equal(copy.sums, ps.sums)
+        np.testing.assert_array_equal(copy.undecided, ps.undecided)
+
+
+class TestSpectrogramBuilder(TestGenericBuilder):
+
+    def setUp(self):
+
+        self._builderConstructor = fseq.ReportBuilderSpectrogram
+        self._startReports = len(self._builderConstructor.DEFAULT_REPORTS)
+
+        #Period of 4 positions in the second half of the reads only
+        rs = np.random.RandomState(0)
+        self._data = rs.uniform(0, 1, (50, 64)).astype(np.float16) * 0.1
+        self._data[:, 32:] += np.tile([1, 1, 0, 0], 8)
+
+    def test_settings(self):
+
+        rb = self._builderConstructor()
+
+        self.assertEqual((rb.window, rb.stride), (32, 16))
+        self.assertEqual(self._builderConstructor(window=8, stride=3).stride,
+                         3)
+        self.assertRaises(ValueError, self._builderConstructor, window=1)
+        self.assertRaises(ValueError, self._builderConstructor, stride=0)
+
+    def test_summarize(self):
+
+        rb = self._builderConstructor(window=8, stride=4)
+        statistics = rb.summarize(self._data)
+
+        self.assertEqual(statistics.count, 50)
+        self.assertEqual(statistics.sums.shape, (15, 5))
+
+        taper = np.hanning(8)
+        expected = np.zeros((15, 5))
+        for row in self._data.astype(np.float64):
+            for w in range(15):
+                frame = row[w * 4: w * 4 + 8]
+                expected[w] += np.abs(
+                    np.fft.rfft((frame - frame.mean()) * taper)) ** 2
+
+        np.testing.assert_allclose(statistics.sums, expected, rtol=1e-4,
+                                   atol=1e-4)
+
+        rb.FRAME_BUDGET = 100
+        np.testing.assert_allclose(rb.summarize(self._data).sums,
+                                   statistics.sums, rtol=1e-5)
+
+        average = statistics.average
+        self.assertEqual(average[-1].argmax(), 2)
+        self.assertGreater(average[-1, 2], 100 * average[0, 2])
+
+    def test_sampleSize(self):
+
+        rb = self._builderConstructor(window=8, sampleSize=10)
+
+        self.assertEqual(rb.summarize(self._data).count, 10)
+
+    def test_distill(self):
+
+        report = CollectingReport()
+        rb = self._builderConstructor(report, window=8, stride=4)
+        rb.distill(self._data)
+
+        np.testing.assert_allclose(
+            report.data['spectrogram.power.'],
+            rb.summarize(self._data).average.T)
+
+    def test_distillRun(self):
+
+        report = CollectingReport()
+        rb = self._builderConstructor(report, window=8, stride=4)
+        statistics = [rb.summarize(self._data[:20]),
+                      rb.summarize(self._data[20:, :40])]
+
+        rb.distillRun(statistics, ['a', 'b'])
+
+        run = report.data['spectrogram.power.']
+
+        self.assertEqual(run.shape, (5, 15))
+        np.testing.assert_allclose(
+            run[:, :9],
+            (statistics[0].sums[:9] + statistics[1].sums).T / 50)
+
+
+class TestPeriodicityBuilder(TestGenericBuilder):
+
+    def setUp(self):
+
+        self._builderConstructor = fseq.ReportBuilderPeriodicity
+        self._startReports = len(self._builderConstructor.DEFAULT_REPORTS)
+
+        #First half with a period of 10 positions, second half noise
+        rs = np.random.RandomState(0)
+        self._data = rs.uniform(0, 1, (40, 100)).astype(np.float16)
+        self._data[:20] = 0.5 + 0.4 * np.cos(
+            2 * np.pi * np.arange(100) / 10.0)
+
+    def test_settings(self):
+
+        rb = self._builderConstructor(periods=10, bins=4)
+
+        self.assertEqual(rb.periods, (10.0, ))
+        self.assertEqual(rb.bins, 4)
+        self.assertEqual(len(rb.perReadReports), 1)
+        self.assertEqual(rb.parameters['periods'], [10.0])
+        self.assertRaises(ValueError, self._builderConstructor, periods=())
+        self.assertRaises(ValueError, self._builderConstructor, periods=1)
+        self.assertRaises(ValueError, self._builderConstructor, bins=0)
+
+    def test_scores(self):
+
+        rb = self._builderConstructor(periods=(10, 10.4, 3))
+        rb.BLOCK_SIZE = 7
+        scores = rb.scores(self._data)
+
+        self.assertEqual(scores.shape, (40, 3))
+        self.assertEqual(scores.dtype, np.float32)
+
+        n = np.arange(100)
+        for row, score in zip(self._data.astype(np.float64), scores):
+            x = row - row.mean()
+            for period, s in zip(rb.periods, score):
+                power = np.abs((x * np.exp(
+                    -2j * np.pi * n / period)).sum()) ** 2
+                self.assertAlmostEqual(s, power / (50 * (x ** 2).sum()),
+                                       places=4)
+
+        self.assertTrue((scores[:20, 0] > 0.99).all())
+        self.assertTrue((scores[20:, 0] < 0.2).all())
+
+        constant = np.ones((2, 100), dtype=np.float16)
+        np.testing.assert_array_equal(rb.scores(constant), 0)
+
+    def test_distill(self):
+
+        report = CollectingReport()
+        perRead = CollectingReport()
+        rb = self._builderConstructor(report, periods=(10, 3), bins=10,
+                                      perReadReports=(perRead, ))
+        rb.distill(self._data)
+
+        self.assertEqual(list(report.data), ['periodicity.distribution.'])
+        self.assertEqual(list(perRead.data), ['periodicity.reads.'])
+        self.assertEqual(report.labels, ['10 positions', '3 positions'])
+
+        np.testing.assert_array_equal(perRead.data['periodicity.reads.'],
+                                      rb.scores(self._data))
+
+        distribution = report.data['periodicity.distribution.']
+        self.assertEqual(distribution.shape, (10, 2))
+        np.testing.assert_allclose(distribution.sum(axis=0), 1)
+        self.assertEqual(distribution[-1, 0], 0.5)
+
+
+class TestSpectralFeaturesBuilder(TestGenericBuilder):
+
+    def setUp(self):
+
+        self._builderConstructor = fseq.ReportBuilderSpectralFeatures
+        self._startReports = len(self._builderConstructor.DEFAULT_REPORTS)
+
+        #Slow and fast periods, noise and a constant read
+        rs = np.random.RandomState(0)
+        self._data = rs.uniform(0, 1, (30, 64)).astype(np.float16)
+        self._data[0] = np.tile([1] * 8 + [0] * 8, 4)
+        self._data[1] = np.tile([1, 0], 32)
+        self._data[2] = 0.5
+
+    def test_settings(self):
+
+        rb = self._builderConstructor(split=0.1)
+
+        self.assertEqual(rb.split, 0.1)
+        self.assertEqual(rb.FEATURES_DTYPE.itemsize, 20)
+        self.assertIn('entropy', rb.parameters['fields'])
+        self.assertRaises(ValueError, self._builderConstructor, split=0)
+        self.assertRaises(ValueError, self._builderConstructor, split=0.5)
+
+    def test_features(self):
+
+        rb = self._builderConstructor()
+        rb.BLOCK_SIZE = 7
+        table = rb.features(self._data)
+
+        self.assertEqual(table.dtype, rb.FEATURES_DTYPE)
+        self.assertEqual(table.shape, (30, ))
+
+        self.assertEqual(table['dominantFrequency'][0], 1 / 16.0)
+        self.assertEqual(table['dominantFrequency'][1], 0.5)
+        self.assertEqual(table['bandRatio'][1], 0)
+        self.assertGreater(table['bandRatio'][0], 10)
+        self.assertLess(table['entropy'][0], 0.5)
+        self.assertGreater(table['entropy'][3:].min(), 0.7)
+        self.assertEqual(tuple(table[2]), (0, 0, 0, 0.5, 0))
+
+        for row, features in zip(self._data[3:].astype(np.float64),
+                                 table[3:]):
+
+            x = row - row.mean()
+            P = np.abs(np.fft.rfft(x))[1:] ** 2
+            f = np.fft.rfftfreq(64)[1:]
+            p = P / P.sum()
+
+            self.assertEqual(features['dominantFrequency'], f[P.argmax()])
+            self.assertAlmostEqual(features['entropy'],
+                                   -(p * np.log(p)).sum() / np.log(32),
+                                   places=5)
+            self.assertAlmostEqual(features['bandRatio'],
+                                   P[f <= 0.25].sum() / P[f > 0.25].sum(),
+                                   places=4)
+            self.assertAlmostEqual(features['mean'], row.mean(), places=5)
+            self.assertAlmostEqual(features['variance'], x.var(), places=5)
+
+    def test_featuresMixedLengths(self):
+
+        rb = self._builderConstructor()
+        rb.BLOCK_SIZE = 7
+        lengths = np.arange(30) % 4 * 16
+
+        padded = np.zeros_like(self._data)
+        masked = np.empty_like(self._data)
+        masked[...] = np.nan
+        for row, length in enumerate(lengths):
+            padded[row, :length] = self._data[row, :length]
+            masked[row, :length] = self._data[row, :length]
+
+        table = rb.features(padded, lengths)
+
+        np.testing.assert_array_equal(table, rb.features(masked))
+        self.assertEqual(tuple(table[0]), (0, 0, 0, 0, 0))
+        self.assertEqual(table['dominantFrequency'][1], 0.5)
+        self.assertEqual(table['mean'][1], 0.5)
+
+        for row, length in enumerate(lengths):
+            if length:
+                expected = rb.features(self._data[row: row + 1, :length])
+                for name in rb.FEATURES_DTYPE.names:
+                    self.assertAlmostEqual(table[name][row],
+                                           expected[name][0], places=5)
+
+    def test_distill(self):
+
+        report = CollectingReport()
+        rb = self._builderConstructor(report)
+        rb.distill(self._data)
+
+        np.testing.assert_array_equal(report.data['spectral.features.'],
+                                      rb.features(self._data))
+
+        rb.distill(self._data, np.full(30, 16))
+
+        np.testing.assert_array_equal(report.data['spectral.features.'],
+                                      rb.features(self._data[:, :16]))
+
+
+class DinucleotideBuilder(fseq.ReportBuilderKmer):
+
+    def __init__(self, *reports, **kwargs):
+
+        kwargs.setdefault('k', 2)
+        super(DinucleotideBuilder, self).__init__(*reports, **kwargs)
+
+
+class TestKmerBuilder(TestGenericBuilder):
+
+    def setUp(self):
+
+        self._builderConstructor = DinucleotideBuilder
+        self._startReports = len(self._builderConstructor.DEFAULT_REPORTS)
+
+    def test_k(self):
+
+        self.assertEqual(self._builderConstructor().k, 2)
+        self.assertEqual(fseq.ReportBuilderKmer(k=3).k, 3)
+        self.assertRaises(ValueError, fseq.ReportBuilderKmer)
+        self.assertRaises(ValueError, fseq.ReportBuilderKmer, k=0)
+        self.assertRaises(ValueError, fseq.ReportBuilderKmer,
+                          k=fseq.ReportBuilderKmer.MAX_K + 1)
+
+    def test_countKmers(self):
+
+        e = fseq.SeqEncoderKmer(k=2)
+        data = np.zeros((3, 5))
+        for i, seq in enumerate(('ACGTA', 'ACG', 'CCNCC')):
+            d = e.encode(seq)
+            data[i, :d.size] = d
+
+        rb = self._builderConstructor()
+        rb.BLOCK_SIZE = 2
+        counts = rb._countKmers(data, 2)
+
+        self.assertEqual(counts.shape, (16, 5))
+        self.assertEqual(counts.sum(), 4 + 2 + 2)
+        self.assertEqual(counts[e.kmers.index('AC'), 0], 2)
+        self.assertEqual(counts[e.kmers.index('CC'), 0], 1)
+        self.assertEqual(counts[e.kmers.index('CG'), 1], 2)
+        self.assertEqual(counts[e.kmers.index('CC'), 3], 1)
+        self.assertEqual(counts[:, 4].sum(), 0)
+
+    def test_distillK(self):
+
+        report = CollectingReport()
+        rb = self._builderConstructor(report)
+
+        #No k-mer beyond 'AT' present, yet counted as dinucleotides
+        rb.distill(np.array([[1, 2, 4, 0]]))
+
+        self.assertEqual(report.data['kmer.frequency.'].shape, (16, 4))
+        self.assertRaises(ValueError, rb.distill, np.array([[1]]),
+                          k=fseq.ReportBuilderKmer.MAX_K + 1)
@@ -1,6 +1,12 @@
 #!/usr/bin/env python
 
 import unittest
+import tempfile
+import shutil
+import threading
+import json
+import os
+import numpy as np
 
 import fseq
 
@@ -76,3 +82,121 @@ class TestReports(unittest.TestCase):
 
         self.assertRaises(NotImplementedError, fseq.ReportBase().distill, None)
 
+    def test_saveData(self):
+
+        r = fseq.ReportBase()
+
+        self.assertFalse(r.saveData)
+
+        r = fseq.ReportBase(saveData=True)
+
+        self.assertTrue(r.saveData)
+
+        r.saveData = False
+
+        self.assertFalse(r.saveData)
+
+
+class TestSaveArray(unittest.TestCase):
+
+    def setUp(self):
+
+        self._dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+
+        shutil.rmtree(self._dir)
+
+    def test_saveArrayNpy(self):
+
+        data = np.arange(12, dtype=np.float16).reshape(3, 4)
+        r = fseq.ReportBase(name='heatmap.pdf')
+
+        r.saveArray(data, self._dir, 'fft.', title='T',
+                    parameters={'sampleSize': 3})
+
+        np.testing.assert_array_equal(
+            np.load(os.path.join(self._dir, 'fft.heatmap.npy')), data)
+
+        with open(os.path.join(self._dir, 'fft.heatmap.json')) as fh:
+            meta = json.load(fh)
+
+        self.assertEqual(meta['title'], 'T')
+        self.assertEqual(meta['shape'], [3, 4])
+        self.assertEqual(meta['dtype'], 'float16')
+        self.assertEqual(meta['figure'], 'fft.heatmap.pdf')
+        self.assertEqual(meta['parameters'], {'sampleSize': 3})
+
+    def test_saveArrayNpz(self):
+
+        r = fseq.ReportBase(name='line.pdf')
+
+        r.saveArray({'a': np.ones(3), 'b': np.zeros(2)}, self._dir, 'avg.')
+
+        with np.load(os.path.join(self._dir, 'avg.line.npz')) as npz:
+            self.assertEqual(set(npz.files), {'a', 'b'})
+
+        self.assertTrue(os.path.isfile(
+            os.path.join(self._dir, 'avg.line.json')))
+
+    def test_saveArrayRequiresName(self):
+
+        self.assertRaises(ValueError, fseq.ReportBase().saveArray,
+                          np.ones(2), self._dir, '')
+
+    def test_lineplotSavesData(self):
+
+        data = np.linspace(0, 1, 10)
+        r = fseq.LinePlot(saveData=True)
+
+        r.distill(data, outputRoot=self._dir, outputNamePrefix='t.')
+
+        self.assertTrue(os.path.isfile(os.path.join(self._dir, 't.line.pdf')))
+        np.testing.assert_allclose(
+            np.load(os.path.join(self._dir, 't.line.npy')), data)
+
+
+    def test_arrayReport(self):
+
+        data = np.arange(6, dtype=np.float32).reshape(3, 2)
+        r = fseq.ArrayReport()
+
+        r.distill(data, outputRoot=self._dir, outputNamePrefix='p.',
+                  xlabel='Period', parameters={'periods': [10.4]},
+                  saveData=False)
+
+        np.testing.assert_array_equal(
+            np.load(os.path.join(self._dir, 'p.array.npy')), data)
+
+        with open(os.path.join(self._dir, 'p.array.json')) as fh:
+            meta = json.load(fh)
+
+        self.assertEqual(meta['xlabel'], 'Period')
+        self.assertEqual(meta['parameters'], {'periods': [10.4]})
+        self.assertTrue(r.saveData)
+
+    def test_concurrentDrawing(self):
+
+        from fseq.reporting.reports import _pyplot
+
+        def draw(i):
+            fseq.HeatMap().distill(
+                np.eye(4) * i, outputRoot=self._dir,
+                outputNamePrefix='{0}.'.format(i))
+            fseq.LinePlot().distill(
+                np.arange(4) * i, outputRoot=self._dir,
+                outputNamePrefix='{0}.'.format(i))
+
+        threads = [threading.Thread(target=draw, args=(i, ))
+                   for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        for i in range(8):
+            for name in ('heatmap.pdf', 'line.pdf'):
+                self.assertTrue(os.path.isfile(os.path.join(
+                    self._dir, '{0}.{1}'.format(i, name))))
+
+        self.assertEqual(_pyplot().get_fignums(), [])
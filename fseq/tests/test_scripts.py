@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+
+import unittest
+import os
+import sys
+import shutil
+import tempfile
+import subprocess
+
+import fseq
+from fseq.bench import SyntheticSeqs
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(fseq.__file__)))
+SCRIPT = os.path.join(ROOT, 'scripts', 'fseq')
+
+
+@unittest.skipUnless(os.path.isfile(SCRIPT), "Run script not in the tree")
+class TestFseqScript(unittest.TestCase):
+
+    def setUp(self):
+
+        self._dir = tempfile.mkdtemp()
+        self._path = os.path.join(self._dir, 'r.fastq')
+        SyntheticSeqs(reads=60, length=40).writeFastq(self._path)
+
+    def tearDown(self):
+
+        shutil.rmtree(self._dir)
+
+    def _run(self, *args):
+
+        env = dict(os.environ)
+        env['PYTHONPATH'] = os.pathsep.join(
+            [ROOT] + [p for p in (env.get('PYTHONPATH'), ) if p])
+        env['MPLBACKEND'] = 'Agg'
+
+        return subprocess.check_output(
+            [sys.executable, SCRIPT] + list(args), env=env,
+            stderr=subprocess.STDOUT)
+
+    def test_defaultBuildersSaveData(self):
+
+        self._run('--sample-size', '20', '--save-data', '--workers', '2',
+                  '--width', '40', '-o', self._dir, self._path)
+
+        files = [f for _, _, names in os.walk(self._dir) for f in names]
+
+        for ext in ('.pdf', '.npy', '.json'):
+            self.assertTrue(any(f.startswith('fft-sample.') and
+                                f.endswith(ext) for f in files))
+            self.assertTrue(any(f.startswith('average.') and
+                                f.endswith(ext) for f in files))
+
+
+    def test_kmerDefaultBuilders(self):
+
+        self._run('--encoder', 'kmer', '--width', '40', '-o', self._dir,
+                  self._path)
+
+        files = [f for _, _, names in os.walk(self._dir) for f in names]
+
+        self.assertTrue(any(f.startswith('kmer.') and f.endswith('.pdf')
+                            for f in files))
+
+
+if __name__ == '__main__':
+    unittest.main()
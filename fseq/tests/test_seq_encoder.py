@@ -547,5 +547,293 @@ class TestEncoderQC(unittest.TestCase):
         np.testing.assert_allclose(self._out[10], 0.5)
 
 
+class TestEncoderKmer(unittest.TestCase):
+
+    def setUp(self):
+
+        self._eK = fseq.SeqEncoderKmer(
+            k=2, expectedInputFormat=fseq.FastaSingleline())
+
+        self._spoofHead = ">Read1"
+        self._out = np.ones((3, 8)) * -1
+
+    def test_badK(self):
+
+        self.assertRaises(ValueError, fseq.SeqEncoderKmer, k=0)
+        self.assertRaises(ValueError, fseq.SeqEncoderKmer,
+                          k=fseq.SeqEncoderKmer.MAX_K + 1)
+
+    def test_kmers(self):
+
+        kmers = self._eK.kmers
+
+        self.assertEqual(len(kmers), 16)
+        self.assertEqual(kmers[0], 'AA')
+        self.assertEqual(kmers[6], 'CG')
+        self.assertEqual(kmers[15], 'TT')
+
+    def test_encode(self):
+
+        np.testing.assert_array_equal(
+            self._eK.encode('ACGT'), [1 * 1 + 1, 1 * 4 + 2 + 1, 2 * 4 + 3 + 1, 0])
+
+        np.testing.assert_array_equal(self._eK.encode('acNgt'),
+                                      [2, 0, 0, 12, 0])
+
+        np.testing.assert_array_equal(self._eK.encode('A'), [0])
+
+    def test_parse(self):
+
+        self._eK.parse([self._spoofHead, 'CGCG'], self._out, 1)
+
+        np.testing.assert_array_equal(self._out[1, :4], [7, 10, 7, 0])
+        np.testing.assert_array_equal(self._out[1, 4:], -1)
+
+        self._eK.parse([self._spoofHead, 'CG' * 10], self._out, 2)
+
+        np.testing.assert_array_equal(self._out[2], [7, 10] * 4)
+
+    def test_trinucleotide(self):
+
+        e = fseq.SeqEncoderKmer(k=3)
+
+        self.assertEqual(e.encode('TTT')[0], 64)
+        self.assertEqual(e.kmers[e.encode('GAT')[0] - 1], 'GAT')
+
+    def test_dataType(self):
+
+        self.assertIsNone(fseq.SeqEncoderKmer(k=5).dataType)
+        self.assertEqual(fseq.SeqEncoderKmer(k=6).dataType, np.float32)
+
+    def test_longKmerCodes(self):
+
+        e = fseq.SeqEncoderKmer(
+            k=6, expectedInputFormat=fseq.FastaSingleline())
+        seq = e.kmers[-1] + e.kmers[1234] + e.kmers[3001]
+        codes = e.encode(seq)
+
+        out = np.zeros((1, len(seq)), dtype=e.dataType)
+        e.parse([self._spoofHead, seq], out, 0)
+
+        np.testing.assert_array_equal(out[0], codes)
+        self.assertEqual([e.kmers[int(c) - 1] for c in out[0, ::6]],
+                         [e.kmers[-1], e.kmers[1234], e.kmers[3001]])
+
+    def test_requestReportsLongK(self):
+
+        e = fseq.SeqEncoderKmer(k=fseq.ReportBuilderKmer.MAX_K + 1)
+
+        self.assertEqual(e.requestReports, tuple())
+
+    def test_requestReports(self):
+
+        e = fseq.SeqEncoderKmer(k=3)
+        rb = e.requestReports[0]()
+
+        self.assertIsInstance(rb, fseq.ReportBuilderKmer)
+        self.assertEqual(rb.k, 3)
+
+
+class TestEncoderOneHot(unittest.TestCase):
+
+    def setUp(self):
+
+        self._eO = fseq.SeqEncoderOneHot(
+            expectedInputFormat=fseq.FastaSingleline())
+
+        self._spoofHead = ">Read1"
+
+    def test_shape(self):
+
+        self.assertEqual(self._eO.itemShape(101), (101, 4))
+        self.assertEqual(fseq.SeqEncoder().itemShape(101), (101, ))
+
+    def test_dataType(self):
+
+        self.assertIs(self._eO.dataType, np.uint8)
+        self.assertIs(fseq.SeqEncoderOneHot(dataType=np.bool_).dataType,
+                      np.bool_)
+        self.assertIsNone(fseq.SeqEncoderGC().dataType)
+
+    def test_encode(self):
+
+        np.testing.assert_array_equal(
+            self._eO.encode('ACgTN'),
+            [[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 1, 0], [0, 0, 0, 1],
+             [0, 0, 0, 0]])
+
+    def test_parseBatch(self):
+
+        out = np.ones((4, 5, 4), dtype=np.uint8) * 9
+        seqs = ('ACGTACGT', 'GG', 'T')
+
+        self._eO.parseBatch([[self._spoofHead, s] for s in seqs], out, 1)
+
+        np.testing.assert_array_equal(out[0], 9)
+        np.testing.assert_array_equal(out[1], self._eO.encode('ACGTA'))
+        np.testing.assert_array_equal(out[2, :2], self._eO.encode('GG'))
+        np.testing.assert_array_equal(out[2, 2:], 9)
+        np.testing.assert_array_equal(out[3, :1], self._eO.encode('T'))
+
+        single = np.ones((4, 5, 4), dtype=np.uint8) * 9
+        for i, s in enumerate(seqs):
+            self._eO.parse([self._spoofHead, s], single, i + 1)
+
+        np.testing.assert_array_equal(out, single)
+
+
+class TestEncoderGCWindow(unittest.TestCase):
+
+    def setUp(self):
+
+        self._eW = fseq.SeqEncoderGCWindow(
+            window=4, stride=2, expectedInputFormat=fseq.FastaSingleline())
+
+        self._spoofHead = ">Contig1"
+
+    def test_badWindow(self):
+
+        self.assertRaises(ValueError, fseq.SeqEncoderGCWindow, window=0)
+        self.assertRaises(ValueError, fseq.SeqEncoderGCWindow, stride=0)
+
+    def test_shape(self):
+
+        self.assertEqual(self._eW.itemShape(12), (5, ))
+        self.assertEqual(self._eW.itemShape(13), (5, ))
+        self.assertEqual(self._eW.itemShape(2), (1, ))
+        self.assertEqual(fseq.SeqEncoderGCWindow(
+            window=100, stride=50).itemShape(10000), (199, ))
+
+    def test_encode(self):
+
+        np.testing.assert_allclose(self._eW.encode('GGGGAAAACCNN'),
+                                   [1, 0.5, 0, 0.5, 0.75])
+
+        np.testing.assert_allclose(self._eW.encode('ggcc'), [1])
+
+        self.assertEqual(self._eW.encode('GGC').size, 0)
+
+    def test_matchesGC(self):
+
+        seq = "".join(random.choice('ACGTN') for _ in range(500))
+        gc = fseq.SeqEncoderGC()
+        ref = np.array([gc.sequenceEncoding[c] for c in seq], dtype=float)
+
+        e = fseq.SeqEncoderGCWindow(window=25, stride=10)
+        expected = [ref[i: i + 25].mean() for i in range(0, 476, 10)]
+
+        np.testing.assert_allclose(e.encode(seq), expected)
+
+    def test_parse(self):
+
+        out = np.ones((2, 3)) * -1
+
+        self._eW.parse([self._spoofHead, 'GGGGAAAACCNN'], out, 1)
+        self._eW.parse([self._spoofHead, 'GGGGAA'], out, 0)
+
+        np.testing.assert_allclose(out[1], [1, 0.5, 0])
+        np.testing.assert_allclose(out[0], [1, 0.5, -1])
+
+
+class CountingEncoder(fseq.SeqEncoder):
+
+    def parse(self, lines, out, outindex):
+
+        out[outindex, 0] = len(lines[1])
+        out[outindex, 1] = lines[1].count('A')
+
+
+class TestEncoderBuffer(unittest.TestCase):
+
+    def setUp(self):
+
+        random.seed(42)
+        self._records = [
+            [">r{0}".format(i), "".join(
+                random.choice('ACGTNacgt') for _ in range(length))]
+            for i, length in enumerate((0, 1, 3, 7, 8, 9, 20, 2))]
+
+    def _parsed(self, encoder, records, shape):
+
+        single = np.ones(shape) * -1
+        for i, lines in enumerate(records):
+            encoder.parse(lines, single, i + 1)
+
+        buffered = np.ones(shape) * -1
+        encoder.parseBuffer(*(encoder.recordBuffer(
+            [[l.encode('ascii') for l in lines] for lines in records]) +
+            (buffered, 1)))
+
+        return single, buffered
+
+    def test_recordBuffer(self):
+
+        buffer, starts, ends = fseq.SeqEncoder.recordBuffer(
+            [[b">a", b"ACG"], [b">b", b""]])
+
+        self.assertEqual(buffer, b">aACG>b")
+        np.testing.assert_array_equal(starts, [[0, 2], [5, 7]])
+        np.testing.assert_array_equal(ends, [[2, 5], [7, 7]])
+
+    def test_default(self):
+
+        encoder = CountingEncoder(expectedInputFormat=fseq.FastaSingleline())
+        single, buffered = self._parsed(encoder, self._records, (10, 2))
+
+        np.testing.assert_array_equal(buffered, single)
+
+    def test_GC(self):
+
+        encoder = fseq.SeqEncoderGC(
+            expectedInputFormat=fseq.FastaSingleline())
+        records = [[h, s.upper()] for h, s in self._records]
+        single, buffered = self._parsed(encoder, records, (10, 8))
+
+        np.testing.assert_array_equal(buffered, single)
+
+        self.assertRaises(KeyError, self._parsed, encoder, self._records,
+                          (10, 8))
+
+    def test_kmer(self):
+
+        for k in (1, 2, 3):
+            encoder = fseq.SeqEncoderKmer(
+                k=k, expectedInputFormat=fseq.FastaSingleline())
+            single, buffered = self._parsed(encoder, self._records, (10, 8))
+
+            np.testing.assert_array_equal(buffered, single)
+
+    def test_oneHot(self):
+
+        encoder = fseq.SeqEncoderOneHot(
+            expectedInputFormat=fseq.FastaSingleline())
+        single, buffered = self._parsed(encoder, self._records, (10, 8, 4))
+
+        np.testing.assert_array_equal(buffered, single)
+
+    def test_fullWidth(self):
+
+        records = [[h, (s.upper() * 20)[:20] or 'A' * 20]
+                   for h, s in self._records]
+
+        for encoder, shape in (
+                (fseq.SeqEncoderGC(), (10, 8)),
+                (fseq.SeqEncoderKmer(k=3), (10, 8)),
+                (fseq.SeqEncoderOneHot(), (10, 8, 4))):
+
+            encoder.format = fseq.FastaSingleline()
+            single, buffered = self._parsed(encoder, records, shape)
+
+            np.testing.assert_array_equal(buffered, single)
+
+    def test_GCWindow(self):
+
+        encoder = fseq.SeqEncoderGCWindow(
+            window=4, stride=2, expectedInputFormat=fseq.FastaSingleline())
+        single, buffered = self._parsed(encoder, self._records, (10, 3))
+
+        np.testing.assert_array_equal(buffered, single)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python
+
+import unittest
+import numpy as np
+
+from fseq import SeqFilter, SeqSampler
+
+
+class TestSeqFilter(unittest.TestCase):
+
+    def setUp(self):
+
+        self._seqs = ["ACGTACGT", "ACNNACGT", "ACG", "", "nnnnnnnnnnnnnnnn"]
+        self._quals = ["IIIIIIII", "!!!!!!!!", "+++", "", "5555555555555555"]
+
+    def test_noPredicates(self):
+
+        f = SeqFilter()
+        keep, failed = f.evaluate(self._seqs)
+
+        self.assertEqual(f.names, ())
+        self.assertTrue(keep.all())
+        self.assertEqual(failed, {})
+
+    def test_length(self):
+
+        keep, failed = SeqFilter(minLength=4).evaluate(self._seqs)
+
+        np.testing.assert_array_equal(keep, [True, True, False, False, True])
+        self.assertEqual(failed, {'length': 2})
+
+    def test_N(self):
+
+        keep, failed = SeqFilter(maxN=1).evaluate(self._seqs)
+        np.testing.assert_array_equal(keep, [True, False, True, True, False])
+        self.assertEqual(failed, {'N': 2})
+
+        keep, _ = SeqFilter(maxNFraction=0.25).evaluate(self._seqs)
+        np.testing.assert_array_equal(keep, [True, True, True, True, False])
+
+    def test_quality(self):
+
+        f = SeqFilter(minMeanQuality=20)
+        self.assertTrue(f.usesQuality)
+
+        keep, failed = f.evaluate(self._seqs, self._quals)
+
+        np.testing.assert_array_equal(keep, [True, False, False, False, True])
+        self.assertEqual(failed, {'quality': 3})
+
+        self.assertRaises(ValueError, f.evaluate, self._seqs)
+
+    def test_combined(self):
+
+        f = SeqFilter(minLength=4, maxN=1, minMeanQuality=20)
+        keep, failed = f.evaluate(self._seqs, self._quals)
+
+        self.assertEqual(f.names, ('length', 'N', 'quality'))
+        np.testing.assert_array_equal(keep, [True, False, False, False, False])
+        self.assertEqual(failed, {'length': 2, 'N': 2, 'quality': 3})
+
+    def test_addPredicate(self):
+
+        f = SeqFilter(minLength=1).addPredicate(
+            'startsA', lambda seqs, quals: [s[:1] == 'A' for s in seqs])
+
+        keep, failed = f.evaluate(self._seqs)
+
+        self.assertEqual(f.names, ('length', 'startsA'))
+        np.testing.assert_array_equal(keep, [True, True, True, False, False])
+        self.assertEqual(failed['startsA'], 2)
+
+        self.assertRaises(ValueError, f.addPredicate, 'length', len)
+
+
+class TestSeqSampler(unittest.TestCase):
+
+    def test_badValues(self):
+
+        self.assertRaises(ValueError, SeqSampler, fraction=0)
+        self.assertRaises(ValueError, SeqSampler, fraction=1.5)
+        self.assertRaises(ValueError, SeqSampler, maxReads=0)
+        self.assertRaises(ValueError, SeqSampler, stride=0)
+
+    def test_all(self):
+
+        self.assertTrue(SeqSampler().keep(np.arange(10)).all())
+        self.assertTrue(SeqSampler(fraction=1).keep(np.arange(10)).all())
+
+    def test_stride(self):
+
+        np.testing.assert_array_equal(
+            np.flatnonzero(SeqSampler(stride=3).keep(np.arange(10))),
+            [0, 3, 6, 9])
+
+    def test_fraction(self):
+
+        s = SeqSampler(fraction=0.1, seed=3)
+        keep = s.keep(np.arange(100000))
+
+        self.assertAlmostEqual(keep.mean(), 0.1, places=2)
+
+        #Reproducible and independent of batching
+        np.testing.assert_array_equal(
+            keep[500:600], s.keep(np.arange(500, 600)))
+        np.testing.assert_array_equal(
+            keep, SeqSampler(fraction=0.1, seed=3).keep(np.arange(100000)))
+
+        self.assertFalse((keep == SeqSampler(fraction=0.1, seed=4).keep(
+            np.arange(100000))).all())
+
+    def test_hash(self):
+
+        h = SeqSampler().hash(np.arange(1000))
+
+        self.assertTrue(((h >= 0) & (h < 1)).all())
+        self.assertEqual(np.unique(h).size, 1000)
+
+    def test_byName(self):
+
+        s = SeqSampler(fraction=0.5, byName=True)
+        names = ["read{0}".format(i) for i in range(1000)]
+
+        keep = s.keep(np.arange(1000), names)
+        np.testing.assert_array_equal(
+            keep[::-1], s.keep(np.arange(1000), names[::-1]))
+        self.assertAlmostEqual(keep.mean(), 0.5, places=1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+
+import unittest
+import os
+import shutil
+import tempfile
+import numpy as np
+
+from fseq import SeqJournal
+
+
+class TestSeqJournal(unittest.TestCase):
+
+    def setUp(self):
+
+        self._dir = tempfile.mkdtemp()
+        self._path = os.path.join(self._dir, 'run.journal')
+        self._settings = dict(encoder='SeqEncoderGC', itemShape=[5],
+                              dataType='float16')
+
+    def tearDown(self):
+
+        shutil.rmtree(self._dir)
+
+    def test_empty(self):
+
+        j = SeqJournal(self._path)
+
+        self.assertEqual(j.sources, ())
+        self.assertEqual(j.cacheDirectory, self._path + ".cache")
+        self.assertIsNone(j.encoded('a', self._settings))
+        self.assertEqual(j.reported('a', self._settings), ())
+        self.assertFalse(j.complete('a', self._settings, ()))
+        self.assertFalse(os.path.exists(self._path))
+
+    def test_recordEncoding(self):
+
+        j = SeqJournal(self._path)
+        data = np.arange(10, dtype=np.float16).reshape(2, 5)
+
+        cache = j.recordEncoding('a', self._settings, data, target='a.reports')
+
+        self.assertEqual(j.encoded('a', self._settings), cache)
+        np.testing.assert_array_equal(np.load(cache), data)
+        self.assertTrue(j.complete('a', self._settings, ()))
+        self.assertFalse(j.complete('a', self._settings, ('0:Builder', )))
+
+        other = dict(self._settings, itemShape=[6])
+        self.assertIsNone(j.encoded('a', other))
+
+    def test_resume(self):
+
+        j = SeqJournal(self._path)
+        j.recordEncoding('a', self._settings, np.zeros((2, 5)))
+        j.recordReport('a', '0:Builder')
+        j.recordReport('a', '0:Builder')
+
+        j = SeqJournal(self._path)
+
+        self.assertEqual(j.sources, ('a', ))
+        self.assertEqual(j.reported('a', self._settings), ('0:Builder', ))
+        self.assertTrue(j.complete('a', self._settings, ('0:Builder', )))
+
+        #Re-encoding clears the reports
+        j.recordEncoding('a', self._settings, np.zeros((2, 5)))
+        self.assertEqual(j.reported('a', self._settings), ())
+
+    def test_missingCache(self):
+
+        j = SeqJournal(self._path)
+        cache = j.recordEncoding('a', self._settings, np.zeros((2, 5)))
+        os.remove(cache)
+
+        self.assertIsNone(SeqJournal(self._path).encoded('a', self._settings))
+
+    def test_version(self):
+
+        with open(self._path, 'w') as fh:
+            fh.write('{"version": 0, "sources": {}}')
+
+        self.assertRaises(ValueError, SeqJournal, self._path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+
+import unittest
+import numpy as np
+
+from fseq import SeqMetadata
+
+
+class TestSeqMetadata(unittest.TestCase):
+
+    def setUp(self):
+
+        self._headers = [
+            "@HWI-EAS209_0006_FC706VJ:5:58:5894:21141#ATCACG/1",
+            "@SEQ_ID",
+            "@EAS139:136:FC706VJ:2:2104:15343:197393 1:Y:18:ATCACG"]
+
+    def test_defaultFields(self):
+
+        m = SeqMetadata()
+
+        self.assertEqual(m.names, ('lane', 'tile', 'x', 'y'))
+        self.assertTrue(all(t is np.int32 for _, t in m.fields))
+
+    def test_extract(self):
+
+        m = SeqMetadata()
+
+        self.assertEqual(m.extract(self._headers[0]),
+                         ('5', '58', '5894', '21141'))
+        self.assertEqual(m.extract(self._headers[2]),
+                         ('2', '2104', '15343', '197393'))
+        self.assertIsNone(m.extract(self._headers[1]))
+
+    def test_parseBatch(self):
+
+        m = SeqMetadata()
+        columns = m.allocate(4)
+
+        self.assertEqual(m.parseBatch(self._headers, columns, 1), 1)
+
+        np.testing.assert_array_equal(columns['lane'], [-1, 5, -1, 2])
+        np.testing.assert_array_equal(columns['tile'], [-1, 58, -1, 2104])
+        self.assertEqual(columns['y'].dtype, np.int32)
+
+    def test_grow(self):
+
+        m = SeqMetadata(fillValue=0)
+        columns = m.grow(m.allocate(2), 3)
+
+        self.assertEqual(columns['x'].shape, (5, ))
+        np.testing.assert_array_equal(columns['x'], 0)
+
+    def test_regexSplitter(self):
+
+        m = SeqMetadata(splitter=r'len=(?P<length>\d+) gc=(?P<gc>[.\d]+)',
+                        fields=('length', ('gc', np.float32)))
+        columns = m.allocate(2)
+
+        m.parseBatch([">a len=30 gc=0.5", ">b len=12 gc=.25"], columns, 0)
+
+        np.testing.assert_array_equal(columns['length'], [30, 12])
+        np.testing.assert_allclose(columns['gc'], [0.5, 0.25])
+
+        self.assertEqual(
+            SeqMetadata(splitter=r'(?P<b>\d)(?P<a>\d)').names, ('b', 'a'))
+
+    def test_functionSplitter(self):
+
+        m = SeqMetadata(splitter=lambda h: h.split('_')[1:3],
+                        fields=('sample', 'well'))
+        columns = m.allocate(2)
+
+        self.assertEqual(m.parseBatch(['>x_1_2', '>y'], columns, 0), 1)
+
+        np.testing.assert_array_equal(columns['sample'], [1, -1])
+        np.testing.assert_array_equal(columns['well'], [2, -1])
+
+    def test_noFields(self):
+
+        self.assertRaises(ValueError, SeqMetadata, splitter=len)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+
+import unittest
+import threading
+
+from time import sleep
+
+from fseq.reading.seq_queue import SeqQueue
+
+
+class TestSeqQueue(unittest.TestCase):
+
+    def test_fifo(self):
+
+        q = SeqQueue()
+
+        for i in range(5):
+            q.put(i)
+
+        self.assertEqual(len(q), 5)
+        self.assertEqual([q.get() for _ in range(5)], list(range(5)))
+
+    def test_closedEmpty(self):
+
+        q = SeqQueue()
+        q.put('a')
+        q.close()
+
+        self.assertEqual(q.get(), 'a')
+        self.assertIsNone(q.get())
+        self.assertRaises(ValueError, q.put, 'b')
+
+    def test_highWater(self):
+
+        q = SeqQueue()
+        q.put('a', 3, 10)
+        q.put('b', 2, 5)
+        q.get()
+        q.put('c', 1, 1)
+
+        self.assertEqual(q.records, 3)
+        self.assertEqual(q.nBytes, 6)
+        self.assertEqual(q.highWaterRecords, 5)
+        self.assertEqual(q.highWaterBytes, 15)
+
+    def _blocks(self, q, nRecords, nBytes):
+
+        done = []
+        t = threading.Thread(target=lambda: done.append(
+            q.put('x', nRecords, nBytes)))
+        t.start()
+        sleep(0.05)
+        blocked = not done
+        q.get()
+        t.join(1)
+        self.assertTrue(done)
+        return blocked
+
+    def test_recordBackpressure(self):
+
+        q = SeqQueue(maxRecords=4)
+        q.put('a', 3)
+
+        self.assertTrue(self._blocks(q, 2, 0))
+
+    def test_byteBackpressure(self):
+
+        q = SeqQueue(maxBytes=100)
+        q.put('a', 1, 80)
+
+        self.assertTrue(self._blocks(q, 1, 30))
+
+    def test_oversizedIntoEmpty(self):
+
+        q = SeqQueue(maxRecords=1, maxBytes=1)
+        q.put('a', 10, 1000)
+
+        self.assertEqual(q.records, 10)
+
+    def test_join(self):
+
+        q = SeqQueue()
+        q.put('a')
+        q.put('b')
+
+        def work():
+            while q.get() is not None:
+                sleep(0.01)
+                q.taskDone()
+
+        t = threading.Thread(target=work)
+        t.start()
+        q.join()
+
+        self.assertEqual(len(q), 0)
+
+        q.close()
+        t.join(1)
+        self.assertFalse(t.is_alive())
+
+
+if __name__ == '__main__':
+    unittest.main()
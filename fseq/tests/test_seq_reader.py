@@ -24,8 +24,19 @@ encoder is present.
 """
 
 import unittest
+import io
+import os
+import sys
+import shutil
+import tempfile
+import numpy as np
 
-from fseq import SeqReader, SeqEncoder, ReportBuilderBase
+import fseq
+from fseq import SeqReader, SeqEncoder, ReportBuilderBase, SeqStats, \
+    ReportBuilderPositionAverage, \
+    SeqEncoderOneHot, PairMismatch, SeqMetadata, SeqFilter, FormatError, \
+    SeqSampler, SeqJournal, SeqEncoderKmer, SeqEncoderGCWindow
+from fseq.reading.seq_stats import summarize
 
 
 class TestSeqReader(unittest.TestCase):
@@ -238,10 +249,887 @@ class TestSeqReader(unittest.TestCase):
 
         self.assertEqual(list(s.results), [])
 
+    def test_reportRoot(self):
+
+        s = SeqReader()
+        self.assertIsNone(s.reportRoot)
+
+        s = SeqReader(reportRoot='foo')
+        self.assertEqual(s.reportRoot, 'foo')
+
+    def test_addStreams(self):
+
+        stream = io.StringIO()
+        s = SeqReader(dataSourcePaths=['-', stream])
+
+        self.assertEqual(tuple(s.jobQueue), (
+            ('-', 'stdin.reports'), (stream, 'stream.reports')))
+
+        s = SeqReader(dataSourcePaths=stream)
+        self.assertEqual(len(s), 1)
+
     def test_reportDirectory(self):
 
         s = SeqReader()
         self.assertEqual(s.reportDirectory, '')
 
+    def test_queueSettings(self):
+
+        s = SeqReader()
+
+        self.assertEqual(s.batchSize, SeqReader.BATCH_SIZE)
+        self.assertEqual(s.queueDepth, SeqReader.QUEUE_DEPTH)
+        self.assertEqual(s.queueBytes, SeqReader.QUEUE_BYTES)
+
+        s = SeqReader(batchSize=3, queueDepth=0, queueBytes=1000)
+
+        self.assertEqual(s.batchSize, 3)
+        self.assertIsNone(s.queueDepth)
+        self.assertEqual(s.queueBytes, 1000)
+
+    def test_workersBackend(self):
+
+        s = SeqReader()
+        self.assertEqual(s.workers, SeqReader.WORKERS)
+        self.assertEqual(s.backend, 'thread')
+
+        s = SeqReader(workers=3, backend='inline')
+        self.assertEqual(s.workers, 3)
+        self.assertEqual(s.backend, 'inline')
+
+        self.assertRaises(ValueError, SeqReader, backend='gpu')
+
+    def test_stats(self):
+
+        s = SeqReader()
+        self.assertEqual(s.stats, tuple())
+
+        s._stats.append(SeqStats('foo'))
+        self.assertEqual(len(s.stats), 1)
+
+        s.clearStats()
+        self.assertEqual(s.stats, tuple())
+
+
+class TestSeqReaderEncoding(unittest.TestCase):
+
+    def setUp(self):
+
+        self._path = os.path.join(
+            os.path.abspath(os.path.dirname(__file__)), 'data', 'NT.fastq')
+
+    def test_crlf(self):
+
+        directory = tempfile.mkdtemp()
+        path = os.path.join(directory, 'crlf.fastq')
+
+        with open(self._path, 'rb') as fh:
+            data = fh.read()
+        with open(path, 'wb') as fh:
+            fh.write(data.replace(b"\r\n", b"\n").replace(b"\n", b"\r\n"))
+
+        try:
+            for encoder in (fseq.SeqEncoderGC, SeqEncoderKmer,
+                            SeqEncoderOneHot):
+
+                expected = SeqReader(
+                    dataSourcePaths=self._path, seqEncoder=encoder(),
+                    reportBuilders=()).next()
+                res = SeqReader(
+                    dataSourcePaths=path, seqEncoder=encoder(),
+                    reportBuilders=()).next()
+
+                np.testing.assert_array_equal(res, expected)
+        finally:
+            shutil.rmtree(directory)
+
+    def test_boundedQueue(self):
+
+        results = []
+
+        for kwargs in (dict(), dict(batchSize=1, queueDepth=1),
+                       dict(batchSize=3, queueBytes=10)):
+
+            s = SeqReader(dataSourcePaths=self._path, reportBuilders=(),
+                          **kwargs)
+            results.append(s.next())
+
+            self.assertEqual(s.stats[0].counts['records'], 8)
+            self.assertEqual(s.stats[0].counts['lines'], 32)
+
+        for res in results:
+            self.assertEqual(res.shape, (8, 101))
+            np.testing.assert_array_equal(res, results[0])
+
+        np.testing.assert_array_equal(
+            results[0][0, :10], [1, 0, 0, 0, 0, 1, 1, 1, 1, 0])
+
+    def test_backends(self):
+
+        results = []
+
+        for kwargs in (dict(workers=1), dict(backend='inline'),
+                       dict(backend='inline', batchSize=3)):
+
+            s = SeqReader(dataSourcePaths=self._path, reportBuilders=(),
+                          metadataExtractor=SeqMetadata(), **kwargs)
+            s.DATA_INITIAL_SIZE = 5
+            results.append(s.next())
+
+            np.testing.assert_array_equal(s.metadata['tile'], [-1, 58] * 4)
+
+        for res in results:
+            np.testing.assert_array_equal(res, results[0])
+
+    def test_oneHot(self):
+
+        s = SeqReader(seqEncoder=SeqEncoderOneHot(),
+                      dataSourcePaths=self._path, dataWidth=60)
+
+        res = s.next()
+
+        self.assertEqual(res.shape, (8, 60, 4))
+        self.assertEqual(res.dtype, np.uint8)
+        np.testing.assert_array_equal(res[0, :2], [[0, 0, 1, 0], [1, 0, 0, 0]])
+
+    def test_growing(self):
+
+        s = SeqReader(dataSourcePaths=self._path, reportBuilders=(),
+                      batchSize=2)
+        s.DATA_INITIAL_SIZE = 3
+
+        res = s.next()
+
+        self.assertEqual(res.shape, (8, 101))
+        self.assertEqual(s.stats[0].counts['grows'], 2)
+
+    def test_metadata(self):
+
+        s = SeqReader(dataSourcePaths=self._path, reportBuilders=(),
+                      batchSize=3)
+
+        self.assertIsNone(s.metadataExtractor)
+        s.next()
+        self.assertIsNone(s.metadata)
+
+        self.assertRaises(TypeError, setattr, s, 'metadataExtractor', 'tile')
+
+        s = SeqReader(dataSourcePaths=self._path, reportBuilders=(),
+                      batchSize=3, metadataExtractor=SeqMetadata())
+        s.DATA_INITIAL_SIZE = 3
+        res = s.next()
+
+        meta = s.metadata
+        self.assertEqual(sorted(meta), ['lane', 'tile', 'x', 'y'])
+        self.assertEqual(meta['tile'].shape, (res.shape[0], ))
+        np.testing.assert_array_equal(meta['tile'], [-1, 58] * 4)
+        np.testing.assert_array_equal(meta['x'], [-1, 5894] * 4)
+        self.assertEqual(s.stats[0].counts['unparsedHeaders'], 4)
+
+    def test_filter(self):
+
+        self.assertRaises(TypeError, SeqReader, seqFilter=len)
+
+        s = SeqReader(dataSourcePaths=self._path, reportBuilders=(),
+                      batchSize=3, metadataExtractor=SeqMetadata(),
+                      seqFilter=SeqFilter(maxN=0))
+        s.DATA_INITIAL_SIZE = 3
+        res = s.next()
+
+        full = SeqReader(dataSourcePaths=self._path, reportBuilders=(),
+                         batchSize=3).next()
+
+        self.assertEqual(res.shape, (4, 101))
+        np.testing.assert_array_equal(res, full[::2])
+        np.testing.assert_array_equal(s.metadata['tile'], -1)
+
+        stats = s.stats[0]
+        self.assertEqual(stats.counts['records'], 4)
+        self.assertEqual(stats.counts['filtered'], 4)
+        self.assertEqual(stats.filterCounts, {'N': 4})
+
+    def test_filterAll(self):
+
+        s = SeqReader(dataSourcePaths=self._path, reportBuilders=(),
+                      seqFilter=SeqFilter(minLength=1000))
+
+        self.assertEqual(s.next().shape, (0, 101))
+        self.assertEqual(s.stats[0].counts['filtered'], 8)
+
+    def test_sampler(self):
+
+        self.assertRaises(TypeError, SeqReader, sampler=0.5)
+
+        full = SeqReader(dataSourcePaths=self._path, reportBuilders=()).next()
+
+        sampler = SeqSampler(stride=2)
+        s = SeqReader(dataSourcePaths=self._path, reportBuilders=(),
+                      batchSize=3, sampler=sampler)
+        np.testing.assert_array_equal(s.next(), full[::2])
+        self.assertEqual(s.stats[0].counts['skipped'], 4)
+
+        sampler = SeqSampler(fraction=0.5, seed=1)
+        s = SeqReader(dataSourcePaths=self._path, reportBuilders=(),
+                      batchSize=3, sampler=sampler)
+        np.testing.assert_array_equal(
+            s.next(), full[sampler.keep(np.arange(8))])
+
+    def test_samplerMaxReads(self):
+
+        s = SeqReader(dataSourcePaths=self._path, reportBuilders=(),
+                      batchSize=2, sampler=SeqSampler(maxReads=3))
+        res = s.next()
+
+        self.assertEqual(res.shape, (3, 101))
+        self.assertEqual(s.stats[0].counts['records'], 3)
+
+        s = SeqReader(dataSourcePaths=self._path, reportBuilders=(),
+                      sampler=SeqSampler(stride=2, maxReads=3),
+                      seqFilter=SeqFilter(maxN=0))
+
+        self.assertEqual(s.next().shape, (3, 101))
+
+    def test_fileLike(self):
+
+        with open(self._path) as fh:
+            text = fh.read()
+
+        full = SeqReader(dataSourcePaths=self._path, reportBuilders=()).next()
+
+        for stream in (io.StringIO(text), io.BytesIO(text.encode('ascii'))):
+
+            s = SeqReader(dataSourcePaths=stream, reportBuilders=(),
+                          reportRoot='qc')
+            np.testing.assert_array_equal(s.next(), full)
+
+            self.assertFalse(stream.closed)
+            self.assertEqual(s.reportDirectory,
+                             os.path.join('qc', 'stream.reports'))
+            self.assertEqual(s.stats[0].source, 'stream')
+
+    def test_stdin(self):
+
+        with open(self._path) as fh:
+            text = fh.read()
+
+        stdin = sys.stdin
+        sys.stdin = io.StringIO(text)
+
+        try:
+            s = SeqReader(dataSourcePaths='-', reportBuilders=())
+            res = s.next()
+        finally:
+            sys.stdin = stdin
+
+        self.assertEqual(res.shape, (8, 101))
+        self.assertEqual(s.reportDirectory, 'stdin.reports')
+        self.assertEqual(s.stats[0].source, 'stdin')
+
+    def test_filterQuality(self):
+
+        path = os.path.join(os.path.dirname(self._path), 'singlelineProt.fasta')
+        s = SeqReader(dataSourcePaths=path, reportBuilders=(),
+                      seqFilter=SeqFilter(minMeanQuality=20))
+
+        self.assertRaises(FormatError, s.next)
+
+    def test_planWithoutBudget(self):
+
+        s = SeqReader(dataSourcePaths=self._path, reportBuilders=())
+        plan = s.plan()
+
+        self.assertEqual(plan['storage'], 'memory')
+        self.assertEqual(plan['batchSize'], SeqReader.BATCH_SIZE)
+        self.assertEqual(plan['rowBytes'], 101 * 2)
+        self.assertEqual(plan['estimatedRows'], 8 + 1)
+        self.assertIsNone(plan['filesAtOnce'])
+
+        self.assertRaises(ValueError, SeqReader, maxMemory=0)
+
+    def test_planEstimatedRows(self):
+
+        directory = tempfile.mkdtemp()
+
+        try:
+            fasta = os.path.join(directory, 'reads.fasta')
+            with open(fasta, 'w') as fh:
+                fh.write("".join(">read{0:02d} length=20\n{1}\n".format(
+                    i, "ACGT" * 5) for i in range(50)))
+
+            multiline = os.path.join(directory, 'multiline.fasta')
+            with open(multiline, 'w') as fh:
+                fh.write("".join(">read{0}\n{1}\n{2}\n".format(
+                    i, "ACGT" * 5, "AC" * (i % 5 + 1)) for i in range(50)))
+
+            s = SeqReader(dataSourcePaths=fasta, reportBuilders=())
+            s.PLAN_SAMPLE_RECORDS = 10
+
+            self.assertEqual(s.plan()['estimatedRows'], 50 + 1)
+            self.assertEqual(s.plan(multiline)['estimatedRows'],
+                             os.path.getsize(multiline) // 102 + 1)
+        finally:
+            shutil.rmtree(directory)
+
+    def test_planMemory(self):
+
+        s = SeqReader(dataSourcePaths=self._path, reportBuilders=(),
+                      maxMemory=2 ** 30)
+        plan = s.plan()
+
+        self.assertEqual(plan['storage'], 'memory')
+        self.assertEqual(plan['initialRows'], plan['estimatedRows'])
+        self.assertLessEqual(plan['estimatedBytes'], 2 ** 30)
+        self.assertGreater(plan['filesAtOnce'], 1)
+
+        res = s.next()
+
+        self.assertNotIsInstance(res, np.memmap)
+        self.assertEqual(res.shape, (8, 101))
+
+    def test_planMemmap(self):
+
+        expected = SeqReader(dataSourcePaths=self._path,
+                             reportBuilders=()).next()
+        directory = tempfile.mkdtemp()
+
+        try:
+            s = SeqReader(dataSourcePaths=self._path, reportBuilders=(),
+                          maxMemory=2000, memmapDirectory=directory)
+            plan = s.plan()
+
+            self.assertEqual(plan['storage'], 'memmap')
+            self.assertEqual(plan['batchSize'], 1)
+            self.assertEqual(plan['filesAtOnce'], 1)
+
+            res = s.next()
+
+            self.assertIsInstance(res, np.memmap)
+            np.testing.assert_array_equal(res, expected)
+            self.assertLessEqual(s.stats[0].counts['queueHighWater'],
+                                 plan['queueDepth'])
+        finally:
+            shutil.rmtree(directory)
+
+    def test_planMemmapGrowing(self):
+
+        expected = SeqReader(dataSourcePaths=self._path,
+                             reportBuilders=()).next()
+
+        with open(self._path) as fh:
+            s = SeqReader(dataSourcePaths=io.StringIO(fh.read()),
+                          reportBuilders=(), maxMemory=2000,
+                          metadataExtractor=SeqMetadata())
+
+        s.DATA_INITIAL_SIZE = 3
+
+        self.assertIsNone(s.plan()['estimatedRows'])
+
+        res = s.next()
+
+        self.assertIsInstance(res, np.memmap)
+        np.testing.assert_array_equal(res, expected)
+        self.assertEqual(s.stats[0].counts['grows'], 2)
+        np.testing.assert_array_equal(s.metadata['tile'], [-1, 58] * 4)
+
+    def test_shards(self):
+
+        expected = SeqReader(dataSourcePaths=self._path,
+                             reportBuilders=()).next()
+
+        s = SeqReader(dataSourcePaths=self._path, reportBuilders=(),
+                      shards=3)
+        s.SHARD_MIN_BYTES = 1
+
+        res = s.next()
+
+        self.assertIsInstance(res, np.memmap)
+        np.testing.assert_array_equal(res, expected)
+        self.assertEqual(s.stats[0].counts['records'], expected.shape[0])
+
+    def test_shardsSmallFile(self):
+
+        s = SeqReader(dataSourcePaths=self._path, reportBuilders=(),
+                      shards=3)
+
+        self.assertNotIsInstance(s.next(), np.memmap)
+
+    def test_shardsFiltering(self):
+
+        s = SeqReader(dataSourcePaths=self._path, reportBuilders=(),
+                      shards=3, seqFilter=SeqFilter(minLength=10))
+        s.SHARD_MIN_BYTES = 1
+
+        self.assertRaises(ValueError, s.next)
+        self.assertRaises(ValueError, setattr, s, 'shards', 0)
+
+
+class TestSeqReaderPaired(unittest.TestCase):
+
+    def setUp(self):
+
+        self._path = os.path.join(
+            os.path.abspath(os.path.dirname(__file__)), 'data', 'NT.fastq')
+
+        self._dir = tempfile.mkdtemp()
+
+        with open(self._path) as fh:
+            self._lines = fh.read().splitlines()
+
+    def tearDown(self):
+
+        shutil.rmtree(self._dir)
+
+    def _writeMate(self, name, lines):
+
+        path = os.path.join(self._dir, name)
+        with open(path, 'w') as fh:
+            fh.write("\n".join(lines) + "\n")
+
+        return path
+
+    def _mate2(self):
+
+        lines = []
+        for i, line in enumerate(self._lines):
+            if i % 4 == 0:
+                line = line.replace('/1', '/2')
+            elif i % 4 == 1:
+                line = line[::-1]
+            lines.append(line)
+
+        return lines
+
+    def test_pairId(self):
+
+        self.assertEqual(SeqReader.pairId("@HWI:5:58#ATC/1"), "HWI:5:58#ATC")
+        self.assertEqual(SeqReader.pairId("@HWI:5:58#ATC/2"), "HWI:5:58#ATC")
+        self.assertEqual(SeqReader.pairId("@EAS:136:FC7 1:Y:18:ATCACG"),
+                         "EAS:136:FC7")
+        self.assertEqual(SeqReader.pairId("@SRR001666.1 length=36"),
+                         "SRR001666.1")
+        self.assertEqual(SeqReader.pairId("@"), "")
+
+    def test_addPairedData(self):
+
+        s = SeqReader()
+        s.addPairedData('foo/bar_1.fastq', 'foo/bar_2.fastq')
+
+        self.assertEqual(len(s), 1)
+        self.assertEqual(tuple(s.jobQueue)[0], (
+            ('foo/bar_1.fastq', 'foo/bar_2.fastq'),
+            'bar_1.fastq.paired.reports'))
+
+        self.assertRaises(ValueError, s.addPairedData, ('a', 'b'), ('c', ))
+
+    def test_paired(self):
+
+        p1 = self._writeMate('bar_1.fastq', self._lines)
+        p2 = self._writeMate('bar_2.fastq', self._mate2())
+
+        single = SeqReader(dataSourcePaths=(p1, p2), reportBuilders=(),
+                           batchSize=3)
+        expected = list(single)
+
+        s = SeqReader(reportBuilders=(), batchSize=3)
+        s.addPairedData(p1, p2)
+        res = s.next()
+
+        self.assertEqual(res.shape, (8, 2, 101))
+        np.testing.assert_array_equal(res[:, 0], expected[0])
+        np.testing.assert_array_equal(res[:, 1], expected[1])
+
+        self.assertEqual(s.stats[0].counts['records'], 8)
+        self.assertEqual(s.stats[0].counts['lines'], 64)
+        self.assertEqual(s.reportDirectory,
+                         os.path.join(self._dir, 'bar_1.fastq.paired.reports'))
+
+    def test_pairedOneHot(self):
+
+        p1 = self._writeMate('bar_1.fastq', self._lines)
+        p2 = self._writeMate('bar_2.fastq', self._mate2())
+
+        s = SeqReader(seqEncoder=SeqEncoderOneHot(), reportBuilders=(),
+                      dataWidth=60)
+        s.addPairedData(p1, p2)
+        res = s.next()
+
+        self.assertEqual(res.shape, (8, 2, 60, 4))
+        np.testing.assert_array_equal(res[0, 0, :2], [[0, 0, 1, 0],
+                                                      [1, 0, 0, 0]])
+
+    def test_longKmerDataType(self):
+
+        e = SeqEncoderKmer(k=6)
+        seq = e.kmers[-1] + e.kmers[1234]
+        path = self._writeMate('kmer.fastq', sum(
+            (["@r{0}".format(i), seq, "+", "I" * len(seq)]
+             for i in range(8)), []))
+
+        s = SeqReader(dataSourcePaths=path, seqEncoder=e, reportBuilders=(),
+                      dataWidth=12)
+        res = s.next()
+
+        self.assertEqual(res.dtype, np.float32)
+        np.testing.assert_array_equal(res[1], e.encode(seq))
+
+    def test_pairIdMismatch(self):
+
+        mate2 = self._mate2()
+        mate2[16] = "@OTHER/2"
+
+        p1 = self._writeMate('bar_1.fastq', self._lines)
+        p2 = self._writeMate('bar_2.fastq', mate2)
+
+        s = SeqReader(reportBuilders=())
+        s.addPairedData(p1, p2)
+
+        self.assertRaises(PairMismatch, s.next)
+
+    def test_pairLengthMismatch(self):
+
+        p1 = self._writeMate('bar_1.fastq', self._lines)
+        p2 = self._writeMate('bar_2.fastq', self._mate2()[:-4])
+
+        s = SeqReader(reportBuilders=())
+        s.addPairedData(p1, p2)
+
+        self.assertRaises(PairMismatch, s.next)
+
+
+class CountingBuilder(ReportBuilderBase):
+
+    def __init__(self):
+
+        super(CountingBuilder, self).__init__()
+        self.shapes = []
+        self.option = 1
+
+    @property
+    def parameters(self):
+
+        p = super(CountingBuilder, self).parameters
+        p.update(option=self.option)
+        return p
+
+    def distill(self, data, *args, **kwargs):
+
+        self.shapes.append(data.shape)
+        return self
+
+
+class TestSeqReaderJournal(unittest.TestCase):
+
+    def setUp(self):
+
+        self._path = os.path.join(
+            os.path.abspath(os.path.dirname(__file__)), 'data', 'NT.fastq')
+
+        self._dir = tempfile.mkdtemp()
+        self._journalPath = os.path.join(self._dir, 'run.journal')
+
+    def tearDown(self):
+
+        shutil.rmtree(self._dir)
+
+    def test_badJournal(self):
+
+        self.assertRaises(TypeError, SeqReader, journal=self._journalPath)
+
+    def test_resume(self):
+
+        b1 = CountingBuilder()
+        SeqReader(dataSourcePaths=self._path, reportBuilders=b1,
+                  journal=SeqJournal(self._journalPath)).run()
+
+        self.assertEqual(b1.shapes, [(8, 101)])
+
+        journal = SeqJournal(self._journalPath)
+        self.assertEqual(journal.sources, (self._path, ))
+
+        #First builder already done, only second is run on cached encoding
+        b2 = CountingBuilder()
+        s = SeqReader(dataSourcePaths=self._path, reportBuilders=(b1, b2),
+                      journal=journal)
+        s.run()
+
+        self.assertEqual(b1.shapes, [(8, 101)])
+        self.assertEqual(b2.shapes, [(8, 101)])
+        self.assertEqual(s.stats[0].counts['lines'], 0)
+        self.assertEqual(s.stats[0].counts['records'], 8)
+
+        #Everything done, source is skipped
+        s = SeqReader(dataSourcePaths=self._path, reportBuilders=(b1, b2),
+                      journal=SeqJournal(self._journalPath))
+        s.run()
+
+        self.assertEqual(len(b1.shapes), 1)
+        self.assertEqual(len(b2.shapes), 1)
+        self.assertEqual(s.stats, ())
+
+    def test_settingsChanged(self):
+
+        journal = SeqJournal(self._journalPath)
+        SeqReader(dataSourcePaths=self._path, reportBuilders=(),
+                  journal=journal).next()
+
+        s = SeqReader(dataSourcePaths=self._path, reportBuilders=(),
+                      journal=journal, dataWidth=50)
+
+        self.assertEqual(s.next().shape, (8, 50))
+        self.assertEqual(s.stats[0].counts['lines'], 32)
+
+    def test_builderSettingsChanged(self):
+
+        b = CountingBuilder()
+
+        def run(reportRoot):
+            SeqReader(dataSourcePaths=self._path, reportBuilders=b,
+                      reportRoot=reportRoot,
+                      journal=SeqJournal(self._journalPath)).run()
+            return len(b.shapes)
+
+        first = os.path.join(self._dir, 'first')
+        second = os.path.join(self._dir, 'second')
+
+        self.assertEqual(run(first), 1)
+        self.assertEqual(run(first), 1)
+
+        b.option = 2
+        self.assertEqual(run(first), 2)
+        self.assertEqual(run(first), 2)
+
+        b.saveData = True
+        self.assertEqual(run(first), 3)
+
+        self.assertEqual(run(second), 4)
+        self.assertEqual(run(second), 4)
+
+    def _linesRead(self, path, **kwargs):
+
+        s = SeqReader(dataSourcePaths=path, reportBuilders=(),
+                      journal=SeqJournal(self._journalPath), **kwargs)
+        s.next()
+
+        return s.stats[0].counts['lines']
+
+    def test_settingsInvalidate(self):
+
+        path = os.path.join(self._dir, 'NT.fastq')
+        shutil.copy(self._path, path)
+
+        runs = (
+            dict(seqEncoder=SeqEncoderKmer(k=2), dataType=np.float32),
+            dict(seqEncoder=SeqEncoderKmer(k=3), dataType=np.float32),
+            dict(seqEncoder=SeqEncoderGCWindow(window=10, stride=5)),
+            dict(seqEncoder=SeqEncoderGCWindow(window=20, stride=5)),
+            dict(seqFilter=SeqFilter(minLength=10)),
+            dict(seqFilter=SeqFilter(minLength=20)),
+            dict(sampler=SeqSampler(maxReads=4)),
+            dict(sampler=SeqSampler(maxReads=5)))
+
+        for kwargs in runs:
+
+            self.assertGreater(self._linesRead(path, **kwargs), 0)
+            self.assertEqual(self._linesRead(path, **kwargs), 0)
+
+        #Edited source, same size and settings
+        with open(path) as fh:
+            lines = fh.readlines()
+        with open(path, 'w') as fh:
+            fh.writelines(lines[4:] + lines[:4])
+        stat = os.stat(path)
+        os.utime(path, (stat.st_atime, stat.st_mtime + 10))
+
+        self.assertEqual(self._linesRead(path, **runs[-1]), 32)
+
+    def test_streamsNotJournaled(self):
+
+        with open(self._path) as fh:
+            stream = io.StringIO(fh.read())
+
+        journal = SeqJournal(self._journalPath)
+        SeqReader(dataSourcePaths=stream, reportBuilders=(),
+                  journal=journal).next()
+
+        self.assertEqual(journal.sources, ())
+
+
+class CollectingReport(object):
+
+    def __init__(self):
+
+        self.calls = []
+
+    def distill(self, data, *args, **kwargs):
+
+        self.calls.append((kwargs['outputRoot'], kwargs['outputNamePrefix'],
+                           np.asarray(data), kwargs.get('labels')))
+
+
+class TestSeqReaderRunReports(unittest.TestCase):
+
+    def setUp(self):
+
+        path = os.path.join(
+            os.path.abspath(os.path.dirname(__file__)), 'data', 'NT.fastq')
+
+        self._dir = tempfile.mkdtemp()
+        self._paths = [os.path.join(self._dir, name) for name in
+                       ('b.fastq', 'a.fastq')]
+        for p in self._paths:
+            shutil.copy(path, p)
+
+    def tearDown(self):
+
+        shutil.rmtree(self._dir)
+
+    def _runReports(self, report):
+
+        return [call for call in report.calls
+                if call[0] == os.path.join(self._dir, SeqReader.RUN_TARGET)]
+
+    def test_runReports(self):
+
+        report = CollectingReport()
+        s = SeqReader(dataSourcePaths=self._paths, reportRoot=self._dir,
+                      reportBuilders=ReportBuilderPositionAverage(report))
+        s.run()
+        single = SeqReader(dataSourcePaths=self._paths[0]).next()
+
+        statistics = s.reportStatistics['0:ReportBuilderPositionAverage']
+
+        self.assertEqual(len(statistics), 2)
+        self.assertEqual(statistics[0][1].count, 8)
+
+        runReports = dict((call[1], call) for call in
+                          self._runReports(report))
+
+        self.assertEqual(set(runReports), {
+            'average.total.', 'average.lacking.', 'average.not-lacking.',
+            'average.total.overlay.'})
+        np.testing.assert_allclose(
+            runReports['average.total.'][2],
+            single.astype(np.float64).mean(axis=0), rtol=1e-6)
+        self.assertEqual(runReports['average.total.overlay.'][2].shape,
+                         (101, 2))
+        self.assertEqual(runReports['average.total.overlay.'][3],
+                         ['a.fastq', 'b.fastq'])
+
+        s.clearStats()
+        self.assertEqual(s.reportStatistics, {})
+
+    def test_singleSource(self):
+
+        report = CollectingReport()
+        SeqReader(dataSourcePaths=self._paths[0], reportRoot=self._dir,
+                  reportBuilders=ReportBuilderPositionAverage(report)).run()
+
+        self.assertEqual(self._runReports(report), [])
+
+    def test_journaledStatistics(self):
+
+        journalPath = os.path.join(self._dir, 'run.journal')
+
+        SeqReader(dataSourcePaths=self._paths[0], reportRoot=self._dir,
+                  reportBuilders=ReportBuilderPositionAverage(
+                      CollectingReport()),
+                  journal=SeqJournal(journalPath)).run()
+
+        report = CollectingReport()
+        s = SeqReader(dataSourcePaths=self._paths, reportRoot=self._dir,
+                      reportBuilders=ReportBuilderPositionAverage(report),
+                      journal=SeqJournal(journalPath))
+        s.run()
+
+        self.assertEqual(len(s.stats), 1)
+        self.assertEqual(
+            len(s.reportStatistics['0:ReportBuilderPositionAverage']), 2)
+        self.assertEqual(len(self._runReports(report)), 4)
+
+
+class TestSeqStats(unittest.TestCase):
+
+    def test_empty(self):
+
+        s = SeqStats('foo')
+
+        self.assertEqual(s.source, 'foo')
+        self.assertEqual(set(s.timings), set(SeqStats.TIMINGS))
+        self.assertEqual(set(s.counts), set(SeqStats.COUNTS))
+        self.assertIsNone(s.readsPerSecond)
+        self.assertIsNone(s.MBps)
+
+    def test_accumulate(self):
+
+        s = SeqStats('foo')
+
+        s.addTiming('encoding', 1.5).addTiming('encoding', 0.5)
+        s.addReportTiming('builder', 2).addReportTiming('builder', 1)
+        s.timings['total'] = 2.0
+        s.counts.update(records=100, bytes=4e6)
+
+        self.assertEqual(s.timings['encoding'], 2.0)
+        self.assertEqual(s.reportTimings, {'builder': 3})
+        self.assertEqual(s.readsPerSecond, 50)
+        self.assertEqual(s.MBps, 2)
+
+    def test_asDict(self):
+
+        d = SeqStats('foo').complete().asDict()
+
+        self.assertEqual(d['source'], 'foo')
+        self.assertIn('peakMemory', d)
+        self.assertEqual(set(d['timings']), set(SeqStats.TIMINGS))
+
+    def test_summarize(self):
+
+        a = SeqStats('a')
+        a.timings['total'] = 1.0
+        a.counts.update(records=100, bytes=1e6, queueHighWater=5)
+        a.addReportTiming('builder', 2)
+        a.filterCounts.update(N=4, quality=2)
+
+        b = SeqStats('b').complete()
+        b.timings['total'] = 3.0
+        b.counts.update(records=300, bytes=3e6, queueHighWater=3)
+        b.addReportTiming('builder', 1)
+        b.filterCounts.update(N=1, length=7)
+
+        summary = summarize([a, b.asDict()])
+        total = summary['total']
+
+        self.assertEqual([s['source'] for s in summary['sources']],
+                         ['a', 'b'])
+        self.assertEqual(total['sources'], 2)
+        self.assertEqual(total['wallTime'], 4.0)
+        self.assertEqual(total['counts']['records'], 400)
+        self.assertEqual(total['counts']['queueHighWater'], 5)
+        self.assertEqual(total['reportTimings'], {'builder': 3})
+        self.assertEqual(total['filterCounts'],
+                         {'N': 5, 'quality': 2, 'length': 7})
+        self.assertEqual(total['readsPerSecond'], 100)
+        self.assertEqual(total['MBps'], 1)
+        self.assertIsNotNone(total['peakMemory'])
+
+        self.assertEqual(summarize([a], wallTime=2)['total']['readsPerSecond'],
+                         50)
+
+    def test_readerSummary(self):
+
+        path = os.path.join(
+            os.path.abspath(os.path.dirname(__file__)), 'data', 'NT.fastq')
+
+        s = SeqReader(dataSourcePaths=[path, path], popEncodingResults=True,
+                      reportBuilders=CountingBuilder())
+        s.run()
+
+        summary = s.summary()
+
+        self.assertEqual(len(summary['sources']), 2)
+        self.assertEqual(summary['total']['counts']['records'], 16)
+        self.assertGreaterEqual(summary['total']['wallTime'],
+                                summary['total']['timings']['total'])
+        self.assertIn('CountingBuilder', summary['total']['reportTimings'])
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,183 @@
+#!/usr/bin/env python
+
+import unittest
+import os
+import shutil
+import threading
+import tempfile
+
+from time import sleep, time
+
+from fseq.bench import SyntheticSeqs
+from fseq.server import SeqServer, SeqClient, jobReader, runJob
+
+
+class TestJobs(unittest.TestCase):
+
+    def setUp(self):
+
+        self._dir = tempfile.mkdtemp()
+        self._path = os.path.join(self._dir, 's.fastq')
+        SyntheticSeqs(reads=50, length=40).writeFastq(self._path)
+
+    def tearDown(self):
+
+        shutil.rmtree(self._dir)
+
+    def test_jobReader(self):
+
+        reader = jobReader(dict(
+            files=[self._path], encoder='kmer', builders=['kmer', 'fft'],
+            builderOptions=dict(fft=dict(sampleSize=10)), width='auto',
+            dtype='float32'))
+
+        builders = list(reader.reportBuilders)
+
+        self.assertEqual(reader.dataWidth, 40)
+        self.assertEqual([type(rb).__name__ for rb in builders],
+                         ['ReportBuilderKmer', 'ReportBuilderFFT'])
+        self.assertEqual(builders[1].sampleSize, 10)
+        self.assertEqual(builders[0].k, 2)
+
+        self.assertRaises(ValueError, jobReader, dict(
+            files=[self._path], encoder='gc', builders=['kmer']))
+
+    def test_defaultBuildersOptions(self):
+
+        reader = jobReader(dict(
+            files=[self._path], builderOptions=dict(
+                fft=dict(sampleSize=10, saveData=True),
+                kmer=dict(saveData=True))))
+
+        builders = dict((type(rb).__name__, rb)
+                        for rb in reader.reportBuilders)
+
+        self.assertEqual(builders['ReportBuilderFFT'].sampleSize, 10)
+        self.assertTrue(builders['ReportBuilderFFT'].saveData)
+        self.assertNotIn('ReportBuilderKmer', builders)
+
+    def test_defaultBuildersPartial(self):
+
+        reader = jobReader(dict(
+            files=[self._path], encoder='kmer', builderOptions=dict(
+                kmer=dict(saveData=True))))
+
+        builders = list(reader.reportBuilders)
+
+        self.assertEqual([type(rb).__name__ for rb in builders],
+                         ['ReportBuilderKmer'])
+        self.assertEqual(builders[0].k, 2)
+        self.assertTrue(builders[0].saveData)
+
+    def test_badJobs(self):
+
+        self.assertRaises(ValueError, jobReader, dict(files=[]))
+        self.assertRaises(ValueError, jobReader,
+                          dict(files=[self._path], encoder='nope'))
+        self.assertRaises(ValueError, jobReader,
+                          dict(files=[self._path], builders=['nope']))
+        self.assertRaises(ValueError, jobReader,
+                          dict(files=[self._path], colour='blue'))
+
+    def test_runJob(self):
+
+        summary = runJob(dict(files=[self._path], builders=[],
+                              outputDir=self._dir))
+
+        self.assertEqual(summary['total']['counts']['records'], 50)
+
+
+class TestSeqServer(unittest.TestCase):
+
+    def setUp(self):
+
+        self._dir = tempfile.mkdtemp()
+        self._socket = os.path.join(self._dir, 'fseq.sock')
+        self._path = os.path.join(self._dir, 's.fastq')
+        SyntheticSeqs(reads=50, length=40).writeFastq(self._path)
+        self._server = SeqServer(self._socket, maxJobs=2).start()
+
+    def tearDown(self):
+
+        self._server.shutdown()
+        shutil.rmtree(self._dir)
+
+    def test_ping(self):
+
+        res = SeqClient(self._socket).ping()
+
+        self.assertTrue(res['ok'])
+        self.assertEqual(res['pid'], os.getpid())
+        self.assertEqual(res['maxJobs'], 2)
+
+    def test_submit(self):
+
+        client = SeqClient(self._socket)
+
+        for i in range(3):
+            summary = client.submit(dict(files=[self._path], builders=[],
+                                         outputDir=self._dir))
+            self.assertEqual(summary['total']['counts']['records'], 50)
+
+        self.assertEqual(self._server.jobs, 3)
+
+    def test_concurrentReports(self):
+
+        client = SeqClient(self._socket)
+        summaries = []
+
+        def submit(i):
+            summaries.append(client.submit(dict(
+                files=[self._path], builders=['average', 'fft'],
+                outputDir=os.path.join(self._dir, str(i)))))
+
+        threads = [threading.Thread(target=submit, args=(i, ))
+                   for i in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(len(summaries), 4)
+        for i in range(4):
+            self.assertTrue(os.path.isfile(os.path.join(
+                self._dir, str(i), 's.fastq.reports',
+                'average.lacking.line.pdf')))
+
+    def test_failedJob(self):
+
+        client = SeqClient(self._socket)
+
+        self.assertRaises(ValueError, client.submit,
+                          dict(files=[self._path], encoder='nope'))
+        self.assertRaises(ValueError, client.submit, dict(files=['-']))
+        self.assertFalse(client.request(dict(colour='blue'))['ok'])
+        self.assertTrue(client.ping()['ok'])
+
+    def test_occupied(self):
+
+        self.assertRaises(ValueError, SeqServer(self._socket).start)
+
+    def test_shutdown(self):
+
+        SeqClient(self._socket).shutdown()
+
+        tStart = time()
+        while self._server.serving and time() - tStart < 5:
+            sleep(0.01)
+
+        self.assertFalse(self._server.serving)
+        self.assertFalse(os.path.exists(self._socket))
+
+    def test_staleSocket(self):
+
+        self._server.shutdown()
+        open(self._socket, 'w').close()
+
+        self._server = SeqServer(self._socket).start()
+
+        self.assertTrue(SeqClient(self._socket).ping()['ok'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+
+import unittest
+import os
+import shutil
+import tempfile
+
+from fseq.reading.seq_shards import SeqShard, recordStart, shardRanges, \
+    countRecords
+
+
+class TestSeqShards(unittest.TestCase):
+
+    def setUp(self):
+
+        self._dir = tempfile.mkdtemp()
+        self._fastq = os.path.join(self._dir, 'r.fastq')
+        self._fasta = os.path.join(self._dir, 'r.fasta')
+
+        #Quality lines starting with '@' look like headers
+        with open(self._fastq, 'w') as fh:
+            for i in range(20):
+                fh.write("@r{0}\nACGTA\n+\n@@@{1}\n".format(i, 'I' * 2))
+
+        with open(self._fasta, 'w') as fh:
+            for i in range(20):
+                fh.write(">r{0}\nACGTA\n".format(i))
+
+    def tearDown(self):
+
+        shutil.rmtree(self._dir)
+
+    def _records(self, path, start, end):
+
+        shard = SeqShard(path, start, end)
+        lines = []
+        while True:
+            line = shard.readline()
+            if not line:
+                break
+            lines.append(line)
+        shard.close()
+
+        return lines
+
+    def test_recordStart(self):
+
+        with open(self._fastq, 'rb') as fh:
+
+            record = len(fh.readline() + fh.readline() + fh.readline() +
+                         fh.readline())
+
+            for offset in range(1, 3 * record):
+                start = recordStart(fh, offset)
+                fh.seek(start)
+                self.assertEqual(start % record, 0)
+                self.assertGreaterEqual(start, offset)
+                self.assertTrue(fh.readline().startswith(b'@r'))
+
+            self.assertEqual(recordStart(fh, 0), 0)
+
+        self.assertRaises(ValueError, recordStart, None, 10, 3)
+
+    def test_shardRanges(self):
+
+        for path, itemSize in ((self._fastq, 4), (self._fasta, 2)):
+
+            ranges = shardRanges(path, 3, itemSize)
+
+            self.assertEqual(len(ranges), 3)
+            self.assertEqual(ranges[0][0], 0)
+            self.assertEqual(ranges[-1][1], os.path.getsize(path))
+            self.assertEqual([r[1] for r in ranges[:-1]],
+                             [r[0] for r in ranges[1:]])
+
+            lines = sum((self._records(path, *r) for r in ranges), [])
+            with open(path, 'rb') as fh:
+                self.assertEqual(lines, fh.readlines())
+
+            self.assertEqual(
+                sum(countRecords(path, s, e, itemSize) for s, e in ranges),
+                20)
+
+    def test_shardRangesSmall(self):
+
+        ranges = shardRanges(self._fastq, 200)
+
+        self.assertEqual(len(ranges), 20)
+        self.assertRaises(ValueError, shardRanges, self._fastq, 0)
+
+    def test_countRecordsNoLineBreak(self):
+
+        with open(self._fasta, 'a') as fh:
+            fh.write(">last\nACGT")
+
+        size = os.path.getsize(self._fasta)
+
+        self.assertEqual(countRecords(self._fasta, 0, size, 2, chunkSize=7),
+                         21)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -31,7 +31,8 @@ Reporting
     author='Martin Zackrisson',
     author_email='martin.zackrisson@gu.se',
     url='https://gitorious.org/fseq',
-    packages=['fseq', 'fseq.reading', 'fseq.reporting'],
+    packages=['fseq', 'fseq.reading', 'fseq.reporting', 'fseq.bench',
+              'fseq.server'],
     licence='MIT',
     scripts=[os.path.join("scripts", p) for p in ("fseq",)],
     requires=['numpy', 'scipy', 'matplotlib'],